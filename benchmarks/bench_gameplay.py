@@ -0,0 +1,200 @@
+"""Microbenchmarks for the gameplay hot paths at scaled entity counts.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_gameplay                 # compare with baseline
+    python -m benchmarks.bench_gameplay --update-baseline
+
+Every case runs against synthetic GameState populations of 10 to 100k
+objects and reports per-call latency percentiles in microseconds. The
+state is restored between calls (outside the timed region), so each call
+sees the same population. Results are compared with
+``benchmarks/baseline.json``. A case whose p50 is slower than the
+baseline by more than ``--threshold`` is flagged, and the exit status is
+1, so the suite can gate CI.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import time
+from typing import Callable, Dict, List, Tuple
+
+import numpy as np
+
+from spacegame import gameplay
+from spacegame.constants import COLS, KIND_ASTEROID, KIND_COLLECTOR_STAR, KIND_ENEMY, KIND_PICKUP, SIM_DT
+from spacegame.state import GameState
+
+SIZES = (10, 100, 1_000, 10_000, 100_000)
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), 'baseline.json')
+PERCENTILES = (50, 95, 99)
+# Objetos por linha a cada 100 unidades de z (perto do que o Hard produz)
+DENSITY = 5.0
+SHOTS = 16
+
+
+def _depth(n: int) -> float:
+    return max(100.0, n / (COLS * DENSITY) * 100.0)
+
+
+def _populate(state: GameState, n: int, kinds: Tuple[int, ...], z_max: float) -> None:
+    rng = random.Random(n)
+    stars = state.objects.stars
+    depth = _depth(n)
+    for _ in range(n):
+        kind = rng.choice(kinds)
+        stars.append(rng.randrange(COLS) + rng.uniform(-0.2, 0.2), 0, rng.uniform(z_max - depth, z_max),
+                     kind, rng.uniform(0.3, 1.0), (0.5, 0.45, 0.35), 0 if kind == KIND_PICKUP else 1,
+                     rng.uniform(0, 360), rng.uniform(-70, 70))
+    state.objects.lane_index.rebuild(stars)
+
+
+class _Snapshot:
+    """Copy of the mutable parts of a state, restored between timed calls."""
+
+    def __init__(self, state: GameState) -> None:
+        stars = state.objects.stars
+        self.count = stars.count
+        self.arrays = [a.copy() for a in stars._arrays()]
+        self.shots = [list(s) for s in state.objects.shots]
+        self.scalars = (state.score, state.missed_stars, state.player.shield_time,
+                        state.effects.global_slow_time, state.player.shot_charge)
+
+    def restore(self, state: GameState) -> None:
+        stars = state.objects.stars
+        for dst, src in zip(stars._arrays(), self.arrays):
+            dst[:len(src)] = src
+        stars.count = self.count
+        stars.version += 1
+        state.objects.shots.clear()
+        for shot in self.shots:
+            state.objects.shots.acquire(*shot)
+        state.objects.explosions.clear()
+        (state.score, state.missed_stars, state.player.shield_time,
+         state.effects.global_slow_time, state.player.shot_charge) = self.scalars
+        state.objects.lane_index.rebuild(stars)
+
+
+def _survival_state(n: int) -> GameState:
+    state = GameState()
+    state.reset(seed=n)
+    # Jogador fora das linhas: mede o passo sem encerrar o jogo
+    state.player.x = -50.0
+    _populate(state, n, (KIND_ASTEROID, KIND_ASTEROID, KIND_ENEMY, KIND_PICKUP), z_max=-1.0)
+    return state
+
+
+def _collector_state(n: int) -> GameState:
+    state = GameState()
+    state.reset(seed=n)
+    state.player.x = -50.0
+    _populate(state, n, (KIND_COLLECTOR_STAR,), z_max=-1.0)
+    return state
+
+
+def _shots_state(n: int) -> GameState:
+    state = _survival_state(n)
+    rng = random.Random(n + 1)
+    for _ in range(SHOTS):
+        z = rng.uniform(-70.0, 0.0)
+        state.objects.shots.acquire(float(rng.randrange(COLS)), 0, z, z)
+    return state
+
+
+def _resolve_spacing_call(state: GameState) -> None:
+    rng = state.rng.spawn
+    gameplay._resolve_spacing(state, rng.randrange(COLS) + rng.uniform(-0.2, 0.2), rng.uniform(-110.0, -40.0))
+
+
+# nome -> (monta o estado, chamada medida)
+CASES: Dict[str, Tuple[Callable[[int], GameState], Callable[[GameState], object]]] = {
+    'spawn_stars': (_survival_state, lambda s: gameplay.spawn_stars(s, 'Hard')),
+    'spawn_collector_stars': (_collector_state, lambda s: gameplay.spawn_collector_stars(s, 'Hard')),
+    'update_stars': (_survival_state, lambda s: gameplay.update_stars(s, 'Hard', SIM_DT)),
+    'update_collector_stars': (_collector_state, lambda s: gameplay.update_collector_stars(s, 'Hard', SIM_DT)),
+    'update_shots': (_shots_state, lambda s: gameplay.update_shots(s, SIM_DT)),
+    '_resolve_spacing': (_survival_state, _resolve_spacing_call),
+}
+
+
+def _repeats(n: int) -> int:
+    return max(20, min(400, 400_000 // n))
+
+
+def measure(case: str, n: int) -> Dict[str, float]:
+    setup, call = CASES[case]
+    state = setup(n)
+    snapshot = _Snapshot(state)
+    samples: List[float] = []
+    for _ in range(_repeats(n)):
+        start = time.perf_counter()
+        call(state)
+        samples.append((time.perf_counter() - start) * 1e6)
+        snapshot.restore(state)
+    return {f"p{p}": round(float(v), 2) for p, v in zip(PERCENTILES, np.percentile(samples, PERCENTILES))}
+
+
+def run(cases: List[str], sizes: List[int]) -> Dict[str, Dict[str, Dict[str, float]]]:
+    results: Dict[str, Dict[str, Dict[str, float]]] = {}
+    for case in cases:
+        for n in sizes:
+            results.setdefault(case, {})[str(n)] = measure(case, n)
+            print('.', end='', file=sys.stderr, flush=True)
+    print(file=sys.stderr)
+    return results
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> int:
+    regressions = 0
+    print(f"{'case':<24}{'N':>8}{'p50':>11}{'p95':>11}{'p99':>11}{'base p50':>11}{'ratio':>8}")
+    for case, by_size in results.items():
+        for n, stats in by_size.items():
+            base = baseline.get(case, {}).get(n)
+            ratio = stats['p50'] / base['p50'] if base and base['p50'] > 0 else None
+            flag = ''
+            if ratio is not None and ratio > threshold:
+                flag = '  REGRESSION'
+                regressions += 1
+            ratio_text = f"{ratio:.2f}" if ratio is not None else '-'
+            base_text = f"{base['p50']:.1f}" if base else '-'
+            print(f"{case:<24}{n:>8}{stats['p50']:>11.1f}{stats['p95']:>11.1f}{stats['p99']:>11.1f}"
+                  f"{base_text:>11}{ratio_text:>8}{flag}")
+    return regressions
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description='Gameplay hot-path microbenchmarks (latency in us).')
+    parser.add_argument('--cases', nargs='+', choices=list(CASES), default=list(CASES))
+    parser.add_argument('--sizes', nargs='+', type=int, default=list(SIZES))
+    parser.add_argument('--baseline', default=BASELINE_PATH)
+    parser.add_argument('--threshold', type=float, default=1.5, help='p50 ratio above baseline that counts as a regression')
+    parser.add_argument('--update-baseline', action='store_true', help='write these results as the new baseline')
+    args = parser.parse_args(argv)
+
+    results = run(args.cases, args.sizes)
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline, 'r', encoding='utf-8') as fh:
+            baseline = json.load(fh).get('results', {})
+    regressions = compare(results, baseline, args.threshold)
+    if args.update_baseline:
+        with open(args.baseline, 'w', encoding='utf-8') as fh:
+            meta = {'python': platform.python_version(), 'numpy': np.__version__, 'machine': platform.machine()}
+            json.dump({'meta': meta, 'results': results}, fh, indent=2)
+            fh.write('\n')
+        print(f"baseline written to {args.baseline}")
+        return 0
+    if regressions:
+        print(f"{regressions} regression(s) over {args.threshold:.2f}x baseline p50")
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
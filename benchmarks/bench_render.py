@@ -0,0 +1,140 @@
+"""Frame-time benchmark and frame capture for the renderer, with no window or GPU.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_render                       # frame times per scene
+    python -m benchmarks.bench_render --capture out/        # also save the last frame of each scene
+    python -m benchmarks.bench_render --reference out/      # and fail if frames drift from those
+
+Frames are drawn into an offscreen context (see ``spacegame.offscreen``;
+EGL by default, ``--backend osmesa`` otherwise) by a seeded simulation
+played by the greedy bot, with the renderer's animation clock frozen so
+captures are reproducible. Each frame is timed from ``draw_frame`` until
+the GL has finished it; latencies are reported in milliseconds.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import sys
+import time
+from typing import List
+
+import numpy as np
+
+from spacegame.offscreen import BACKENDS, OffscreenContext, OffscreenError
+
+SCENES = ('menu', 'survival', 'collector', 'pause', 'gameover')
+PERCENTILES = (50, 95, 99)
+# Passos de simulação antes de medir, para a tela estar cheia
+WARMUP_TICKS = 600
+CLOCK = 1000.0
+
+
+def _prepare(scene: str, width: int, height: int):
+    """A simulator and initialised renderer showing ``scene`` (GL must already be current)."""
+    from spacegame import bots
+    from spacegame.constants import (GAME_MODE_COLLECTOR, GAME_MODE_SURVIVAL, SIM_DT, STATE_GAMEOVER,
+                                     STATE_PAUSED, STATE_PLAYING)
+    from spacegame.rendering import Renderer
+    from spacegame.simulation import Simulator
+
+    sim = Simulator()
+    state = sim.state
+    state.window.width, state.window.height = width, height
+    state.rng.reseed(1)
+    renderer = Renderer(state)
+    renderer.clock = lambda: CLOCK
+    renderer.initialize()
+    if scene != 'menu':
+        mode = GAME_MODE_COLLECTOR if scene == 'collector' else GAME_MODE_SURVIVAL
+        sim.start(mode, 'Hard', seed=7)
+        sim.run(WARMUP_TICKS, SIM_DT, bots.greedy(random.Random(7)))
+        state.game_state = STATE_PLAYING
+        if scene == 'pause':
+            state.game_state = STATE_PAUSED
+        elif scene == 'gameover':
+            state.game_state = STATE_GAMEOVER
+    return sim, renderer
+
+
+def measure(context: OffscreenContext, scene: str, frames: int):
+    """Per-frame latency percentiles (ms) for ``scene``, and its last frame."""
+    import leaderboard as lb
+    from OpenGL.GL import glFinish
+    from spacegame.constants import SIM_DT, STATE_PLAYING
+
+    sim, renderer = _prepare(scene, context.width, context.height)
+    samples: List[float] = []
+    for _ in range(frames):
+        if sim.state.game_state == STATE_PLAYING:
+            sim.tick(SIM_DT)
+        start = time.perf_counter()
+        renderer.draw_frame(0.5, lb)
+        glFinish()
+        samples.append((time.perf_counter() - start) * 1e3)
+    stats = {f"p{p}": round(float(v), 2) for p, v in zip(PERCENTILES, np.percentile(samples, PERCENTILES))}
+    return stats, context.read_pixels()
+
+
+def difference(frame: np.ndarray, reference_path: str) -> float:
+    """Share of pixels differing by more than 8 levels in any channel from the PNG at ``reference_path``."""
+    from PIL import Image
+
+    if not os.path.exists(reference_path):
+        return 1.0
+    reference = np.asarray(Image.open(reference_path).convert('RGB'), dtype=np.int16)
+    if reference.shape != frame[..., :3].shape:
+        return 1.0
+    changed = np.abs(reference - frame[..., :3].astype(np.int16)).max(axis=2) > 8
+    return float(changed.mean())
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description='Offscreen renderer frame times (ms) and frame capture.')
+    parser.add_argument('--scenes', nargs='+', choices=SCENES, default=list(SCENES))
+    parser.add_argument('--frames', type=int, default=60)
+    parser.add_argument('--size', nargs=2, type=int, default=(800, 600), metavar=('W', 'H'))
+    parser.add_argument('--backend', choices=BACKENDS, default=None)
+    parser.add_argument('--capture', metavar='DIR', help='save the last frame of each scene as DIR/<scene>.png')
+    parser.add_argument('--reference', metavar='DIR', help='compare the last frames with DIR/<scene>.png')
+    parser.add_argument('--tolerance', type=float, default=0.001,
+                        help='share of changed pixels above which a frame counts as different')
+    args = parser.parse_args(argv)
+
+    try:
+        context = OffscreenContext(args.size[0], args.size[1], args.backend)
+    except OffscreenError as exc:
+        print(exc, file=sys.stderr)
+        return 2
+    from OpenGL.GL import GL_RENDERER, glGetString
+    print(f"{context.backend}: {glGetString(GL_RENDERER).decode()}  {args.size[0]}x{args.size[1]}")
+
+    mismatches = 0
+    print(f"{'scene':<12}{'p50':>9}{'p95':>9}{'p99':>9}{'diff':>9}")
+    with context:
+        for scene in args.scenes:
+            stats, frame = measure(context, scene, args.frames)
+            diff_text = '-'
+            if args.reference:
+                diff = difference(frame, os.path.join(args.reference, f"{scene}.png"))
+                diff_text = f"{diff:.2%}"
+                if diff > args.tolerance:
+                    diff_text += '  DIFFERS'
+                    mismatches += 1
+            print(f"{scene:<12}{stats['p50']:>9.2f}{stats['p95']:>9.2f}{stats['p99']:>9.2f}{diff_text:>9}")
+            if args.capture:
+                from PIL import Image
+
+                os.makedirs(args.capture, exist_ok=True)
+                Image.fromarray(frame[..., :3]).save(os.path.join(args.capture, f"{scene}.png"))
+    if mismatches:
+        print(f"{mismatches} scene(s) differ from {args.reference}")
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,78 @@
+"""Spawn-wave cost against the number of live objects.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_spawn
+
+Each row times one Hard wave of ``spawn_stars`` with the lane index and
+with the old linear scan over every live object. The population keeps a
+constant density per lane and only grows further back in z, so the
+indexed column should stay flat while the linear one grows with N.
+"""
+
+from __future__ import annotations
+
+import random
+import time
+
+import numpy as np
+
+from spacegame import gameplay
+from spacegame.constants import COLS, KIND_ASTEROID
+from spacegame.state import GameState
+
+POPULATIONS = (0, 100, 1_000, 10_000, 100_000)
+WAVES = 200
+# Objetos por linha a cada 100 unidades de z
+DENSITY = 5.0
+
+
+def _linear_is_clear(state: GameState, x: float, z: float) -> bool:
+    stars = state.objects.stars
+    return not np.any((np.abs(stars.x - x) < gameplay.MIN_SPAWN_GAP_X)
+                      & (np.abs(stars.z - z) < gameplay.MIN_SPAWN_GAP_Z))
+
+
+def _populate(state: GameState, n: int, rng: random.Random) -> None:
+    depth = max(100.0, n / (COLS * DENSITY) * 100.0)
+    for _ in range(n):
+        lane = rng.randrange(COLS)
+        state.objects.stars.append(lane + rng.uniform(-0.2, 0.2), 0, rng.uniform(8.0 - depth, 8.0),
+                                   KIND_ASTEROID, 0.7, (0.5, 0.45, 0.35), 1, 0.0, 0.0)
+    state.objects.lane_index.rebuild(state.objects.stars)
+
+
+def time_waves(n: int, linear: bool) -> float:
+    rng = random.Random(1234)
+    state = GameState()
+    # Mesmas ondas em todas as execuções e nas duas colunas
+    state.rng.reseed(1234)
+    _populate(state, n, rng)
+    stars = state.objects.stars
+    original = gameplay._position_is_clear
+    if linear:
+        gameplay._position_is_clear = _linear_is_clear
+    try:
+        total = 0.0
+        for _ in range(WAVES):
+            start = time.perf_counter()
+            gameplay.spawn_stars(state, 'Hard')
+            total += time.perf_counter() - start
+            # Descarta a onda para que todas meçam a mesma população
+            stars.compact(np.arange(len(stars)) < n)
+            state.objects.lane_index.rebuild(stars)
+    finally:
+        gameplay._position_is_clear = original
+    return total / WAVES
+
+
+def main() -> None:
+    print(f"{'live objects':>12}  {'indexed (us/wave)':>18}  {'linear (us/wave)':>17}")
+    for n in POPULATIONS:
+        indexed = time_waves(n, linear=False) * 1e6
+        linear = time_waves(n, linear=True) * 1e6
+        print(f"{n:>12}  {indexed:>18.1f}  {linear:>17.1f}")
+
+
+if __name__ == "__main__":
+    main()
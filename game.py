@@ -1,8 +1,39 @@
-from spacegame import Game
+import time
+
+_T0 = time.perf_counter()  # origem do --startup-report: antes de qualquer import pesado
+
+import argparse
+import importlib
+
+# Importados na ordem em que o jogo os carrega, para medir cada um
+HEAVY_MODULES = ('numpy', 'pygame', 'OpenGL.GL', 'OpenGL.GLU', 'PIL.Image', 'spacegame.engine')
 
 
 def main() -> None:
-    Game().run()
+    parser = argparse.ArgumentParser(description="Space Dodger")
+    parser.add_argument('--timings-csv', metavar='PATH',
+                        help='on exit, write per-phase frame times (ms) of the last frames to PATH (F3 shows them)')
+    parser.add_argument('--quality', type=int, metavar='LEVEL',
+                        help='fixed render quality from 0 (lowest) up; adaptive by default')
+    parser.add_argument('--startup-report', action='store_true',
+                        help='print the time spent in each import and init phase up to the first frame (stderr)')
+    args = parser.parse_args()
+
+    report = None
+    if args.startup_report:
+        from spacegame.startup import StartupReport
+        report = StartupReport(_T0)
+        with report.phase('imports'):
+            for name in HEAVY_MODULES:
+                with report.phase(name):
+                    importlib.import_module(name)
+
+    from spacegame import Game
+    from spacegame.quality import QUALITY_LEVELS
+
+    if args.quality is not None and not 0 <= args.quality < len(QUALITY_LEVELS):
+        parser.error(f"argument --quality: must be between 0 and {len(QUALITY_LEVELS) - 1}")
+    Game(timings_csv=args.timings_csv, quality=args.quality).run(report)
 
 
 if __name__ == "__main__":
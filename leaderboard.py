@@ -5,6 +5,8 @@ LEADERBOARD_FILE = os.path.join(os.path.dirname(__file__), "leaderboard.json")
 
 # in-memory leaderboard: dict of difficulty -> list of {name, score}
 leaderboard = {}
+# loaded on first use instead of at import, so importing stays free of file IO
+_loaded = False
 
 def _sanitize(data):
     # ensure difficulty keys exist and entries are well-formed
@@ -23,7 +25,8 @@ def _sanitize(data):
 
 
 def load_leaderboard():
-    global leaderboard
+    global leaderboard, _loaded
+    _loaded = True
     try:
         if os.path.exists(LEADERBOARD_FILE):
             with open(LEADERBOARD_FILE, 'r', encoding='utf-8') as fh:
@@ -36,7 +39,13 @@ def load_leaderboard():
                    'Easy-Collector': [], 'Normal-Collector': [], 'Hard-Collector': [] }
 
 
+def _ensure_loaded():
+    if not _loaded:
+        load_leaderboard()
+
+
 def save_leaderboard():
+    _ensure_loaded()
     try:
         with open(LEADERBOARD_FILE, 'w', encoding='utf-8') as fh:
             json.dump(leaderboard, fh, indent=2, ensure_ascii=False)
@@ -45,6 +54,7 @@ def save_leaderboard():
 
 
 def qualifies_for_leaderboard(difficulty, sc):
+    _ensure_loaded()
     lst = leaderboard.get(difficulty, [])
     if len(lst) < 10:
         return True
@@ -52,6 +62,7 @@ def qualifies_for_leaderboard(difficulty, sc):
 
 
 def add_score_to_leaderboard(difficulty, name, sc):
+    _ensure_loaded()
     lst = leaderboard.setdefault(difficulty, [])
     lst.append({'name': str(name)[:32], 'score': int(sc)})
     lst.sort(key=lambda x: x['score'], reverse=True)
@@ -60,7 +71,5 @@ def add_score_to_leaderboard(difficulty, name, sc):
 
 
 def get_leaderboard(difficulty):
+    _ensure_loaded()
     return leaderboard.get(difficulty, [])
-
-# auto-load on import
-load_leaderboard()
@@ -1,5 +1,13 @@
 """Space Game package consolidating game logic, rendering and state."""
 
-from .engine import Game
+from .simulation import Simulator, TickInput
 
-__all__ = ["Game"]
+__all__ = ["Game", "Simulator", "TickInput"]
+
+
+def __getattr__(name: str):
+    # Game depende de pygame/OpenGL: só importar quando for pedido
+    if name == "Game":
+        from .engine import Game
+        return Game
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
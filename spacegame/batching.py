@@ -0,0 +1,148 @@
+"""Per-frame vertex batches that replace immediate-mode ``glBegin``/``glEnd`` geometry."""
+
+from __future__ import annotations
+
+import ctypes
+
+import numpy as np
+from OpenGL.GL import (
+    GL_ARRAY_BUFFER,
+    GL_COLOR_ARRAY,
+    GL_FLOAT,
+    GL_STREAM_DRAW,
+    GL_TRIANGLES,
+    GL_VERTEX_ARRAY,
+    glBindBuffer,
+    glBufferData,
+    glColorPointer,
+    glDisableClientState,
+    glDrawArrays,
+    glEnableClientState,
+    glGenBuffers,
+    glVertexPointer,
+)
+
+from .geometry import CUBE_TRIANGLES, SPRITE_TRIANGLES, STAR_GLOW_TRIANGLES, STAR_MAIN_TRIANGLES
+
+# x, y, z, r, g, b, a por vértice
+_STRIDE = 7 * 4
+
+
+class VertexBatch:
+    """Colored triangles gathered during a frame and drawn with one ``glDrawArrays``.
+
+    Shapes are appended as whole numpy blocks (every cube, sprite or star of
+    a frame at once), so building a batch costs a handful of array
+    operations however many objects it holds. ``flush`` streams the
+    vertices into a VBO and draws them with whatever GL state the caller
+    has set; the batch itself never touches lighting or blending.
+    """
+
+    def __init__(self, capacity: int = 1024) -> None:
+        self.data = np.zeros((capacity, 7), dtype=np.float32)
+        self.count = 0
+        self.vbo = None
+        self.draw_calls = 0  # chamadas de desenho desde a criação
+
+    def __len__(self) -> int:
+        return self.count
+
+    def add(self, vertices: np.ndarray, colors) -> None:
+        """Append triangle vertices, (n, 2) or (n, 3), with one color per vertex or one for all."""
+        n = len(vertices)
+        if not n:
+            return
+        rows = self._reserve(n)
+        dims = vertices.shape[1]
+        rows[:, :dims] = vertices
+        if dims == 2:
+            rows[:, 2] = 0.0
+        rows[:, 3:] = colors
+
+    def add_rect(self, x0: float, y0: float, x1: float, y1: float, color) -> None:
+        corners = SPRITE_TRIANGLES * 0.5 + 0.5
+        self.add(corners * (x1 - x0, y1 - y0) + (x0, y0), _rgba(color))
+
+    def add_triangle(self, p0, p1, p2, color) -> None:
+        self.add(np.array((p0, p1, p2), dtype=np.float32), _rgba(color))
+
+    def add_cubes(self, centers: np.ndarray, sizes: np.ndarray, colors: np.ndarray) -> None:
+        """Axis-aligned cubes of edge ``sizes`` around ``centers``; ``colors`` is (n, 3) or (n, 4)."""
+        self._add_shapes(CUBE_TRIANGLES, centers, np.asarray(sizes)[:, None, None], colors)
+
+    def add_sprites(self, centers: np.ndarray, sizes: np.ndarray, colors: np.ndarray) -> None:
+        """Squares of half-side ``sizes`` facing +z."""
+        sprite = np.zeros((len(SPRITE_TRIANGLES), 3), dtype=np.float32)
+        sprite[:, :2] = SPRITE_TRIANGLES
+        self._add_shapes(sprite, centers, np.asarray(sizes)[:, None, None], colors)
+
+    def add_stars(self, centers: np.ndarray, scales: np.ndarray, spins: np.ndarray, colors: np.ndarray,
+                  glow: bool = True) -> None:
+        """Collector stars: solid body then (with ``glow``) faint halo, each spun ``spins`` degrees about y."""
+        n = len(centers)
+        if not n:
+            return
+        flat = np.concatenate((STAR_MAIN_TRIANGLES, STAR_GLOW_TRIANGLES)) if glow else STAR_MAIN_TRIANGLES
+        main = len(STAR_MAIN_TRIANGLES)
+        rad = np.radians(spins)[:, None]
+        px = flat[None, :, 0] * scales[:, None]
+        shape = np.empty((n, len(flat), 3), dtype=np.float32)
+        shape[..., 0] = px * np.cos(rad)
+        shape[..., 1] = flat[None, :, 1] * scales[:, None]
+        shape[..., 2] = -px * np.sin(rad)
+        shape += np.asarray(centers, dtype=np.float32)[:, None, :]
+        rgba = np.empty((n, len(flat), 4), dtype=np.float32)
+        rgba[..., :3] = np.asarray(colors)[:, None, :3]
+        rgba[:, :main, 3] = 0.9
+        rgba[:, main:, 3] = 0.3
+        self.add(shape.reshape(-1, 3), rgba.reshape(-1, 4))
+
+    def flush(self) -> None:
+        """Draw everything gathered since the last flush, then empty the batch."""
+        if not self.count:
+            return
+        if self.vbo is None:
+            self.vbo = glGenBuffers(1)
+        glBindBuffer(GL_ARRAY_BUFFER, self.vbo)
+        # Reenviar tudo com STREAM_DRAW: o driver troca o buffer em vez de esperar a GPU
+        glBufferData(GL_ARRAY_BUFFER, self.data[:self.count], GL_STREAM_DRAW)
+        glEnableClientState(GL_VERTEX_ARRAY)
+        glEnableClientState(GL_COLOR_ARRAY)
+        glVertexPointer(3, GL_FLOAT, _STRIDE, ctypes.c_void_p(0))
+        glColorPointer(4, GL_FLOAT, _STRIDE, ctypes.c_void_p(12))
+        glDrawArrays(GL_TRIANGLES, 0, self.count)
+        glDisableClientState(GL_COLOR_ARRAY)
+        glDisableClientState(GL_VERTEX_ARRAY)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+        self.draw_calls += 1
+        self.count = 0
+
+    def clear(self) -> None:
+        self.count = 0
+
+    def _add_shapes(self, template: np.ndarray, centers, scales, colors) -> None:
+        n = len(centers)
+        if not n:
+            return
+        shape = template[None, :, :] * scales + np.asarray(centers, dtype=np.float32)[:, None, :]
+        colors = np.asarray(colors, dtype=np.float32)
+        rgba = np.ones((n, len(template), 4), dtype=np.float32)
+        rgba[..., :colors.shape[1]] = colors[:, None, :]
+        self.add(shape.reshape(-1, 3), rgba.reshape(-1, 4))
+
+    def _reserve(self, n: int) -> np.ndarray:
+        needed = self.count + n
+        if needed > len(self.data):
+            capacity = len(self.data)
+            while capacity < needed:
+                capacity *= 2
+            grown = np.zeros((capacity, 7), dtype=np.float32)
+            grown[:self.count] = self.data[:self.count]
+            self.data = grown
+        rows = self.data[self.count:needed]
+        self.count = needed
+        return rows
+
+
+def _rgba(color) -> tuple:
+    return tuple(color) + (1.0,) * (4 - len(color))
@@ -0,0 +1,91 @@
+"""Scripted bot policies for headless runs.
+
+A policy factory takes a ``random.Random`` and returns an input script
+``(tick, state) -> TickInput`` for one game, as accepted by
+:meth:`Simulator.run`.
+"""
+
+from __future__ import annotations
+
+import importlib
+import random
+from typing import Callable, Dict
+
+import numpy as np
+
+from .constants import COLS, GAME_MODE_COLLECTOR, KIND_COLLECTOR_STAR, KIND_PICKUP
+from .simulation import NO_INPUT, InputScript, TickInput
+from .state import GameState
+
+PolicyFactory = Callable[[random.Random], InputScript]
+
+# Bots só decidem a cada N passos (~50 ms a 120 Hz), como um jogador
+REACTION_TICKS = 6
+# Até onde (em z, à frente da nave) os bots enxergam ameaças
+LOOKAHEAD_Z = 30.0
+
+
+def idle(rng: random.Random) -> InputScript:
+    """Never presses anything: a floor for survival time."""
+    def script(tick: int, state: GameState) -> TickInput:
+        return NO_INPUT
+    return script
+
+
+def random_walk(rng: random.Random) -> InputScript:
+    """Mashes keys at random."""
+    def script(tick: int, state: GameState) -> TickInput:
+        if tick % REACTION_TICKS:
+            return NO_INPUT
+        r = rng.random()
+        return TickInput(left=r < 0.2, right=0.2 <= r < 0.4, fire=rng.random() < 0.1)
+    return script
+
+
+def greedy(rng: random.Random) -> InputScript:
+    """Dodges toward the lane whose nearest threat is furthest away and shoots
+    what is ahead; in collector mode chases the closest star instead."""
+    def script(tick: int, state: GameState) -> TickInput:
+        if tick % REACTION_TICKS:
+            return NO_INPUT
+        player = state.player
+        lane = int(round(player.target_x))
+        stars = state.objects.stars
+        ahead = (stars.z < player.z + 0.5) & (stars.z > player.z - LOOKAHEAD_Z)
+        lanes = np.rint(stars.x)
+        if state.game_mode == GAME_MODE_COLLECTOR:
+            targets = np.flatnonzero(ahead & (stars.kind == KIND_COLLECTOR_STAR))
+            if not len(targets):
+                return NO_INPUT
+            goal = int(lanes[targets[np.argmax(stars.z[targets])]])
+            return TickInput(left=goal < lane, right=goal > lane)
+        threats = ahead & (stars.kind != KIND_PICKUP)
+        best, best_gap = lane, -1.0
+        # Empate: preferir ficar na linha, depois um lado aleatório
+        for option in sorted((lane, lane - 1, lane + 1), key=lambda l: (l != lane, rng.random())):
+            if not 0 <= option < COLS:
+                continue
+            in_lane = threats & (lanes == option)
+            gap = float(player.z - stars.z[in_lane].max()) if in_lane.any() else LOOKAHEAD_Z
+            if gap > best_gap + 1.0:
+                best, best_gap = option, gap
+        fire = player.shot_charge >= 1.0 and bool((threats & (lanes == lane)).any())
+        return TickInput(left=best < lane, right=best > lane, fire=fire)
+    return script
+
+
+POLICIES: Dict[str, PolicyFactory] = {
+    'idle': idle,
+    'random': random_walk,
+    'greedy': greedy,
+}
+
+
+def resolve_policy(name: str) -> PolicyFactory:
+    """A registered policy name, or ``module:factory`` for a custom one."""
+    if name in POLICIES:
+        return POLICIES[name]
+    module_name, sep, attr = name.partition(':')
+    if not sep:
+        raise ValueError(f"unknown policy {name!r} (choose from {', '.join(POLICIES)} or use module:factory)")
+    return getattr(importlib.import_module(module_name), attr)
@@ -4,6 +4,22 @@ ROWS = 7
 SCREEN_W = 800
 SCREEN_H = 800
 
+# projeção da câmera
+FOV_Y = 60
+NEAR_PLANE = 0.1
+FAR_PLANE = 100
+# abaixo deste raio na tela (pixels) asteroides e inimigos viram um cubo simples
+OBJECT_LOD_PIXELS = 6.0
+
+# passo fixo da simulação
+SIM_HZ = 120
+SIM_DT = 1.0 / SIM_HZ
+MAX_CATCHUP_STEPS = 8  # passos por quadro antes de descartar o atraso
+# Teto do laço de render: o vsync normalmente segura antes; o teto evita girar a CPU
+# a 100% quando o driver ignora o vsync sem avisar
+MAX_RENDER_FPS = 240
+NO_VSYNC_RENDER_FPS = 60  # teto quando o driver recusa o vsync
+
 # estados do jogo
 STATE_MENU = 0
 STATE_PLAYING = 1
@@ -28,19 +44,18 @@ COLLECTOR_DIFFICULTY = {
     'Hard':  {'spawn_interval': 1.2, 'star_speed': 13.0, 'stars_per_wave': 2, 'max_misses': 2}
 }
 
+# chaves das tabelas acima, na mesma ordem de MenuState.difficulty_names
+DIFFICULTY_KEYS = ('Easy', 'Normal', 'Hard')
+
 # escalas de renderização de modelos
 MODEL_SCALE_SHIP = 1
 MODEL_SCALE_OBJECT = 1
 
-# índices das propriedades da lista de estrelas (compartilhados entre módulos)
-STAR_X = 0
-STAR_Y = 1
-STAR_Z = 2
-STAR_KIND = 3
-STAR_SIZE = 4
-STAR_R = 5
-STAR_G = 6
-STAR_B = 7
-STAR_HP = 8
-STAR_SPIN_ANGLE = 9
-STAR_SPIN_SPEED = 10
+# estrelas do fundo (geradas uma vez; a cintilação roda no shader)
+BACKGROUND_STAR_COUNT = 400
+
+# tipos de objeto (coluna `kind` do EntityStore, compartilhados entre módulos)
+KIND_ASTEROID = 0
+KIND_ENEMY = 1
+KIND_PICKUP = 2
+KIND_COLLECTOR_STAR = 3
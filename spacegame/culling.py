@@ -0,0 +1,63 @@
+"""View-frustum tests and projected-size estimates for the renderer."""
+
+from __future__ import annotations
+
+import math
+
+import numpy as np
+
+from .constants import FOV_Y
+
+
+class Frustum:
+    """The six clip planes of a camera, tested against bounding spheres.
+
+    Built from the GL modelview and projection matrices (as returned by
+    ``glGetFloatv``, column-major), so whatever ``gluLookAt`` and
+    ``gluPerspective`` set up is what gets tested.
+    """
+
+    def __init__(self, modelview, projection) -> None:
+        # glGetFloatv devolve colunas: transpor dá a matriz matemática
+        view = np.asarray(modelview, dtype=np.float64).reshape(4, 4).T
+        clip = np.asarray(projection, dtype=np.float64).reshape(4, 4).T @ view
+        planes = np.array([
+            clip[3] + clip[0], clip[3] - clip[0],  # esquerda, direita
+            clip[3] + clip[1], clip[3] - clip[1],  # baixo, cima
+            clip[3] + clip[2], clip[3] - clip[2],  # perto, longe
+        ])
+        self.planes = planes / np.linalg.norm(planes[:, :3], axis=1)[:, None]
+        self.eye = np.linalg.inv(view)[:3, 3]
+
+    def sphere_visible(self, center, radius: float) -> bool:
+        distances = self.planes[:, :3] @ np.asarray(center, dtype=np.float64) + self.planes[:, 3]
+        return bool(np.all(distances >= -radius))
+
+    def distance(self, center) -> float:
+        return float(np.linalg.norm(np.asarray(center, dtype=np.float64) - self.eye))
+
+    def spheres_visible(self, centers, radii) -> np.ndarray:
+        """``sphere_visible`` for every row of ``centers`` (n, 3), as a bool mask."""
+        centers = np.asarray(centers, dtype=np.float64).reshape(-1, 3)
+        distances = centers @ self.planes[:, :3].T + self.planes[:, 3]
+        return np.all(distances >= -np.asarray(radii, dtype=np.float64).reshape(-1, 1), axis=1)
+
+    def distances(self, centers) -> np.ndarray:
+        return np.linalg.norm(np.asarray(centers, dtype=np.float64).reshape(-1, 3) - self.eye, axis=1)
+
+
+def projected_radius(radius, distance, viewport_height: int, fov_y: float = FOV_Y):
+    """Approximate on-screen radius in pixels of a sphere ``distance`` from the eye.
+
+    Scalars give a float; arrays give an array, with ``inf`` wherever the
+    eye is inside the sphere.
+    """
+    scale = (viewport_height / 2.0) / math.tan(math.radians(fov_y) / 2.0)
+    if np.ndim(radius) or np.ndim(distance):
+        radius, distance = np.broadcast_arrays(np.asarray(radius, dtype=np.float64),
+                                               np.asarray(distance, dtype=np.float64))
+        inside = distance <= radius
+        return np.where(inside, np.inf, radius / np.where(inside, 1.0, distance) * scale)
+    if distance <= radius:
+        return float('inf')
+    return radius / distance * scale
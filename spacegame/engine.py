@@ -1,8 +1,8 @@
 from __future__ import annotations
 
-import math
 import time
-from typing import Callable
+from contextlib import nullcontext
+from typing import Callable, Optional
 
 import pygame
 from pygame.locals import (
@@ -19,6 +19,7 @@ from pygame.locals import (
     K_p,
     K_q,
     K_m,
+    K_F3,
     QUIT,
     VIDEORESIZE,
     KEYDOWN,
@@ -27,55 +28,104 @@ from pygame.locals import (
 import leaderboard as lb
 
 from .constants import (
-    COLS,
-    SCREEN_W,
-    SCREEN_H,
-    DIFFICULTY,
-    COLLECTOR_DIFFICULTY,
+    DIFFICULTY_KEYS,
+    MAX_RENDER_FPS,
+    NO_VSYNC_RENDER_FPS,
     STATE_GAMEOVER,
     STATE_MENU,
     STATE_PAUSED,
     STATE_PLAYING,
-    GAME_MODE_SURVIVAL,
     GAME_MODE_COLLECTOR,
 )
-from .gameplay import fire_shot, spawn_stars, update_shots, update_stars, spawn_collector_stars, update_collector_stars
+from .profiling import FrameTimings
+from .quality import QUALITY_LEVELS, QualityController
 from .rendering import Renderer
+from .simulation import Simulator, TickInput
+from .startup import StartupReport
 from .state import GameState
 
 
 class Game:
-    def __init__(self) -> None:
+    def __init__(self, timings_csv: Optional[str] = None, quality: Optional[int] = None) -> None:
         self.state = GameState()
+        self.simulator = Simulator(self.state)
         self.renderer = Renderer(self.state)
         self.running = False
+        # Desligado se o driver recusar o intervalo de troca; aí o teto de FPS é menor
+        self.vsync = True
+        # Tempo por fase dos últimos quadros (F3 mostra); gravado em timings_csv ao sair
+        self.timings = FrameTimings()
+        self.renderer.timings = self.timings
+        self.timings_csv = timings_csv
+        # Nível fixo de QUALITY_LEVELS, ou None para ajustar pelo tempo de quadro
+        self.quality = QualityController() if quality is None else None
+        if quality is not None:
+            self.renderer.apply_quality(QUALITY_LEVELS[quality])
+        # {pool: (alocações, reusos)} do último quadro
+        self.pool_counts: dict = {}
         self.load_leaderboard: Callable[[], None] = lb.load_leaderboard
         self.save_leaderboard: Callable[[], None] = lb.save_leaderboard
         self.qualifies_for_leaderboard: Callable[[str, int], bool] = lb.qualifies_for_leaderboard
         self.add_score_to_leaderboard: Callable[[str, str, int], None] = lb.add_score_to_leaderboard
 
-    def run(self) -> None:
-        pygame.init()
-        self._create_window(self.state.window.width, self.state.window.height)
-        self.renderer.initialize()
-        self.renderer.load_moon_texture()
-        self.load_leaderboard()
+    def run(self, report: Optional[StartupReport] = None) -> None:
+        phase = report.phase if report is not None else _untimed
+        # Decodificar a lua e rasterizar a fonte em threads enquanto a janela e o GL sobem
+        with phase('start texture/font threads'):
+            self.renderer.load_moon_texture()
+            self.renderer.text.preload()
+        # Só o vídeo: o pygame.init() completo também abre o áudio, que o jogo não usa
+        with phase('pygame display init'):
+            pygame.display.init()
+        with phase('create window'):
+            self._create_window(self.state.window.width, self.state.window.height)
+        with phase('renderer init'):
+            self.renderer.initialize(report)
+        # O leaderboard.json é lido no primeiro acesso (menu de placar ou fim de jogo), fora da partida
         clock = pygame.time.Clock()
         self.running = True
-        last_time = time.time()
+        last_time = time.perf_counter()
+        timings = self.timings
         while self.running:
-            now = time.time()
-            delta = now - last_time
+            now = time.perf_counter()
+            elapsed = now - last_time
             last_time = now
-            self.state.spawn_timer += delta
-            self._handle_events()
-            self._update(delta)
-            self._render()
-            clock.tick(60)
+            timings.begin_frame()
+            with timings.phase('events'):
+                self._handle_events()
+            with timings.phase('update'):
+                alpha = self._update(elapsed)
+            self._render(alpha)
+            if report is not None and not report.done:
+                report.first_frame()
+            self.pool_counts = self.state.objects.end_frame()
+            timings.end_frame()
+            self._adapt_quality()
+            clock.tick(MAX_RENDER_FPS if self.vsync else NO_VSYNC_RENDER_FPS)
+        self.renderer.textures.close()
+        self.renderer.textures.cache.clear()
         pygame.quit()
+        if self.timings_csv:
+            timings.write_csv(self.timings_csv)
+
+    def _adapt_quality(self) -> None:
+        if self.quality is None:
+            return
+        # Sem o flip: com vsync ele espera o próximo refresh e completa o quadro até o intervalo
+        work = self.timings.latest('frame') - self.timings.latest('flip')
+        if self.quality.observe(work):
+            self.renderer.apply_quality(self.quality.level)
 
     def _create_window(self, width: int, height: int) -> None:
-        pygame.display.set_mode((width, height), DOUBLEBUF | OPENGL | RESIZABLE)
+        flags = DOUBLEBUF | OPENGL | RESIZABLE
+        if self.vsync:
+            try:
+                pygame.display.set_mode((width, height), flags, vsync=1)
+            except pygame.error:
+                # "regular vsync for OpenGL not available": seguir sem vsync
+                self.vsync = False
+        if not self.vsync:
+            pygame.display.set_mode((width, height), flags, vsync=0)
         pygame.display.set_caption("Space Dodger v1.0a")
 
     def _handle_events(self) -> None:
@@ -88,6 +138,8 @@ class Game:
                 state.window.width, state.window.height = event.w, event.h
                 self._create_window(event.w, event.h)
                 self.renderer.resize(event.w, event.h)
+            elif event.type == KEYDOWN and event.key == K_F3:
+                self.renderer.show_timings = not self.renderer.show_timings
             elif event.type == KEYDOWN:
                 if state.game_state == STATE_MENU:
                     self._handle_menu_input(event)
@@ -141,11 +193,7 @@ class Game:
         elif key in (K_RETURN, K_SPACE):
             if menu.selected == 0:
                 # Iniciar jogo
-                self.state.game_mode = menu.mode_index
-                self.state.leaderboard.last_played_difficulty = menu.difficulty_names[menu.difficulty_index]
-                self.state.leaderboard.prompted = False
-                self.state.reset()
-                self.state.game_state = STATE_PLAYING
+                self.simulator.start(menu.mode_index, DIFFICULTY_KEYS[menu.difficulty_index])
             elif menu.selected == 1:
                 # Ciclar modo
                 menu.mode_index = (menu.mode_index + 1) % len(menu.mode_names)
@@ -161,16 +209,12 @@ class Game:
 
     def _handle_playing_input(self, event) -> None:
         key = event.key
-        player = self.state.player
-        if key == K_LEFT:
-            player.target_x -= 1
-        elif key == K_RIGHT:
-            player.target_x += 1
-        elif key == K_SPACE and self.state.game_mode == GAME_MODE_SURVIVAL:
-            fire_shot(self.state)
-        elif key in (K_p, K_ESCAPE):
-            self.state.menu.pause_selected = 0
-            self.state.game_state = STATE_PAUSED
+        self.simulator.apply_input(TickInput(
+            left=key == K_LEFT,
+            right=key == K_RIGHT,
+            fire=key == K_SPACE,
+            pause=key in (K_p, K_ESCAPE),
+        ))
 
     def _handle_pause_input(self, event) -> None:
         key = event.key
@@ -182,7 +226,7 @@ class Game:
         # Ações por cursor
         elif key in (K_RETURN, K_SPACE):
             if menu.pause_selected == 0:
-                self.state.game_state = STATE_PLAYING
+                self.simulator.apply_input(TickInput(pause=True))
             elif menu.pause_selected == 1:
                 self.state.game_state = STATE_MENU
             else:
@@ -190,7 +234,8 @@ class Game:
 
         # Ações por tecla direta
         elif key in (K_p, K_ESCAPE):
-            self.state.game_state = STATE_PLAYING
+            # Pela simulação, para que a retomada entre no log de replay
+            self.simulator.apply_input(TickInput(pause=True))
         elif key == K_m:
             self.state.game_state = STATE_MENU
         elif key == K_q:
@@ -219,61 +264,15 @@ class Game:
                     lb_state.name_buffer += ch
         else:
             if key in (K_RETURN, K_SPACE):
-                self.state.reset()
-                self.state.game_state = STATE_PLAYING
+                self.simulator.start(self.state.game_mode, self.simulator.difficulty_name)
             elif key == K_q:
                 self.running = False
             elif key == K_m:
                 self.state.game_state = STATE_MENU
 
-    def _update(self, delta: float) -> None:
+    def _update(self, elapsed: float) -> float:
+        alpha = self.simulator.advance(elapsed)
         state = self.state
-        menu = state.menu
-        if state.game_state == STATE_PLAYING:
-            player = state.player
-            player.target_x = max(0, min(COLS - 1, player.target_x))
-            diff = player.target_x - player.x
-            player.x = smooth_lerp(player.x, player.target_x, delta, 10)
-            lateral = abs(player.target_x - player.x)
-            desired_z = 12.0 - min(4.5, lateral * 2.0)
-            v = diff / max(delta, 1e-6)
-            look_ahead = max(-2.0, min(2.0, v * 0.02))
-            desired_x = player.x + look_ahead
-            desired_y = 3.0
-            state.camera.x = smooth_lerp(state.camera.x, desired_x, delta, 10.0)
-            state.camera.y = smooth_lerp(state.camera.y, desired_y, delta, 6.0)
-            state.camera.z = smooth_lerp(state.camera.z, desired_z, delta, 6.0)
-            difficulty_name = menu.difficulty_names[menu.difficulty_index]
-            
-            # Modos de jogo
-            if state.game_mode == GAME_MODE_COLLECTOR:
-                # Lógica do modo Collector
-                cfg = COLLECTOR_DIFFICULTY[difficulty_name]
-                if state.spawn_timer > cfg['spawn_interval']:
-                    spawn_collector_stars(state, difficulty_name)
-                    state.spawn_timer = 0
-                alive = update_collector_stars(state, difficulty_name, delta)
-                if not alive:
-                    state.game_state = STATE_GAMEOVER
-            else:
-                # Lógica do modo Survival
-                if state.spawn_timer > DIFFICULTY[difficulty_name]['spawn_interval']:
-                    spawn_stars(state, difficulty_name)
-                    state.spawn_timer = 0
-                alive = update_stars(state, difficulty_name, delta)
-                if not alive:
-                    state.game_state = STATE_GAMEOVER
-                update_shots(state, delta)
-            
-            state.time_alive += delta
-        menu.anim += delta
-        player = state.player
-        player.shot_charge = min(1.0, player.shot_charge + delta / player.shot_cooldown)
-        if player.shield_time > 0:
-            player.shield_time = max(0.0, player.shield_time - delta)
-        if state.effects.global_slow_time > 0:
-            state.effects.global_slow_time = max(0.0, state.effects.global_slow_time - delta)
-        state.effects.moon_angle += delta * 2
         if state.game_state == STATE_GAMEOVER and not state.leaderboard.prompted:
             difficulty = state.leaderboard.last_played_difficulty
             mode_suffix = '-Coletor' if state.game_mode == GAME_MODE_COLLECTOR else ''
@@ -286,22 +285,13 @@ class Game:
                 state.leaderboard.name_buffer = ""
                 state.leaderboard.pending_difficulty = difficulty_key
             state.leaderboard.prompted = True
+        return alpha
+
+    def _render(self, alpha: float) -> None:
+        self.renderer.draw_frame(alpha, lb)
+        with self.timings.phase('flip'):
+            pygame.display.flip()
 
-    def _render(self) -> None:
-        state = self.state
-        if state.game_state == STATE_MENU:
-            self.renderer.draw_menu_background()
-            self.renderer.draw_menu_overlay(lb)
-        elif state.game_state in (STATE_PAUSED, STATE_GAMEOVER):
-            self.renderer.draw_scene()
-            self.renderer.draw_menu_overlay(lb)
-        else:
-            self.renderer.draw_scene()
-        pygame.display.flip()
 
-# Suavizar movimento
-def smooth_lerp(current: float, target: float, dt: float, speed: float) -> float:
-    if dt <= 0:
-        return target
-    alpha = 1.0 - math.exp(-speed * dt)
-    return current + (target - current) * alpha
+def _untimed(name: str):
+    return nullcontext()
@@ -0,0 +1,151 @@
+"""Columnar (structure-of-arrays) storage for the objects flying at the player."""
+
+from __future__ import annotations
+
+from typing import Sequence
+
+import numpy as np
+
+from .pools import PoolCounter
+
+
+class _Column:
+    """Descriptor exposing the live ``[0, count)`` slice of a backing array."""
+
+    def __init__(self, attr: str, index: int | None = None) -> None:
+        self.attr = attr
+        self.index = index
+
+    def __get__(self, store, owner=None):
+        if store is None:
+            return self
+        data = getattr(store, self.attr)
+        if self.index is None:
+            return data[:store.count]
+        return data[:store.count, self.index]
+
+    def __set__(self, store, value) -> None:
+        # Permite `store.z += dz` (o numpy já alterou in-place; aqui só copia de volta)
+        self.__get__(store)[...] = value
+
+
+# Acima disso, remove() usa a máscara de compact() em vez de deslocar bloco a bloco
+_SHIFT_REMOVE_LIMIT = 32
+
+
+class EntityStore:
+    """Dense float32 columns for every live object, packed in ``[0, count)``.
+
+    Gameplay passes work on whole columns and drop objects by handing a keep
+    mask to :meth:`compact`, so per-frame cost is a handful of numpy calls no
+    matter how many objects are alive. The arrays are preallocated and the
+    rows past ``count`` act as the free-list: a despawn frees the tail slot
+    and the next spawn overwrites it, so memory only grows when capacity is
+    exceeded (counted in ``counter.allocations``).
+    """
+
+    x = _Column('pos', 0)
+    y = _Column('pos', 1)
+    z = _Column('pos', 2)
+    size = _Column('size_data')
+    color = _Column('color_data')
+    hp = _Column('hp_data')
+    spin_angle = _Column('spin_data', 0)
+    spin_speed = _Column('spin_data', 1)
+    kind = _Column('kind_data')
+
+    def __init__(self, capacity: int = 1024) -> None:
+        self.count = 0
+        # Incrementado a cada inserção/remoção; índices derivados usam para saber se estão velhos
+        self.version = 0
+        self.counter = PoolCounter()
+        self._allocate(max(1, capacity))
+
+    def __len__(self) -> int:
+        return self.count
+
+    @property
+    def capacity(self) -> int:
+        return self.kind_data.shape[0]
+
+    def _allocate(self, capacity: int) -> None:
+        self.pos = np.zeros((capacity, 3), dtype=np.float32)
+        self.prev_pos = np.zeros((capacity, 3), dtype=np.float32)
+        self.size_data = np.zeros(capacity, dtype=np.float32)
+        self.color_data = np.zeros((capacity, 3), dtype=np.float32)
+        self.hp_data = np.zeros(capacity, dtype=np.float32)
+        self.spin_data = np.zeros((capacity, 2), dtype=np.float32)
+        self.kind_data = np.zeros(capacity, dtype=np.int8)
+
+    def _arrays(self) -> tuple:
+        return (self.pos, self.prev_pos, self.size_data, self.color_data, self.hp_data, self.spin_data, self.kind_data)
+
+    def _grow(self) -> None:
+        old = self._arrays()
+        self._allocate(self.capacity * 2)
+        new = self._arrays()
+        for src, dst in zip(old, new):
+            dst[:self.count] = src[:self.count]
+
+    def append(self, x: float, y: float, z: float, kind: int, size: float,
+               color: Sequence[float], hp: float, spin_angle: float, spin_speed: float) -> int:
+        if self.count == self.capacity:
+            self._grow()
+            self.counter.allocations += 1
+        else:
+            self.counter.reuses += 1
+        i = self.count
+        self.pos[i] = (x, y, z)
+        self.prev_pos[i] = (x, y, z)
+        self.size_data[i] = size
+        self.color_data[i] = color
+        self.hp_data[i] = hp
+        self.spin_data[i] = (spin_angle, spin_speed)
+        self.kind_data[i] = kind
+        self.count += 1
+        self.version += 1
+        return i
+
+    def compact(self, keep: np.ndarray) -> None:
+        """Keep only rows where ``keep`` is true, preserving their order."""
+        n = self.count
+        kept = int(np.count_nonzero(keep))
+        if kept != n:
+            for data in self._arrays():
+                data[:kept] = data[:n][keep]
+            self.count = kept
+        self.version += 1
+
+    def save_previous(self) -> None:
+        """Remember current positions as the previous simulation step."""
+        self.prev_pos[:self.count] = self.pos[:self.count]
+
+    def interpolated_pos(self, alpha: float) -> np.ndarray:
+        """Positions blended between the previous and current step (alpha in [0, 1])."""
+        prev = self.prev_pos[:self.count]
+        return prev + (self.pos[:self.count] - prev) * alpha
+
+    def remove(self, indices) -> None:
+        """Drop the rows ``indices``; same result as :meth:`compact` with those rows masked out."""
+        rows = np.unique(np.asarray(indices, dtype=np.intp))
+        if len(rows) > _SHIFT_REMOVE_LIMIT:
+            keep = np.ones(self.count, dtype=bool)
+            keep[rows] = False
+            self.compact(keep)
+            return
+        # Poucas linhas: descer os blocos entre elas com cópias contíguas, bem mais baratas
+        # que a máscara booleana nas colunas 2D
+        starts = rows.tolist()
+        ends = starts[1:] + [self.count]
+        for data in self._arrays():
+            dst = starts[0] if starts else 0
+            for row, end in zip(starts, ends):
+                length = end - row - 1
+                data[dst:dst + length] = data[row + 1:end]
+                dst += length
+        self.count -= len(rows)
+        self.version += 1
+
+    def clear(self) -> None:
+        self.count = 0
+        self.version += 1
@@ -2,17 +2,19 @@ from __future__ import annotations
 
 import random
 from typing import List
-from .constants import (
-    STAR_X, STAR_Y, STAR_Z, STAR_KIND, STAR_SIZE, STAR_R, STAR_G, STAR_B,
-    STAR_HP, STAR_SPIN_ANGLE, STAR_SPIN_SPEED
-)
+
+import numpy as np
+
+from .constants import KIND_ASTEROID, KIND_ENEMY, KIND_PICKUP, KIND_COLLECTOR_STAR
 
 from .constants import COLS, DIFFICULTY, COLLECTOR_DIFFICULTY, GAME_MODE_COLLECTOR
+from .entities import EntityStore
+from .spatial import LaneIndex
 from .state import GameState
 
 
 def create_explosion(state: GameState, x: float, y: float, z: float) -> None:
-    state.objects.explosions.append([x, y, z, 0.1, 0.0, 0.4])
+    state.objects.explosions.emit(x, y, z)
 
 
 # Configurações de spawn de objetos
@@ -24,41 +26,42 @@ COLLECTOR_Z_SPAWN = -40.0
 
 def spawn_stars(state: GameState, difficulty_name: str) -> None:
     cfg = DIFFICULTY.get(difficulty_name, DIFFICULTY['Normal'])
-    stars_to_spawn = random.randint(cfg['spawn_min'], cfg['spawn_max'])
+    rng = state.rng.spawn
+    stars_to_spawn = rng.randint(cfg['spawn_min'], cfg['spawn_max'])
     for _ in range(stars_to_spawn):
-        lane = random.randint(0, COLS - 1)
-        x, z = _pick_spawn_slot(state, lane)
-        kind = 'asteroid'
-        r = random.random()
+        lane = rng.randint(0, COLS - 1)
+        x, z = _pick_spawn_slot(state, lane, rng)
+        kind = KIND_ASTEROID
+        r = rng.random()
         if r < 0.08:
-            kind = 'pickup'
+            kind = KIND_PICKUP
         elif r < 0.3:
-            kind = 'enemy'
-        if kind == 'asteroid':
-            size = random.uniform(0.5, 1.0)
+            kind = KIND_ENEMY
+        if kind == KIND_ASTEROID:
+            size = rng.uniform(0.5, 1.0)
             color = (0.5, 0.45, 0.35)
             hp = 1
-        elif kind == 'enemy':
-            size = random.uniform(0.34, 0.6)
+        elif kind == KIND_ENEMY:
+            size = rng.uniform(0.34, 0.6)
             color = (1.0, 0.2, 0.45)
             hp = 1
         else:
-            size = random.uniform(0.25, 0.45)
+            size = rng.uniform(0.25, 0.45)
             color = (0.2, 1.0, 0.6)
             hp = 0
-        spin_angle, spin_speed = _spin_profile(kind)
-        state.objects.stars.append([x, 0, z, kind, size, color[0], color[1], color[2], hp, spin_angle, spin_speed])
+        spin_angle, spin_speed = _spin_profile(kind, rng)
+        row = state.objects.stars.append(x, 0, z, kind, size, color, hp, spin_angle, spin_speed)
+        state.objects.lane_index.insert(state.objects.stars, row)
 
 
 def spawn_collector_stars(state: GameState, difficulty_name: str) -> None:
     cfg = COLLECTOR_DIFFICULTY.get(difficulty_name, COLLECTOR_DIFFICULTY['Normal'])
     stars_to_spawn = cfg['stars_per_wave']
+    rng = state.rng.spawn
 
-    # Lista de estrelas ativas -> Evitar spawn na mesma linha
-    active_positions: List[tuple[int, float]] = []
-    for s in state.objects.stars:
-        if s[STAR_KIND] == 'collector_star':
-            active_positions.append((int(round(s[STAR_X])), s[STAR_Z]))
+    # Z das estrelas ativas -> Evitar spawn na mesma linha
+    stars = state.objects.stars
+    active_z = [float(z) for z in stars.z[stars.kind == KIND_COLLECTOR_STAR]]
 
     player_lane = int(round(state.player.x))
     lanes = list(range(COLS))
@@ -81,13 +84,13 @@ def spawn_collector_stars(state: GameState, difficulty_name: str) -> None:
         attempts += 1
 
         # Preferir linhas próximas ao jogador
-        if random.random() < 0.6:
+        if rng.random() < 0.6:
             candidate_pool = lanes[:min(4, len(lanes))]
         else:
             candidate_pool = lanes
         if not candidate_pool:
             break
-        lane = random.choice(candidate_pool)
+        lane = rng.choice(candidate_pool)
 
         lane_diff = 0 if last_lane is None else abs(lane - last_lane)
         lane_factor = lane_diff / max(1, COLS - 1)
@@ -104,27 +107,19 @@ def spawn_collector_stars(state: GameState, difficulty_name: str) -> None:
 
             z = COLLECTOR_Z_SPAWN - max_total_back
 
-        z += random.uniform(-1.0, 1.0)
+        z += rng.uniform(-1.0, 1.0)
 
-        conflict = False
-        for act_lane, act_z in active_positions:
-            if abs(z - act_z) < 6.0:
-                conflict = True
-                break
-        if conflict:
+        if any(abs(z - act_z) < 6.0 for act_z in active_z):
             continue
 
-        x = float(lane) + random.uniform(-0.15, 0.15)
-        size = random.uniform(0.45, 0.55)
+        x = float(lane) + rng.uniform(-0.15, 0.15)
+        size = rng.uniform(0.45, 0.55)
         color = (1.0, 0.9, 0.2)
-        spin_angle = random.uniform(0.0, 360.0)
-        spin_speed = random.uniform(40.0, 60.0)
-        state.objects.stars.append([
-            x, 0, z, 'collector_star', size,
-            color[0], color[1], color[2], 0,
-            spin_angle, spin_speed
-        ])
-        active_positions.append((lane, z))
+        spin_angle = rng.uniform(0.0, 360.0)
+        spin_speed = rng.uniform(40.0, 60.0)
+        row = stars.append(x, 0, z, KIND_COLLECTOR_STAR, size, color, 0, spin_angle, spin_speed)
+        state.objects.lane_index.insert(stars, row)
+        active_z.append(z)
         last_lane = lane
         last_z = z
         spawned += 1
@@ -134,34 +129,35 @@ def update_stars(state: GameState, difficulty_name: str, delta: float) -> bool:
     cfg = DIFFICULTY.get(difficulty_name, DIFFICULTY['Normal'])
     base_speed = cfg['star_speed']
     player = state.player
-    new_stars: List[list] = []
+    stars = state.objects.stars
     slow_factor = 0.5 if state.effects.global_slow_time > 0 else 1.0
-    for star in state.objects.stars:
-        kind = star[STAR_KIND]
-        size = star[STAR_SIZE]
-        move_factor = 1.2 if kind == 'enemy' else 1.0
-        star_speed = base_speed * move_factor * slow_factor
-        star[STAR_Z] += delta * star_speed
-        if len(star) > STAR_SPIN_SPEED:
-            star[STAR_SPIN_ANGLE] = (star[STAR_SPIN_ANGLE] + star[STAR_SPIN_SPEED] * delta) % 360
-        z_hit_thresh = max(0.6, size * 1.0)
-        x_hit_thresh = max(0.5, size * 0.7)
-        if abs(star[STAR_X] - player.x) < x_hit_thresh and abs(star[STAR_Z] - player.z) < z_hit_thresh:
-            if kind == 'pickup':
-                _apply_pickup(state)
-                create_explosion(state, star[STAR_X], star[STAR_Y], star[STAR_Z])
-                state.score += 2
-                continue
-            if player.shield_time > 0:
-                player.shield_time = 0
-                create_explosion(state, player.x, 0.2, player.z)
-                state.score += 5 if kind == 'enemy' else 2
-                continue
+    kind = stars.kind
+    size = stars.size
+    star_speed = np.where(kind == KIND_ENEMY, 1.2, 1.0) * (base_speed * slow_factor)
+    stars.z += delta * star_speed
+    _advance_spin(stars, delta)
+    x, z = stars.x, stars.z
+    hit = (np.abs(x - player.x) < np.maximum(0.5, size * 0.7)) & (np.abs(z - player.z) < np.maximum(0.6, size))
+    keep = (z < 8.0) & ~hit
+    # Colisões são raras: tratar em ordem, como na iteração original
+    for i in np.flatnonzero(hit).tolist():
+        if kind[i] == KIND_PICKUP:
+            _apply_pickup(state)
+            create_explosion(state, float(x[i]), float(stars.y[i]), float(z[i]))
+            state.score += 2
+            continue
+        if player.shield_time > 0:
+            player.shield_time = 0
             create_explosion(state, player.x, 0.2, player.z)
-            return False
-        if star[STAR_Z] < 8.0:
-            new_stars.append(star)
-    state.objects.stars = new_stars
+            state.score += 5 if kind[i] == KIND_ENEMY else 2
+            continue
+        create_explosion(state, player.x, 0.2, player.z)
+        # Sem compactar, como no original, mas update_shots ainda roda neste tick:
+        # o índice precisa ver as posições já movidas
+        state.objects.lane_index.rebuild(stars)
+        return False
+    stars.compact(keep)
+    state.objects.lane_index.rebuild(stars)
     return True
 
 
@@ -169,79 +165,115 @@ def update_collector_stars(state: GameState, difficulty_name: str, delta: float)
     cfg = COLLECTOR_DIFFICULTY.get(difficulty_name, COLLECTOR_DIFFICULTY['Normal'])
     base_speed = cfg['star_speed']
     player = state.player
-    new_stars: List[list] = []
-    for star in state.objects.stars:
-        if star[STAR_KIND] != 'collector_star':
-            continue
-        size = star[STAR_SIZE]
-        star[STAR_Z] += delta * base_speed
-        if len(star) > STAR_SPIN_SPEED:
-            star[STAR_SPIN_ANGLE] = (star[STAR_SPIN_ANGLE] + star[STAR_SPIN_SPEED] * delta) % 360
-        z_hit_thresh = max(0.6, size * 1.2)
-        x_hit_thresh = max(0.6, size * 1.0)
-        if abs(star[STAR_X] - player.x) < x_hit_thresh and abs(star[STAR_Z] - player.z) < z_hit_thresh:
-            create_explosion(state, star[STAR_X], star[STAR_Y], star[STAR_Z])
-            state.score += 1
-            continue
-        if star[STAR_Z] > player.z + 2.0:
-            state.missed_stars += 1
-            if state.missed_stars >= cfg['max_misses']:
-                return False
-            continue
-        if star[STAR_Z] < player.z + 15.0:
-            new_stars.append(star)
-    state.objects.stars = new_stars
+    stars = state.objects.stars
+    stars.z += delta * base_speed
+    _advance_spin(stars, delta)
+    size = stars.size
+    x, z = stars.x, stars.z
+    active = stars.kind == KIND_COLLECTOR_STAR
+    hit = active & (np.abs(x - player.x) < np.maximum(0.6, size)) & (np.abs(z - player.z) < np.maximum(0.6, size * 1.2))
+    missed = active & ~hit & (z > player.z + 2.0)
+    missed_rows = np.flatnonzero(missed)
+    # Na ordem do laço original: a falta que encerra o jogo interrompe a contagem,
+    # e os acertos depois dela não pontuam
+    allowed = max(1, cfg['max_misses'] - state.missed_stars)
+    game_over = len(missed_rows) >= allowed
+    last = int(missed_rows[allowed - 1]) if game_over else len(stars)
+    for i in np.flatnonzero(hit[:last]).tolist():
+        create_explosion(state, float(x[i]), float(stars.y[i]), float(z[i]))
+        state.score += 1
+    if game_over:
+        state.missed_stars += allowed
+        return False
+    state.missed_stars += len(missed_rows)
+    stars.compact(active & ~hit & ~missed & (z < player.z + 15.0))
+    state.objects.lane_index.rebuild(stars)
     return True
 
 
+def _advance_spin(stars: EntityStore, delta: float) -> None:
+    angle = stars.spin_angle
+    angle += stars.spin_speed * delta
+    np.mod(angle, 360.0, out=angle)
+
+
 def fire_shot(state: GameState) -> None:
     if state.player.shot_charge < 1.0:
         return
     state.player.shot_charge = 0.0
-    state.objects.shots.append([state.player.x, 0, state.player.z])
+    state.objects.shots.acquire(state.player.x, 0, state.player.z, state.player.z)
 
 
 def update_shots(state: GameState, delta: float) -> None:
-    new_shots = []
+    if not len(state.objects.shots):
+        return
+    stars = state.objects.stars
+    index = state.objects.lane_index
+    index.sync(stars)
+    reach_z = 0.2 + delta * 20
+    # Broadphase: janela pela maior largura de acerto possível; o teste exato vem depois
+    reach_x = max(0.2, float(stars.size.max()) - 0.1) if len(stars) else 0.0
+    destroyed: set[int] = set()
+    drops: List[tuple[float, float]] = []
+    spent: List[list] = []
     for shot in state.objects.shots:
+        shot[3] = shot[2]
         shot[2] -= delta * 20
         if shot[2] <= -75.0:
+            spent.append(shot)
             continue
-        hit = None
-        for star in state.objects.stars:
-            size = star[4]
-            if abs(star[0] - shot[0]) < max(0.2, size - 0.1) and abs(star[2] - shot[2]) < 0.2 + delta * 20:
-                hit = star
-                break
-        if hit:
-            kind = hit[3]
-            if kind == 'pickup':
-                _apply_pickup(state)
-                create_explosion(state, hit[0], hit[1], hit[2])
-                state.objects.stars.remove(hit)
-            else:
-                if len(hit) > 8 and hit[8] > 1:
-                    hit[8] -= 1
-                else:
-                    create_explosion(state, hit[0], hit[1], hit[2])
-                    state.objects.stars.remove(hit)
-                    if kind == 'enemy':
-                        state.score += 15
-                        if random.random() < 0.25:
-                            px, pz = _resolve_spacing(state, hit[0], hit[2] - 2.0)
-                            size = random.uniform(0.25, 0.4)
-                            color = (0.2, 1.0, 0.6)
-                            spin_angle, spin_speed = _spin_profile('pickup')
-                            state.objects.stars.append([px, 0, pz, 'pickup', size, color[0], color[1], color[2], 0, spin_angle, spin_speed])
-                    else:
-                        state.score += 5
+        hit = _first_hit(stars, index, shot, reach_x, reach_z, destroyed)
+        if hit is None:
+            continue
+        spent.append(shot)
+        kind = int(stars.kind[hit])
+        hx, hy, hz = (float(v) for v in stars.pos[hit])
+        if kind == KIND_PICKUP:
+            _apply_pickup(state)
+            create_explosion(state, hx, hy, hz)
+            destroyed.add(hit)
+        elif stars.hp[hit] > 1:
+            stars.hp[hit] -= 1
         else:
-            new_shots.append(shot)
-    state.objects.shots = new_shots
+            create_explosion(state, hx, hy, hz)
+            destroyed.add(hit)
+            if kind == KIND_ENEMY:
+                state.score += 15
+                if state.rng.pickups.random() < 0.25:
+                    drops.append((hx, hz - 2.0))
+            else:
+                state.score += 5
+    state.objects.shots.release(spent)
+    # Remoções em lote (uma compactação) e só depois os novos pickups; o índice acompanha
+    # sem reordenar, então os pickups entram por insert e _resolve_spacing não reconstrói
+    if destroyed:
+        stars.remove(sorted(destroyed))
+        index.remove(stars, destroyed)
+    rng = state.rng.pickups
+    for x, z in drops:
+        px, pz = _resolve_spacing(state, x, z)
+        size = rng.uniform(0.25, 0.4)
+        color = (0.2, 1.0, 0.6)
+        spin_angle, spin_speed = _spin_profile(KIND_PICKUP, rng)
+        row = stars.append(px, 0, pz, KIND_PICKUP, size, color, 0, spin_angle, spin_speed)
+        index.insert(stars, row)
+
+
+def _first_hit(stars: EntityStore, index: LaneIndex, shot: List[float], reach_x: float, reach_z: float,
+               destroyed: set[int]) -> int | None:
+    # Primeiro na ordem do store, como na varredura linear original
+    best = None
+    x, size = stars.x, stars.size
+    for row in index.query(shot[0], shot[2], reach_x, reach_z):
+        if row in destroyed or (best is not None and row > best):
+            continue
+        if abs(x[row] - shot[0]) < max(0.2, size[row] - 0.1):
+            best = row
+    return best
 
 
 def _apply_pickup(state: GameState) -> None:
-    r = random.random()
+    r = state.rng.pickups.random()
     if r < 0.5:
         state.player.shield_time = max(state.player.shield_time, 5.0)
     elif r < 0.85:
@@ -250,23 +282,22 @@ def _apply_pickup(state: GameState) -> None:
         state.player.shot_charge = 1.0
 
 
-def _pick_spawn_slot(state: GameState, lane: int) -> tuple[float, float]:
+def _pick_spawn_slot(state: GameState, lane: int, rng: random.Random) -> tuple[float, float]:
     for attempt in range(8):
-        x = float(lane) + random.uniform(-0.18, 0.18)
-        z = random.uniform(*Z_SPAWN_RANGE)
+        x = float(lane) + rng.uniform(-0.18, 0.18)
+        z = rng.uniform(*Z_SPAWN_RANGE)
         if _position_is_clear(state, x, z):
             return x, z
     
-    x = float(lane) + random.uniform(-0.22, 0.22)
-    z = random.uniform(Z_SPAWN_RANGE[0] - 10.0, Z_SPAWN_RANGE[1])
+    x = float(lane) + rng.uniform(-0.22, 0.22)
+    z = rng.uniform(Z_SPAWN_RANGE[0] - 10.0, Z_SPAWN_RANGE[1])
     return _resolve_spacing(state, x, z)
 
 
 def _position_is_clear(state: GameState, x: float, z: float) -> bool:
-    for obj in state.objects.stars:
-        if abs(obj[0] - x) < MIN_SPAWN_GAP_X and abs(obj[2] - z) < MIN_SPAWN_GAP_Z:
-            return False
-    return True
+    index = state.objects.lane_index
+    index.sync(state.objects.stars)
+    return not index.any_within(x, z, MIN_SPAWN_GAP_X, MIN_SPAWN_GAP_Z)
 
 
 def _resolve_spacing(state: GameState, x: float, z: float, step: float = 4.0) -> tuple[float, float]:
@@ -277,14 +308,14 @@ def _resolve_spacing(state: GameState, x: float, z: float, step: float = 4.0) ->
     return x, z
 
 
-def _spin_profile(kind: str) -> tuple[float, float]:
-    base_angle = random.uniform(0.0, 360.0)
-    if kind == 'asteroid':
-        speed = random.uniform(-70.0, 70)
-    elif kind == 'enemy':
+def _spin_profile(kind: int, rng: random.Random) -> tuple[float, float]:
+    base_angle = rng.uniform(0.0, 360.0)
+    if kind == KIND_ASTEROID:
+        speed = rng.uniform(-70.0, 70)
+    elif kind == KIND_ENEMY:
         speed = 0.0
-    elif kind == 'pickup':
-        speed = random.uniform(20.0, 35.0)
+    elif kind == KIND_PICKUP:
+        speed = rng.uniform(20.0, 35.0)
     else:
-        speed = random.uniform(8.0, 16.0)
+        speed = rng.uniform(8.0, 16.0)
     return base_angle, speed
@@ -0,0 +1,50 @@
+"""Mesh templates shared by the renderer, as plain tuples and numpy arrays (no GL)."""
+
+from __future__ import annotations
+
+import math
+
+import numpy as np
+
+CUBE_FACES = [
+    ((0, 0, 1), ((-0.5, -0.5, 0.5), (0.5, -0.5, 0.5), (0.5, 0.5, 0.5), (-0.5, 0.5, 0.5))),
+    ((0, 0, -1), ((-0.5, -0.5, -0.5), (-0.5, 0.5, -0.5), (0.5, 0.5, -0.5), (0.5, -0.5, -0.5))),
+    ((-1, 0, 0), ((-0.5, -0.5, -0.5), (-0.5, -0.5, 0.5), (-0.5, 0.5, 0.5), (-0.5, 0.5, -0.5))),
+    ((1, 0, 0), ((0.5, -0.5, -0.5), (0.5, 0.5, -0.5), (0.5, 0.5, 0.5), (0.5, -0.5, 0.5))),
+    ((0, 1, 0), ((-0.5, 0.5, -0.5), (-0.5, 0.5, 0.5), (0.5, 0.5, 0.5), (0.5, 0.5, -0.5))),
+    ((0, -1, 0), ((-0.5, -0.5, -0.5), (0.5, -0.5, -0.5), (0.5, -0.5, 0.5), (-0.5, -0.5, 0.5))),
+]
+
+STAR_MAIN_FAN = []
+STAR_GLOW_FAN = []
+for i in range(11):
+    ang = math.radians(i * 36.0)
+    r_main = 1.0 if i % 2 == 0 else 0.4
+    r_glow = 1.4 if i % 2 == 0 else 0.6
+    STAR_MAIN_FAN.append((r_main * math.cos(ang), r_main * math.sin(ang)))
+    STAR_GLOW_FAN.append((r_glow * math.cos(ang), r_glow * math.sin(ang)))
+
+
+def _quad_triangles(quad) -> list:
+    a, b, c, d = quad
+    return [a, b, c, a, c, d]
+
+
+def _fan_triangles(fan) -> list:
+    # Leque fechado (primeiro ponto == último) -> triângulos soltos a partir do centro
+    tris = []
+    for p, q in zip(fan, fan[1:]):
+        tris += [(0.0, 0.0), p, q]
+    return tris
+
+
+# Cubo unitário centrado na origem, 36 vértices (12 triângulos)
+CUBE_TRIANGLES = np.array([v for _, face in CUBE_FACES for v in _quad_triangles(face)], dtype=np.float32)
+CUBE_TRIANGLE_NORMALS = np.repeat(np.array([n for n, _ in CUBE_FACES], dtype=np.float32), 6, axis=0)
+
+# Quadrado de lado 2 no plano xy (partículas de explosão)
+SPRITE_TRIANGLES = np.array(_quad_triangles(((-1, -1), (1, -1), (1, 1), (-1, 1))), dtype=np.float32)
+
+# Estrela coletável: corpo e brilho, um após o outro, no plano xy
+STAR_MAIN_TRIANGLES = np.array(_fan_triangles(STAR_MAIN_FAN), dtype=np.float32)
+STAR_GLOW_TRIANGLES = np.array(_fan_triangles(STAR_GLOW_FAN), dtype=np.float32)
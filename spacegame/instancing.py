@@ -0,0 +1,169 @@
+"""Instanced drawing of lit model meshes (asteroids, enemies)."""
+
+from __future__ import annotations
+
+import ctypes
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+from OpenGL.GL import (
+    GL_ARRAY_BUFFER,
+    GL_FLOAT,
+    GL_STATIC_DRAW,
+    GL_STREAM_DRAW,
+    GL_TRIANGLES,
+    glBindBuffer,
+    glBufferData,
+    glDisableVertexAttribArray,
+    glDrawArraysInstanced,
+    glEnableVertexAttribArray,
+    glGenBuffers,
+    glGetUniformLocation,
+    glUniform1f,
+    glUniform3f,
+    glUseProgram,
+    glVertexAttribDivisor,
+    glVertexAttribPointer,
+)
+
+from .shaders import link_program
+
+# Iluminação por vértice igual à do pipeline fixo (LIGHT0 pontual, observador no infinito,
+# normais sem normalizar), para que a troca de caminho não mude o visual
+VERTEX_SHADER = """
+#version 120
+attribute vec3 a_position;
+attribute vec3 a_normal;
+attribute vec3 i_offset;
+attribute float i_scale;
+attribute float i_spin;
+attribute vec3 i_ambient;
+attribute vec3 i_diffuse;
+attribute vec3 i_emission;
+uniform vec3 u_spin_axis;
+uniform vec3 u_specular;
+uniform float u_shininess;
+varying vec4 v_color;
+
+mat3 rotation(float degrees, vec3 axis) {
+    float r = radians(degrees);
+    float c = cos(r), s = sin(r), t = 1.0 - c;
+    vec3 a = normalize(axis);
+    return mat3(t * a.x * a.x + c,       t * a.x * a.y + s * a.z, t * a.x * a.z - s * a.y,
+                t * a.x * a.y - s * a.z, t * a.y * a.y + c,       t * a.y * a.z + s * a.x,
+                t * a.x * a.z + s * a.y, t * a.y * a.z - s * a.x, t * a.z * a.z + c);
+}
+
+void main() {
+    mat3 spin = rotation(i_spin, u_spin_axis);
+    vec4 eye = gl_ModelViewMatrix * vec4(i_offset + spin * (a_position * i_scale), 1.0);
+    vec3 n = gl_NormalMatrix * (spin * (a_normal / i_scale));
+    vec3 l = normalize(gl_LightSource[0].position.xyz - eye.xyz);
+    float diffuse = dot(n, l);
+    vec3 color = i_emission
+        + gl_LightModel.ambient.rgb * i_ambient
+        + gl_LightSource[0].ambient.rgb * i_ambient
+        + max(diffuse, 0.0) * gl_LightSource[0].diffuse.rgb * i_diffuse;
+    if (diffuse > 0.0) {
+        float highlight = max(dot(n, normalize(l + vec3(0.0, 0.0, 1.0))), 0.0);
+        color += pow(highlight, u_shininess) * gl_LightSource[0].specular.rgb * u_specular;
+    }
+    v_color = vec4(clamp(color, 0.0, 1.0), 1.0);
+    gl_Position = gl_ProjectionMatrix * eye;
+}
+"""
+
+FRAGMENT_SHADER = """
+#version 120
+varying vec4 v_color;
+void main() {
+    gl_FragColor = v_color;
+}
+"""
+
+# Atributos por vértice e por instância: (nome, componentes)
+_MESH_ATTRIBUTES = (('a_position', 3), ('a_normal', 3))
+_INSTANCE_ATTRIBUTES = (('i_offset', 3), ('i_scale', 1), ('i_spin', 1),
+                        ('i_ambient', 3), ('i_diffuse', 3), ('i_emission', 3))
+INSTANCE_WIDTH = sum(size for _, size in _INSTANCE_ATTRIBUTES)
+
+
+class InstancedModels:
+    """Model meshes uploaded once and drawn with one instanced call per kind.
+
+    Per frame the caller packs one row per object (see ``instance_rows``)
+    and :meth:`draw` streams them into a shared instance buffer, so the
+    number of draw calls stays fixed however many objects are on screen.
+    """
+
+    def __init__(self) -> None:
+        self.program = None
+        self.meshes: Dict[str, Tuple[int, int]] = {}  # nome -> (vbo, vértices)
+        self.instance_vbo = None
+        self.locations: Dict[str, int] = {}
+        self.draw_calls = 0
+
+    @staticmethod
+    def supported() -> bool:
+        return bool(glDrawArraysInstanced) and bool(glVertexAttribDivisor)
+
+    def initialize(self, meshes: Dict[str, np.ndarray]) -> None:
+        """Compile the shader and upload ``{name: vertices}`` ((n, 6) position + normal); raises ShaderError."""
+        self.program = link_program(VERTEX_SHADER, FRAGMENT_SHADER,
+                                    [name for name, _ in _MESH_ATTRIBUTES + _INSTANCE_ATTRIBUTES])
+        for name in ('u_spin_axis', 'u_specular', 'u_shininess'):
+            self.locations[name] = glGetUniformLocation(self.program, name)
+        for name, vertices in meshes.items():
+            vbo = glGenBuffers(1)
+            glBindBuffer(GL_ARRAY_BUFFER, vbo)
+            glBufferData(GL_ARRAY_BUFFER, np.ascontiguousarray(vertices, dtype=np.float32), GL_STATIC_DRAW)
+            self.meshes[name] = (vbo, len(vertices))
+        self.instance_vbo = glGenBuffers(1)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+
+    def draw(self, name: str, rows: np.ndarray, specular, shininess: float,
+             spin_axis=(0.0, 1.0, 0.0)) -> None:
+        """Draw ``rows`` (n, INSTANCE_WIDTH) instances of mesh ``name``."""
+        if not len(rows):
+            return
+        vbo, vertex_count = self.meshes[name]
+        glUseProgram(self.program)
+        glUniform3f(self.locations['u_spin_axis'], *spin_axis)
+        glUniform3f(self.locations['u_specular'], *specular)
+        glUniform1f(self.locations['u_shininess'], shininess)
+        glBindBuffer(GL_ARRAY_BUFFER, vbo)
+        _attribute_pointers(_MESH_ATTRIBUTES, 0, divisor=0)
+        glBindBuffer(GL_ARRAY_BUFFER, self.instance_vbo)
+        glBufferData(GL_ARRAY_BUFFER, np.ascontiguousarray(rows, dtype=np.float32), GL_STREAM_DRAW)
+        _attribute_pointers(_INSTANCE_ATTRIBUTES, len(_MESH_ATTRIBUTES), divisor=1)
+        glDrawArraysInstanced(GL_TRIANGLES, 0, vertex_count, len(rows))
+        for index in range(len(_MESH_ATTRIBUTES) + len(_INSTANCE_ATTRIBUTES)):
+            glVertexAttribDivisor(index, 0)
+            glDisableVertexAttribArray(index)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+        glUseProgram(0)
+        self.draw_calls += 1
+
+
+def instance_rows(offsets: np.ndarray, scales: np.ndarray, spins: np.ndarray, ambient: np.ndarray,
+                  diffuse: np.ndarray, emission: Optional[np.ndarray] = None) -> np.ndarray:
+    """Pack per-object columns into the instance layout expected by :meth:`InstancedModels.draw`."""
+    rows = np.zeros((len(offsets), INSTANCE_WIDTH), dtype=np.float32)
+    rows[:, 0:3] = offsets
+    rows[:, 3] = scales
+    rows[:, 4] = spins
+    rows[:, 5:8] = ambient
+    rows[:, 8:11] = diffuse
+    if emission is not None:
+        rows[:, 11:14] = emission
+    return rows
+
+
+def _attribute_pointers(attributes, first_index: int, divisor: int) -> None:
+    stride = sum(size for _, size in attributes) * 4
+    offset = 0
+    for index, (_, size) in enumerate(attributes, first_index):
+        glEnableVertexAttribArray(index)
+        glVertexAttribPointer(index, size, GL_FLOAT, False, stride, ctypes.c_void_p(offset))
+        glVertexAttribDivisor(index, divisor)
+        offset += size * 4
@@ -0,0 +1,167 @@
+"""Model meshes, built once and then memory-mapped from a binary cache.
+
+A mesh is an interleaved float32 array of ``(x, y, z, nx, ny, nz)`` per
+vertex, three vertices per triangle, in the same model space as the
+procedural parts of :mod:`spacegame.models` (nose towards -z, about one
+unit across); ``MODEL_SCALE_*`` applies on top. A model comes from its
+authored ``.obj`` when there is a readable one, otherwise from its
+procedural parts baked into a single mesh.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import struct
+import tempfile
+from typing import Dict, List, NamedTuple, Optional
+
+import numpy as np
+
+from .models import MODEL_PARTS, Part, bake_parts
+from .textures import default_cache_dir
+
+MODEL_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'models')
+MODEL_FILES = {'ship': 'ship.obj', 'asteroid': 'asteroid.obj', 'enemy': 'enemy.obj'}
+
+# Cabeçalho do cache: assinatura, vértices, floats por vértice; depois os floats
+_MAGIC = b'SGMESH01'
+_HEADER = struct.Struct('<8sII')
+_STRIDE = 6
+# Mudar quando parse_obj / bake_parts mudarem o resultado, para invalidar os caches antigos
+OBJ_VERSION = 1
+BAKE_VERSION = 1
+
+
+class Mesh(NamedTuple):
+    vertices: np.ndarray  # (n, 6) float32 intercalado, posição e normal
+
+    @property
+    def positions(self) -> np.ndarray:
+        return self.vertices[:, :3]
+
+    @property
+    def normals(self) -> np.ndarray:
+        return self.vertices[:, 3:]
+
+
+def cache_path(path: str, cache_dir: str) -> str:
+    """Cache file for the mesh at ``path``, named by the hash of its contents and ``OBJ_VERSION``."""
+    digest = hashlib.sha1(f"obj{OBJ_VERSION}|".encode('utf-8'))
+    with open(path, 'rb') as fh:
+        for chunk in iter(lambda: fh.read(1 << 20), b''):
+            digest.update(chunk)
+    return os.path.join(cache_dir, digest.hexdigest() + '.mesh')
+
+
+def baked_cache_path(parts: List[Part], cache_dir: str) -> str:
+    """Cache file for the baked ``parts``, named by the hash of their description."""
+    key = f"bake{BAKE_VERSION}|{parts!r}"
+    return os.path.join(cache_dir, hashlib.sha1(key.encode('utf-8')).hexdigest() + '.mesh')
+
+
+def load_mesh(path: str, cache_dir: Optional[str] = None) -> Mesh:
+    """The mesh in the ``.obj`` at ``path``, memory-mapped from the cache when it has it.
+
+    A miss parses with pywavefront and writes the cache; a cache that
+    cannot be read or written is skipped, never fatal.
+    """
+    cached = cache_path(path, cache_dir) if cache_dir else None
+    return _cached_mesh(cached, lambda: parse_obj(path))
+
+
+def bake_mesh(parts: List[Part], cache_dir: Optional[str] = None) -> Mesh:
+    """``parts`` flattened into one mesh by :func:`bake_parts`, memory-mapped from the cache when it has it."""
+    cached = baked_cache_path(parts, cache_dir) if cache_dir else None
+    return _cached_mesh(cached, lambda: Mesh(np.ascontiguousarray(np.hstack(bake_parts(parts)))))
+
+
+def _cached_mesh(cached: Optional[str], build) -> Mesh:
+    # Cache ilegível ou impossível de gravar (disco só leitura) é ignorado, nunca fatal
+    if cached and os.path.exists(cached):
+        try:
+            return read_mesh(cached)
+        except Exception:
+            pass
+    mesh = build()
+    if cached:
+        try:
+            write_mesh(cached, mesh)
+        except Exception:
+            pass
+    return mesh
+
+
+def parse_obj(path: str) -> Mesh:
+    """Triangles of every material in the ``.obj`` at ``path``; faces without normals get flat ones."""
+    import pywavefront
+
+    scene = pywavefront.Wavefront(path, create_materials=True, parse=True)
+    chunks = []
+    for material in scene.materials.values():
+        if not material.vertices:
+            continue
+        # Formato tipo 'T2F_N3F_V3F': achar onde começam a normal e a posição
+        layout, offset = {}, 0
+        for component in material.vertex_format.split('_'):
+            layout[component[0]] = offset
+            offset += int(component[1])
+        data = np.asarray(material.vertices, dtype=np.float32).reshape(-1, offset)
+        positions = data[:, layout['V']:layout['V'] + 3]
+        if 'N' in layout:
+            normals = data[:, layout['N']:layout['N'] + 3]
+        else:
+            normals = _flat_normals(positions)
+        chunks.append(np.hstack((positions, normals)))
+    if not chunks:
+        raise ValueError(f"no faces in {path}")
+    return Mesh(np.ascontiguousarray(np.concatenate(chunks), dtype=np.float32))
+
+
+def _flat_normals(positions: np.ndarray) -> np.ndarray:
+    triangles = positions.reshape(-1, 3, 3)
+    normals = np.cross(triangles[:, 1] - triangles[:, 0], triangles[:, 2] - triangles[:, 0])
+    lengths = np.linalg.norm(normals, axis=1, keepdims=True)
+    normals /= np.where(lengths > 0.0, lengths, 1.0)
+    return np.repeat(normals, 3, axis=0)
+
+
+def load_models(model_dir: str = MODEL_DIR, cache_dir: Optional[str] = None) -> Dict[str, Mesh]:
+    """A mesh for every model in ``MODEL_PARTS``: the ``.obj`` in ``model_dir`` if readable, else the baked parts."""
+    cache_dir = (default_cache_dir('meshes') if cache_dir is None else cache_dir) or None
+    meshes = {}
+    for name, parts in MODEL_PARTS.items():
+        path = os.path.join(model_dir, MODEL_FILES.get(name, name + '.obj'))
+        if os.path.exists(path):
+            try:
+                meshes[name] = load_mesh(path, cache_dir)
+                continue
+            except Exception:
+                pass
+        meshes[name] = bake_mesh(parts, cache_dir)
+    return meshes
+
+
+def read_mesh(cached: str) -> Mesh:
+    """Memory-map a mesh file written by :func:`write_mesh` (zero copy); raises ValueError if malformed."""
+    with open(cached, 'rb') as fh:
+        magic, count, stride = _HEADER.unpack(fh.read(_HEADER.size))
+    if magic != _MAGIC or stride != _STRIDE or os.path.getsize(cached) != _HEADER.size + count * stride * 4:
+        raise ValueError(f"bad mesh cache file {cached}")
+    return Mesh(np.memmap(cached, dtype=np.float32, mode='r', offset=_HEADER.size, shape=(count, stride)))
+
+
+def write_mesh(cached: str, mesh: Mesh) -> None:
+    """Save ``mesh`` to ``cached`` atomically, creating the folder if needed."""
+    folder = os.path.dirname(cached)
+    os.makedirs(folder, exist_ok=True)
+    # Escrever ao lado e renomear: outro processo nunca lê um arquivo pela metade
+    fd, tmp = tempfile.mkstemp(dir=folder, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as fh:
+            fh.write(_HEADER.pack(_MAGIC, len(mesh.vertices), _STRIDE))
+            fh.write(np.ascontiguousarray(mesh.vertices, dtype=np.float32).tobytes())
+        os.replace(tmp, cached)
+    except BaseException:
+        os.unlink(tmp)
+        raise
@@ -0,0 +1,105 @@
+"""Procedural models described as stacks of transformed unit cubes.
+
+Each part is ``(translate, rotate, scale)`` with ``rotate`` either None or
+``(degrees, axis)``, applied in that order as with ``glTranslatef`` /
+``glRotatef`` / ``glScalef``. :func:`bake_parts` applies those transforms
+once on the CPU and flattens a model into plain triangle arrays;
+:mod:`spacegame.meshes` caches the result and the renderer draws each
+model as one flat mesh.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .geometry import CUBE_TRIANGLE_NORMALS, CUBE_TRIANGLES
+
+Vec3 = Tuple[float, float, float]
+Part = Tuple[Vec3, Optional[Tuple[float, Vec3]], Vec3]
+
+
+def _ship_parts() -> List[Part]:
+    parts: List[Part] = [
+        ((0.0, 0.0, 0.0), None, (0.32, 0.22, 1.4)),
+        ((0.0, 0.05, -0.85), None, (0.18, 0.16, 0.35)),
+        ((0.0, 0.12, -0.45), None, (0.26, 0.2, 0.45)),
+        ((0.0, -0.18, -0.15), None, (0.22, 0.1, 0.8)),
+    ]
+    for x_dir in (-0.32, 0.32):
+        parts.append(((x_dir, -0.04, -0.2), None, (0.18, 0.06, 0.95)))
+    for x_dir in (-0.28, 0.28):
+        parts.append(((x_dir, 0.14, -0.55), None, (0.08, 0.2, 0.35)))
+    parts.append(((0.0, 0.28, -0.1), None, (0.12, 0.4, 0.55)))
+    for offset in (-0.14, 0.14):
+        parts.append(((offset, -0.06, 0.82), None, (0.15, 0.15, 0.32)))
+    return parts
+
+
+def _asteroid_parts() -> List[Part]:
+    chunk_specs = [
+        (0.0, 0.0, 0.0, 0.75),
+        (-0.35, 0.25, -0.15, 0.55),
+        (0.4, -0.15, -0.25, 0.5),
+        (0.0, -0.3, 0.35, 0.45),
+    ]
+    return [((tx, ty, tz), (tx * 60 + tz * 30, (0.3, 1.0, 0.2)), (scale, scale * 1.1, scale))
+            for tx, ty, tz, scale in chunk_specs]
+
+
+def _enemy_parts() -> List[Part]:
+    parts: List[Part] = [
+        ((0.0, 0.0, 0.0), None, (0.32, 0.24, 1.35)),
+        ((0.0, 0.02, -1.05), None, (0.12, 0.14, 0.45)),
+        ((0.0, 0.16, -0.45), None, (0.24, 0.24, 0.5)),
+        ((0.0, -0.22, -0.15), None, (0.26, 0.14, 0.8)),
+    ]
+    for x_dir in (-0.3, 0.3):
+        parts.append(((x_dir, 0.05, -0.15), (18 * x_dir, (0.0, 0.0, 1.0)), (0.1, 0.5, 0.95)))
+    for offset in (-0.12, 0.12):
+        parts.append(((offset, 0.32, 0.1), None, (0.08, 0.35, 0.6)))
+    for offset in (-0.2, 0.2):
+        parts.append(((offset, -0.04, 0.72), None, (0.16, 0.18, 0.5)))
+        parts.append(((offset, -0.02, 0.97), None, (0.12, 0.12, 0.18)))
+    for offset in (-0.38, 0.38):
+        parts.append(((offset, 0.0, -0.2), None, (0.08, 0.08, 0.4)))
+    return parts
+
+
+MODEL_PARTS: Dict[str, List[Part]] = {
+    'ship': _ship_parts(),
+    'asteroid': _asteroid_parts(),
+    'enemy': _enemy_parts(),
+}
+
+
+def rotation_matrix(degrees: float, axis: Vec3) -> np.ndarray:
+    """The 3x3 matrix ``glRotatef(degrees, *axis)`` multiplies by."""
+    x, y, z = np.asarray(axis, dtype=np.float64) / np.linalg.norm(axis)
+    c, s = math.cos(math.radians(degrees)), math.sin(math.radians(degrees))
+    t = 1.0 - c
+    return np.array([
+        [t * x * x + c, t * x * y - s * z, t * x * z + s * y],
+        [t * x * y + s * z, t * y * y + c, t * y * z - s * x],
+        [t * x * z - s * y, t * y * z + s * x, t * z * z + c],
+    ])
+
+
+def bake_parts(parts: List[Part]) -> Tuple[np.ndarray, np.ndarray]:
+    """Triangle positions and normals of ``parts`` in model space, as (n, 3) float32.
+
+    Normals go through the inverse transpose of each part's matrix and are
+    left unnormalised, which is what fixed-function GL does without
+    ``GL_NORMALIZE``; the instanced shader lights them the same way.
+    """
+    positions, normals = [], []
+    for translate, rotate, scale in parts:
+        linear = np.diag(scale)
+        if rotate is not None:
+            linear = rotation_matrix(*rotate) @ linear
+        positions.append(CUBE_TRIANGLES @ linear.T + translate)
+        normals.append(CUBE_TRIANGLE_NORMALS @ np.linalg.inv(linear))
+    return (np.concatenate(positions).astype(np.float32),
+            np.concatenate(normals).astype(np.float32))
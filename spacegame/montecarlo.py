@@ -0,0 +1,159 @@
+"""Monte Carlo difficulty evaluator.
+
+Plays thousands of headless games per difficulty and mode across a
+process pool and reports survival-time and score distributions::
+
+    python -m spacegame.montecarlo --games 2000 --policy greedy
+
+Seeds are split into shards that run on separate cores. Every finished
+game is appended to ``--out`` (JSON lines) and ``--summary`` is rewritten
+as shards finish, so a long sweep can be watched, or stopped, midway.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, Iterable, List, Tuple
+
+import numpy as np
+
+from .bots import POLICIES, resolve_policy
+from .constants import DIFFICULTY_KEYS, GAME_MODE_COLLECTOR, GAME_MODE_SURVIVAL, SIM_HZ, STATE_GAMEOVER
+from .simulation import Simulator
+
+MODES = {'survival': GAME_MODE_SURVIVAL, 'collector': GAME_MODE_COLLECTOR}
+PERCENTILES = (10, 50, 90)
+
+# (modo, dificuldade, política, primeira semente, quantidade, limite de passos)
+Shard = Tuple[str, str, str, int, int, int]
+
+
+def play_shard(shard: Shard) -> List[dict]:
+    """Play ``count`` consecutive seeds of one configuration (runs in a worker)."""
+    mode, difficulty, policy, first_seed, count, max_ticks = shard
+    factory = resolve_policy(policy)
+    results = []
+    for seed in range(first_seed, first_seed + count):
+        sim = Simulator()
+        sim.start(MODES[mode], difficulty, seed)
+        script = factory(random.Random(f"{seed}:bot"))
+        ticks = sim.run(max_ticks, script=script)
+        state = sim.state
+        results.append({
+            'mode': mode,
+            'difficulty': difficulty,
+            'policy': policy,
+            'seed': seed,
+            'ticks': ticks,
+            'time_alive': round(state.time_alive, 4),
+            'score': state.score,
+            'missed': state.missed_stars,
+            # Pelo estado, não pelos passos: um fim no último passo permitido não estourou o limite
+            'timed_out': state.game_state != STATE_GAMEOVER,
+        })
+    return results
+
+
+def make_shards(modes: Iterable[str], difficulties: Iterable[str], policy: str, games: int,
+                base_seed: int, shard_size: int, max_ticks: int) -> List[Shard]:
+    # Mesmas sementes em toda configuração: diferenças vêm da tabela, não da sorte
+    shards = []
+    for mode in modes:
+        for difficulty in difficulties:
+            for start in range(0, games, shard_size):
+                count = min(shard_size, games - start)
+                shards.append((mode, difficulty, policy, base_seed + start, count, max_ticks))
+    return shards
+
+
+def summarize(rows: List[dict]) -> Dict[str, dict]:
+    groups: Dict[str, List[dict]] = {}
+    for row in rows:
+        groups.setdefault(f"{row['mode']}/{row['difficulty']}", []).append(row)
+    summary = {}
+    for key in sorted(groups):
+        group = groups[key]
+        times = np.array([r['time_alive'] for r in group])
+        scores = np.array([r['score'] for r in group])
+        summary[key] = {
+            'games': len(group),
+            'timed_out': sum(r['timed_out'] for r in group),
+            'time_alive': _distribution(times),
+            'score': _distribution(scores),
+        }
+    return summary
+
+
+def _distribution(values: np.ndarray) -> dict:
+    stats = {'mean': round(float(values.mean()), 3), 'std': round(float(values.std()), 3)}
+    for p, v in zip(PERCENTILES, np.percentile(values, PERCENTILES)):
+        stats[f"p{p}"] = round(float(v), 3)
+    return stats
+
+
+def _write_summary(path: str, summary: Dict[str, dict], meta: dict) -> None:
+    tmp = path + '.tmp'
+    with open(tmp, 'w', encoding='utf-8') as fh:
+        json.dump({'meta': meta, 'results': summary}, fh, indent=2)
+    os.replace(tmp, path)
+
+
+def print_table(summary: Dict[str, dict]) -> None:
+    print(f"{'config':<22}{'games':>7}  {'time p10/p50/p90 (s)':>24}  {'score p10/p50/p90':>20}")
+    for key, s in summary.items():
+        t, sc = s['time_alive'], s['score']
+        times = f"{t['p10']:.1f}/{t['p50']:.1f}/{t['p90']:.1f}"
+        scores = f"{sc['p10']:.0f}/{sc['p50']:.0f}/{sc['p90']:.0f}"
+        print(f"{key:<22}{s['games']:>7}  {times:>24}  {scores:>20}")
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--games', type=int, default=1000, help='games per mode/difficulty')
+    parser.add_argument('--modes', nargs='+', choices=sorted(MODES), default=sorted(MODES))
+    parser.add_argument('--difficulties', nargs='+', choices=DIFFICULTY_KEYS, default=list(DIFFICULTY_KEYS))
+    parser.add_argument('--policy', default='greedy',
+                        help=f"bot policy: {', '.join(POLICIES)} or module:factory")
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1)
+    parser.add_argument('--seed', type=int, default=0, help='first seed of every configuration')
+    parser.add_argument('--shard-size', type=int, default=25, help='games per worker task')
+    parser.add_argument('--max-seconds', type=float, default=300.0, help='cap on simulated seconds per game')
+    parser.add_argument('--out', default='montecarlo_runs.jsonl', help='per-game results (JSON lines)')
+    parser.add_argument('--summary', default='montecarlo_summary.json')
+    args = parser.parse_args(argv)
+
+    resolve_policy(args.policy)  # falhar cedo, antes de subir o pool
+    max_ticks = int(args.max_seconds * SIM_HZ)
+    shards = make_shards(args.modes, args.difficulties, args.policy, args.games,
+                         args.seed, max(1, args.shard_size), max_ticks)
+    meta = {'policy': args.policy, 'games': args.games, 'seed': args.seed, 'max_seconds': args.max_seconds}
+    rows: List[dict] = []
+    started = last_write = time.perf_counter()
+    with open(args.out, 'w', encoding='utf-8') as out, ProcessPoolExecutor(args.workers) as pool:
+        futures = [pool.submit(play_shard, shard) for shard in shards]
+        for done, future in enumerate(as_completed(futures), 1):
+            results = future.result()
+            for row in results:
+                out.write(json.dumps(row) + '\n')
+            out.flush()
+            rows.extend(results)
+            if time.perf_counter() - last_write > 1.0:
+                _write_summary(args.summary, summarize(rows), meta)
+                last_write = time.perf_counter()
+            print(f"\r{done}/{len(shards)} shards, {len(rows)} games, {time.perf_counter() - started:.1f}s",
+                  end='', file=sys.stderr, flush=True)
+    print(file=sys.stderr)
+    summary = summarize(rows)
+    _write_summary(args.summary, summary, meta)
+    print_table(summary)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
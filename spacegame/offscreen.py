@@ -0,0 +1,150 @@
+"""Windowless GL contexts (EGL or OSMesa) for drawing and reading back frames without a display.
+
+PyOpenGL picks its platform when ``OpenGL.GL`` is first imported, so the
+backend has to be chosen before anything imports the renderer::
+
+    from spacegame.offscreen import OffscreenContext
+
+    with OffscreenContext(800, 600) as context:     # selects the backend
+        from spacegame.rendering import Renderer
+        ...
+        renderer.draw_frame(alpha, leaderboard)
+        pixels = context.read_pixels()
+
+Both backends rasterise in software with Mesa (llvmpipe for EGL), so no
+GPU, X server or Wayland compositor is needed.
+"""
+
+from __future__ import annotations
+
+import ctypes
+import os
+import sys
+from typing import Optional
+
+import numpy as np
+
+BACKENDS = ('egl', 'osmesa')
+
+
+class OffscreenError(RuntimeError):
+    """No windowless GL context could be created."""
+
+
+def select_backend(backend: Optional[str] = None) -> str:
+    """Point PyOpenGL at ``backend`` (default ``$PYOPENGL_PLATFORM``, else ``egl``) and return it."""
+    backend = backend or os.environ.get('PYOPENGL_PLATFORM') or 'egl'
+    if backend not in BACKENDS:
+        raise OffscreenError(f"unknown offscreen backend {backend!r}, expected one of {BACKENDS}")
+    if 'OpenGL.GL' in sys.modules and os.environ.get('PYOPENGL_PLATFORM') != backend:
+        raise OffscreenError(f"OpenGL.GL was imported before selecting the {backend!r} backend")
+    os.environ['PYOPENGL_PLATFORM'] = backend
+    if backend == 'egl':
+        # Sem X/Wayland o Mesa cai no llvmpipe
+        os.environ.setdefault('EGL_PLATFORM', 'surfaceless')
+    return backend
+
+
+class OffscreenContext:
+    """A current GL compatibility context with a ``width`` x ``height`` RGBA8 + 24-bit depth framebuffer.
+
+    EGL renders into a pbuffer surface, OSMesa into a client-side
+    buffer; either way :meth:`read_pixels` returns what the last draw
+    left in the colour buffer.
+    """
+
+    def __init__(self, width: int, height: int, backend: Optional[str] = None) -> None:
+        self.width = width
+        self.height = height
+        self.backend = select_backend(backend)
+        self._handles: tuple = ()
+        try:
+            if self.backend == 'egl':
+                self._create_egl()
+            else:
+                self._create_osmesa()
+        except OffscreenError:
+            raise
+        except Exception as exc:
+            # Biblioteca ausente (libEGL/libOSMesa) ou erro do driver
+            raise OffscreenError(f"could not create an {self.backend} context: {exc}") from exc
+
+    def __enter__(self) -> 'OffscreenContext':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def _create_egl(self) -> None:
+        from OpenGL import EGL
+
+        display = EGL.eglGetDisplay(EGL.EGL_DEFAULT_DISPLAY)
+        major, minor = EGL.EGLint(), EGL.EGLint()
+        if not EGL.eglInitialize(display, ctypes.pointer(major), ctypes.pointer(minor)):
+            raise OffscreenError('eglInitialize failed')
+        attributes = _egl_attributes(EGL, [
+            EGL.EGL_SURFACE_TYPE, EGL.EGL_PBUFFER_BIT,
+            EGL.EGL_RED_SIZE, 8, EGL.EGL_GREEN_SIZE, 8, EGL.EGL_BLUE_SIZE, 8, EGL.EGL_ALPHA_SIZE, 8,
+            EGL.EGL_DEPTH_SIZE, 24,
+            EGL.EGL_RENDERABLE_TYPE, EGL.EGL_OPENGL_BIT,
+        ])
+        config, count = EGL.EGLConfig(), EGL.EGLint()
+        if not EGL.eglChooseConfig(display, attributes, ctypes.pointer(config), 1, ctypes.pointer(count)) \
+                or not count.value:
+            raise OffscreenError('no EGL config with an RGBA8 pbuffer, 24-bit depth and desktop OpenGL')
+        surface = EGL.eglCreatePbufferSurface(
+            display, config, _egl_attributes(EGL, [EGL.EGL_WIDTH, self.width, EGL.EGL_HEIGHT, self.height]))
+        EGL.eglBindAPI(EGL.EGL_OPENGL_API)
+        context = EGL.eglCreateContext(display, config, EGL.EGL_NO_CONTEXT, None)
+        if not surface or not context or not EGL.eglMakeCurrent(display, surface, surface, context):
+            raise OffscreenError('could not make the EGL pbuffer context current')
+        self._handles = (display, surface, context)
+
+    def _create_osmesa(self) -> None:
+        from OpenGL import GL, osmesa
+
+        context = osmesa.OSMesaCreateContextExt(osmesa.OSMESA_RGBA, 24, 0, 0, None)
+        if not context:
+            raise OffscreenError('OSMesaCreateContextExt failed')
+        # O OSMesa desenha direto neste buffer
+        self._buffer = (ctypes.c_ubyte * (self.width * self.height * 4))()
+        if not osmesa.OSMesaMakeCurrent(context, self._buffer, GL.GL_UNSIGNED_BYTE, self.width, self.height):
+            raise OffscreenError('OSMesaMakeCurrent failed')
+        self._handles = (context,)
+
+    def read_pixels(self) -> np.ndarray:
+        """The colour buffer as a top-down (height, width, 4) uint8 array."""
+        from OpenGL.GL import GL_PACK_ALIGNMENT, GL_RGBA, GL_UNSIGNED_BYTE, glFinish, glPixelStorei, glReadPixels
+
+        glFinish()
+        glPixelStorei(GL_PACK_ALIGNMENT, 1)
+        data = glReadPixels(0, 0, self.width, self.height, GL_RGBA, GL_UNSIGNED_BYTE)
+        # O GL começa pela linha de baixo
+        return np.frombuffer(data, dtype=np.uint8).reshape(self.height, self.width, 4)[::-1].copy()
+
+    def save(self, path: str) -> None:
+        from PIL import Image
+
+        Image.fromarray(self.read_pixels()[..., :3]).save(path)
+
+    def close(self) -> None:
+        if not self._handles:
+            return
+        if self.backend == 'egl':
+            from OpenGL import EGL
+
+            display, surface, context = self._handles
+            EGL.eglMakeCurrent(display, EGL.EGL_NO_SURFACE, EGL.EGL_NO_SURFACE, EGL.EGL_NO_CONTEXT)
+            EGL.eglDestroyContext(display, context)
+            EGL.eglDestroySurface(display, surface)
+            EGL.eglTerminate(display)
+        else:
+            from OpenGL import osmesa
+
+            osmesa.OSMesaDestroyContext(self._handles[0])
+        self._handles = ()
+
+
+def _egl_attributes(EGL, values: list):
+    values = list(values) + [EGL.EGL_NONE]
+    return (EGL.EGLint * len(values))(*values)
@@ -0,0 +1,76 @@
+"""Simulation-side particle effects stored in a fixed-capacity ring buffer."""
+
+from __future__ import annotations
+
+import numpy as np
+
+from .pools import PoolCounter
+
+# Colunas de cada partícula
+P_X, P_Y, P_Z, P_SIZE, P_LIFE, P_MAXLIFE = range(6)
+
+
+class ParticleRing:
+    """Explosion particles, oldest first, in a preallocated ring.
+
+    Emitting is O(1) and never allocates; once the ring is full the oldest
+    particle is overwritten. Every particle lives ``lifetime`` seconds, so
+    they expire in emission order and ``update`` ages them in one numpy pass
+    and retires expired ones from the tail; a burst of hits costs the same
+    as a single one.
+    """
+
+    def __init__(self, capacity: int = 256, lifetime: float = 0.4) -> None:
+        self.data = np.zeros((capacity, 6), dtype=np.float32)
+        self.lifetime = lifetime
+        self.head = 0  # próximo slot a escrever
+        self.count = 0
+        self.written = 0  # slots já usados alguma vez (até a capacidade)
+        self.counter = PoolCounter()
+
+    def __len__(self) -> int:
+        return self.count
+
+    @property
+    def capacity(self) -> int:
+        return self.data.shape[0]
+
+    def emit(self, x: float, y: float, z: float, size: float = 0.1) -> None:
+        if self.written < self.capacity:
+            self.written += 1
+            self.counter.allocations += 1
+        elif self.count < self.capacity:
+            # O slot da cabeça guarda uma partícula já recolhida
+            self.counter.reuses += 1
+        # Anel cheio: sobrescreve a partícula viva mais antiga (nem alocação nem reuso)
+        self.data[self.head] = (x, y, z, size, 0.0, self.lifetime)
+        self.head = (self.head + 1) % self.capacity
+        self.count = min(self.count + 1, self.capacity)
+
+    def update(self, delta: float) -> None:
+        if not self.count:
+            return
+        for part in self._parts():
+            part[:, P_LIFE] += delta
+            part[:, P_SIZE] += delta * 4
+        # Vida única no anel: expiram na ordem de emissão, basta recolher pela cauda
+        tail = (self.head - self.count) % self.capacity
+        data = self.data
+        while self.count and data[tail, P_LIFE] >= data[tail, P_MAXLIFE]:
+            tail = (tail + 1) % self.capacity
+            self.count -= 1
+
+    def live(self) -> np.ndarray:
+        """Rows of the live particles, oldest first (a copy when the ring wraps)."""
+        parts = self._parts()
+        return parts[0] if len(parts) == 1 else np.concatenate(parts)
+
+    def clear(self) -> None:
+        self.count = 0
+
+    def _parts(self):
+        start = (self.head - self.count) % self.capacity
+        end = start + self.count
+        if end <= self.capacity:
+            return (self.data[start:end],)
+        return (self.data[start:], self.data[:end - self.capacity])
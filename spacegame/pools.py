@@ -0,0 +1,73 @@
+"""Preallocated entity slots and the counters that show whether they are reused."""
+
+from __future__ import annotations
+
+from typing import Iterable, Iterator, List, Tuple
+
+
+class PoolCounter:
+    """Running totals of fresh slot allocations vs reuses, with per-frame deltas."""
+
+    def __init__(self) -> None:
+        self.allocations = 0
+        self.reuses = 0
+        # Deltas do último quadro fechado com end_frame()
+        self.frame_allocations = 0
+        self.frame_reuses = 0
+        self._mark = (0, 0)
+
+    def end_frame(self) -> Tuple[int, int]:
+        self.frame_allocations = self.allocations - self._mark[0]
+        self.frame_reuses = self.reuses - self._mark[1]
+        self._mark = (self.allocations, self.reuses)
+        return self.frame_allocations, self.frame_reuses
+
+
+class SlotPool:
+    """Fixed-width list slots handed out from a free-list.
+
+    ``acquire`` overwrites a released slot in place when one is available,
+    so steady-state spawning and despawning creates no new lists.
+    """
+
+    def __init__(self, width: int, capacity: int = 32) -> None:
+        self.width = width
+        self.active: List[list] = []
+        self._free: List[list] = [[0.0] * width for _ in range(capacity)]
+        self.counter = PoolCounter()
+
+    def __iter__(self) -> Iterator[list]:
+        return iter(self.active)
+
+    def __len__(self) -> int:
+        return len(self.active)
+
+    def acquire(self, *values: float) -> list:
+        if self._free:
+            slot = self._free.pop()
+            self.counter.reuses += 1
+        else:
+            slot = [0.0] * self.width
+            self.counter.allocations += 1
+        slot[:] = values
+        self.active.append(slot)
+        return slot
+
+    def release(self, slots: Iterable[list]) -> None:
+        """Return ``slots`` to the free-list, keeping the others in order."""
+        dead = {id(slot) for slot in slots}
+        if not dead:
+            return
+        active = self.active
+        write = 0
+        for slot in active:
+            if id(slot) in dead:
+                self._free.append(slot)
+            else:
+                active[write] = slot
+                write += 1
+        del active[write:]
+
+    def clear(self) -> None:
+        self._free.extend(self.active)
+        self.active.clear()
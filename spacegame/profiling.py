@@ -0,0 +1,88 @@
+"""Per-phase frame timings kept in a fixed-size ring buffer."""
+
+from __future__ import annotations
+
+import csv
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, Sequence, Tuple
+
+import numpy as np
+
+# Fases de um quadro, na ordem das colunas do CSV
+PHASES = ('events', 'update', 'background', 'moon', 'objects', 'explosions', 'hud', 'overlay', 'flip', 'frame')
+PERCENTILES = (50, 95, 99)
+TIMING_FRAMES = 600
+
+
+class FrameTimings:
+    """Milliseconds spent in each of ``PHASES`` over the last ``capacity`` frames.
+
+    Call :meth:`begin_frame`, time phases with :meth:`phase` (or feed
+    :meth:`add` directly; a phase hit several times in a frame adds up),
+    then :meth:`end_frame` to commit the row. Memory is fixed: the oldest
+    frame is overwritten once the buffer is full. Renderer phases measure
+    CPU submission; GPU work the driver defers shows up in ``flip``.
+    """
+
+    def __init__(self, capacity: int = TIMING_FRAMES, phases: Sequence[str] = PHASES) -> None:
+        self.phases = tuple(phases)
+        self.columns = {name: i for i, name in enumerate(self.phases)}
+        self.samples = np.zeros((capacity, len(self.phases)), dtype=np.float64)
+        self.current = np.zeros(len(self.phases), dtype=np.float64)
+        self.count = 0  # quadros gravados no total (a posição no anel é count % capacity)
+        self._frame_start = 0.0
+
+    @property
+    def capacity(self) -> int:
+        return self.samples.shape[0]
+
+    def begin_frame(self) -> None:
+        self.current[:] = 0.0
+        self._frame_start = time.perf_counter()
+
+    def add(self, name: str, seconds: float) -> None:
+        self.current[self.columns[name]] += seconds * 1e3
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter() - start)
+
+    def end_frame(self) -> None:
+        if 'frame' in self.columns:
+            self.current[self.columns['frame']] = (time.perf_counter() - self._frame_start) * 1e3
+        self.samples[self.count % self.capacity] = self.current
+        self.count += 1
+
+    def latest(self, name: str) -> float:
+        """Milliseconds of ``name`` in the frame being (or last) recorded."""
+        return float(self.current[self.columns[name]])
+
+    def recorded(self) -> np.ndarray:
+        """The stored frames, oldest first, as a (frames, phases) array in ms."""
+        n = min(self.count, self.capacity)
+        if self.count <= self.capacity:
+            return self.samples[:n]
+        split = self.count % self.capacity
+        return np.concatenate((self.samples[split:], self.samples[:split]))
+
+    def percentiles(self) -> Dict[str, Tuple[float, float, float]]:
+        """Rolling (p50, p95, p99) in ms per phase; zeros before the first frame."""
+        data = self.recorded()
+        if not len(data):
+            return {name: (0.0, 0.0, 0.0) for name in self.phases}
+        values = np.percentile(data, PERCENTILES, axis=0)
+        return {name: tuple(float(v) for v in values[:, i]) for i, name in enumerate(self.phases)}
+
+    def write_csv(self, path: str) -> None:
+        """One row per stored frame (oldest first), one column per phase, in ms."""
+        first = max(0, self.count - self.capacity)
+        with open(path, 'w', newline='', encoding='utf-8') as fh:
+            writer = csv.writer(fh)
+            writer.writerow(('frame',) + tuple(f"{name}_ms" for name in self.phases))
+            for i, row in enumerate(self.recorded()):
+                writer.writerow([first + i] + [f"{v:.4f}" for v in row])
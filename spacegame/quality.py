@@ -0,0 +1,90 @@
+"""Render quality levels and the controller that picks one from recent frame times."""
+
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque, Sequence
+
+import numpy as np
+
+
+@dataclass(frozen=True)
+class QualityLevel:
+    sphere_slices: int  # teto de lod_slices para a lua e o escudo
+    star_fraction: float  # fração das estrelas de fundo desenhadas (1.0 = todas)
+    glow: bool  # halo das estrelas coletáveis
+    explosion_detail: float  # fração das partículas de explosão desenhadas
+
+
+# Do mais barato ao mais caro; o último é o visual completo
+QUALITY_LEVELS = (
+    QualityLevel(sphere_slices=10, star_fraction=0.25, glow=False, explosion_detail=0.25),
+    QualityLevel(sphere_slices=18, star_fraction=0.5, glow=False, explosion_detail=0.5),
+    QualityLevel(sphere_slices=30, star_fraction=0.75, glow=True, explosion_detail=0.5),
+    QualityLevel(sphere_slices=50, star_fraction=1.0, glow=True, explosion_detail=1.0),
+)
+
+# Orçamento do trabalho do quadro (sem o flip), abaixo dos 16.7 ms de 60 Hz
+QUALITY_TARGET_MS = 14.0
+QUALITY_WINDOW = 30
+# Só sobe com folga: p90 abaixo desta fração do orçamento
+QUALITY_HEADROOM = 0.6
+QUALITY_RECOVER_FRAMES = 120
+QUALITY_MAX_RECOVER_FRAMES = 1920
+
+
+class QualityController:
+    """Steps through ``levels`` to keep frame work time under ``target_ms``.
+
+    Feed it one frame time per frame with :meth:`observe`. It drops a
+    level when the median of the last ``window`` frames is over budget,
+    so a single spike is ignored but sustained load is not. It climbs
+    back when the 90th percentile of a full window is under
+    ``headroom * target_ms``, and only after ``recover`` frames at the
+    current level. An upgrade that has to be undone within two windows
+    doubles that wait (up to ``QUALITY_MAX_RECOVER_FRAMES``), so the
+    controller settles instead of oscillating between two levels.
+    """
+
+    def __init__(self, target_ms: float = QUALITY_TARGET_MS, levels: Sequence[QualityLevel] = QUALITY_LEVELS,
+                 window: int = QUALITY_WINDOW, headroom: float = QUALITY_HEADROOM,
+                 recover: int = QUALITY_RECOVER_FRAMES) -> None:
+        self.target_ms = target_ms
+        self.levels = tuple(levels)
+        self.index = len(self.levels) - 1
+        self.window = window
+        self.headroom = headroom
+        self.recover = recover
+        self.samples: Deque[float] = deque(maxlen=window)
+        self._frames_at_level = 0
+        self._upgraded = False
+
+    @property
+    def level(self) -> QualityLevel:
+        return self.levels[self.index]
+
+    def observe(self, frame_ms: float) -> bool:
+        """Record one frame; returns True when the level changed."""
+        self.samples.append(frame_ms)
+        self._frames_at_level += 1
+        if len(self.samples) < self.window:
+            return False
+        data = np.fromiter(self.samples, dtype=np.float64, count=len(self.samples))
+        if np.median(data) > self.target_ms and self.index > 0:
+            if self._upgraded and self._frames_at_level <= 2 * self.window:
+                # A subida não se pagou: esperar mais antes da próxima
+                self.recover = min(QUALITY_MAX_RECOVER_FRAMES, self.recover * 2)
+            self._set(self.index - 1, upgraded=False)
+            return True
+        if (np.percentile(data, 90) < self.target_ms * self.headroom and self.index < len(self.levels) - 1
+                and self._frames_at_level >= self.recover):
+            self._set(self.index + 1, upgraded=True)
+            return True
+        return False
+
+    def _set(self, index: int, upgraded: bool) -> None:
+        self.index = index
+        self.samples.clear()
+        self._frames_at_level = 0
+        self._upgraded = upgraded
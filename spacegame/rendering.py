@@ -1,72 +1,106 @@
 from __future__ import annotations
 
 import math
-import random
 import time
-from typing import Dict, Optional
+from contextlib import nullcontext
+from typing import Callable, Dict, Optional
 
 from OpenGL.GL import *
 from OpenGL.GLU import *
-from OpenGL.GLUT import glutInit, glutBitmapCharacter, GLUT_BITMAP_HELVETICA_18
-from PIL import Image
+import numpy as np
 
+from .batching import VertexBatch
+from .culling import Frustum, projected_radius
 from .constants import (
+    BACKGROUND_STAR_COUNT,
     COLS,
+    FAR_PLANE,
+    FOV_Y,
     MODEL_SCALE_OBJECT,
+    NEAR_PLANE,
     MODEL_SCALE_SHIP,
+    OBJECT_LOD_PIXELS,
     STATE_GAMEOVER,
     STATE_MENU,
     STATE_PAUSED,
     GAME_MODE_COLLECTOR,
     COLLECTOR_DIFFICULTY,
+    DIFFICULTY_KEYS,
 )
-from .constants import (
-    STAR_X, STAR_Y, STAR_Z, STAR_KIND, STAR_SIZE, STAR_R, STAR_G, STAR_B, STAR_SPIN_ANGLE, STAR_SPIN_SPEED
-)
+from .constants import KIND_ASTEROID, KIND_COLLECTOR_STAR, KIND_ENEMY, KIND_PICKUP
+from .geometry import STAR_GLOW_TRIANGLES
+from .instancing import InstancedModels, instance_rows
+from .meshes import Mesh, load_models
+from .particles import P_LIFE, P_MAXLIFE, P_SIZE
+from .quality import QUALITY_LEVELS, QualityLevel
+from .renderqueue import PASS_ADDITIVE, PASS_ALPHA, PASS_OPAQUE_LIT, PASS_OPAQUE_UNLIT, PASS_OVERLAY, RenderQueue
+from .shaders import ShaderError
+from .spheres import SphereCache, lod_slices
+from .starfield import Starfield
+from .startup import StartupReport
+from .text import TextRenderer
+from .textures import TextureLoader
 from .state import GameState
 
-try:
-    from assets import load_texture as load_texture_from_file
-except Exception: 
-    load_texture_from_file = None
-
-glutInit()
-
-
-CUBE_FACES = [
-    ((0, 0, 1), ((-0.5, -0.5, 0.5), (0.5, -0.5, 0.5), (0.5, 0.5, 0.5), (-0.5, 0.5, 0.5))),
-    ((0, 0, -1), ((-0.5, -0.5, -0.5), (-0.5, 0.5, -0.5), (0.5, 0.5, -0.5), (0.5, -0.5, -0.5))),
-    ((-1, 0, 0), ((-0.5, -0.5, -0.5), (-0.5, -0.5, 0.5), (-0.5, 0.5, 0.5), (-0.5, 0.5, -0.5))),
-    ((1, 0, 0), ((0.5, -0.5, -0.5), (0.5, 0.5, -0.5), (0.5, 0.5, 0.5), (0.5, -0.5, 0.5))),
-    ((0, 1, 0), ((-0.5, 0.5, -0.5), (-0.5, 0.5, 0.5), (0.5, 0.5, 0.5), (0.5, 0.5, -0.5))),
-    ((0, -1, 0), ((-0.5, -0.5, -0.5), (0.5, -0.5, -0.5), (0.5, -0.5, 0.5), (-0.5, -0.5, 0.5))),
-]
-
-STAR_MAIN_FAN = [] 
-STAR_GLOW_FAN = []  
-for i in range(11):  
-    ang = math.radians(i * 36.0)
-    r_main = 1.0 if i % 2 == 0 else 0.4
-    r_glow = 1.4 if i % 2 == 0 else 0.6
-    STAR_MAIN_FAN.append((r_main * math.cos(ang), r_main * math.sin(ang)))
-    STAR_GLOW_FAN.append((r_glow * math.cos(ang), r_glow * math.sin(ang)))
-
-
 class Renderer:
 
     def __init__(self, state: GameState) -> None:
         self.state = state
         self.model_lists: Dict[str, int] = {}
+        self.meshes: Dict[str, Mesh] = {}  # do .obj, ou as peças procedurais assadas
+        # Geometria acumulada no quadro e desenhada em uma chamada por lote
+        self.solid_batch = VertexBatch()  # cubos sem iluminação (tiros, pickups)
+        self.glow_batch = VertexBatch()  # aditivo: estrelas coletáveis e explosões
+        self.overlay_batch = VertexBatch(64)  # 2D: barras do HUD, painéis, cursores
+        self.instancer = InstancedModels()
+        self.instanced = False  # asteroides/inimigos por instancing em vez de display lists
+        self.starfield = Starfield()
+        self.starfield_ready = False  # cintilação no shader em vez do laço por estrela
+        self.spheres = SphereCache()
+        self.frustum: Optional[Frustum] = None  # câmera do quadro atual
+        # Raio envolvente por tipo de objeto, multiplicado pelo tamanho (índice = KIND_*)
+        self.object_radius = np.zeros(KIND_COLLECTOR_STAR + 1)
+        # Objetos do quadro: fora da câmera / desenhados como cubo simples
+        self.culled_objects = 0
+        self.simplified_objects = 0
+        self.text = TextRenderer()
+        # Relógio das animações (cintilação, escudo, câmera lenta); fixável em capturas
+        self.clock: Callable[[], float] = time.time
+        self.show_timings = False  # painel de tempos por fase
+        self.quality: QualityLevel = QUALITY_LEVELS[-1]
+        self.textures = TextureLoader()  # decodifica em threads, envia ao GL em draw_frame
+        self.moon_path: Optional[str] = None  # referência da lua no cache de texturas
+        # Desenhos do quadro agrupados por pass e material
+        self.queue = RenderQueue()
+        self.queue.materials = {
+            'ship': self._apply_ship_material,
+            'moon': self._apply_moon_material,
+            'far_moon': self._apply_far_moon_material,
+        }
+
+    @property
+    def timings(self):
+        """Optional FrameTimings that draws add their phase times to (shared with the queue)."""
+        return self.queue.timings
+
+    @timings.setter
+    def timings(self, value) -> None:
+        self.queue.timings = value
 
     # ------------------------------------------------------------------
     # OpenGL / Texturas
     # ------------------------------------------------------------------
-    def initialize(self) -> None:
+    def initialize(self, report: Optional[StartupReport] = None) -> None:
+        """Set up GL state and build the static geometry; ``report`` times each step."""
+        phase = report.phase if report is not None else _untimed
         glEnable(GL_DEPTH_TEST)
         glEnable(GL_TEXTURE_2D)
         glEnable(GL_LIGHTING)
         glEnable(GL_LIGHT0)
 
+        # A posição da luz é transformada pela modelview atual: fixá-la no espaço do olho
+        glMatrixMode(GL_MODELVIEW)
+        glLoadIdentity()
         glLightfv(GL_LIGHT0, GL_POSITION, [COLS / 2, 5.0, 5.0, 1.0])
         glLightfv(GL_LIGHT0, GL_DIFFUSE,  [1.0, 1.0, 1.0, 1.0])
         glLightfv(GL_LIGHT0, GL_SPECULAR, [1.0, 1.0, 1.0, 1.0])
@@ -74,229 +108,188 @@ class Renderer:
 
         glClearColor(0, 0, 0, 1)
         self.resize(self.state.window.width, self.state.window.height)
-        self._generate_background_stars()
-        self._create_model_display_lists()
+        with phase('starfield shader'):
+            self._create_starfield()
+        with phase('background stars'):
+            self._generate_background_stars()
+        with phase('load meshes'):
+            self.meshes = load_models()
+        with phase('model display lists'):
+            self._create_model_display_lists()
+        with phase('instanced models'):
+            self._create_instanced_models()
+        self._measure_objects()
 
     def resize(self, width: int, height: int) -> None:
         glMatrixMode(GL_PROJECTION)
         glLoadIdentity()
         aspect = max(0.001, float(width) / max(1.0, height))
-        gluPerspective(60, aspect, 0.1, 100)
+        gluPerspective(FOV_Y, aspect, NEAR_PLANE, FAR_PLANE)
         glViewport(0, 0, width, height)
         glMatrixMode(GL_MODELVIEW)
+        self.queue.viewport = (width, height)
+
+    def apply_quality(self, level: QualityLevel) -> None:
+        """Use ``level``'s sphere tessellation, star count, glow and explosion detail from the next frame."""
+        self.quality = level
 
     def load_moon_texture(self, path: str = "moon.jpg") -> None:
-        self.state.moon_texture = self._load_texture(path)
-
-    def _load_texture(self, path: str) -> int:
-        if load_texture_from_file:
-            try:
-                return load_texture_from_file(path)
-            except Exception:
-                pass
-        img = Image.open(path)
-        img = img.transpose(Image.FLIP_TOP_BOTTOM)
-        img_data = img.convert("RGB").tobytes()
-        texture_id = glGenTextures(1)
-        glBindTexture(GL_TEXTURE_2D, texture_id)
-        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_S, GL_REPEAT)
-        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_T, GL_REPEAT)
-        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_LINEAR)
-        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_LINEAR)
-        glTexImage2D(GL_TEXTURE_2D, 0, GL_RGB, img.width, img.height, 0,
-                     GL_RGB, GL_UNSIGNED_BYTE, img_data)
-        return texture_id
-
-    def _generate_background_stars(self) -> None:
+        """Start decoding the moon texture; it appears once ``draw_frame`` uploads it."""
+        def ready(texture: int) -> None:
+            # Devolver a referência da lua anterior ao cache
+            if self.moon_path is not None:
+                self.textures.cache.release(self.moon_path)
+            self.moon_path = path
+            self.state.moon_texture = texture
+        self.textures.request(path, ready)
+
+    def _generate_background_stars(self, count: int = BACKGROUND_STAR_COUNT) -> None:
         self.state.effects.background_stars.clear()
-        for _ in range(400):
-            theta = random.random() * 2 * math.pi
-            phi = random.random() * math.pi
-            r = random.uniform(60, 250)
+        rng = self.state.rng.cosmetic
+        for _ in range(count):
+            theta = rng.random() * 2 * math.pi
+            phi = rng.random() * math.pi
+            r = rng.uniform(60, 250)
             x = r * math.sin(phi) * math.cos(theta)
             y = r * math.cos(phi)
             z = r * math.sin(phi) * math.sin(theta)
-            self.state.effects.background_stars.append((x, y, z, random.uniform(0.5, 1.2)))
+            self.state.effects.background_stars.append((x, y, z, rng.uniform(0.5, 1.2)))
+        if self.starfield_ready:
+            self.starfield.initialize(self.state.effects.background_stars)
 
     # ------------------------------------------------------------------
     # Modelos 3D
     # ------------------------------------------------------------------
-    def _emit_unit_cube(self) -> None:
-        glBegin(GL_QUADS)
-        for normal, face in CUBE_FACES:
-            glNormal3f(*normal)
-            for vertex in face:
-                glVertex3f(*vertex)
-        glEnd()
+    def _emit_mesh(self, mesh: Mesh) -> None:
+        # Os vetores são copiados para a display list no glDrawArrays
+        glEnableClientState(GL_VERTEX_ARRAY)
+        glEnableClientState(GL_NORMAL_ARRAY)
+        glVertexPointer(3, GL_FLOAT, 0, np.ascontiguousarray(mesh.positions))
+        glNormalPointer(GL_FLOAT, 0, np.ascontiguousarray(mesh.normals))
+        glDrawArrays(GL_TRIANGLES, 0, len(mesh.vertices))
+        glDisableClientState(GL_NORMAL_ARRAY)
+        glDisableClientState(GL_VERTEX_ARRAY)
 
     def _create_model_display_lists(self) -> None:
+        # Uma lista por modelo com um único glDrawArrays: as peças já vêm transformadas
         self.model_lists.clear()
-        # Nave
-        ship_list = glGenLists(1)
-        glNewList(ship_list, GL_COMPILE)
-        glPushMatrix()
-        glScalef(0.32, 0.22, 1.4)
-        self._emit_unit_cube()
-        glPopMatrix()
-        glPushMatrix()
-        glTranslatef(0.0, 0.05, -0.85)
-        glScalef(0.18, 0.16, 0.35)
-        self._emit_unit_cube()
-        glPopMatrix()
-        glPushMatrix()
-        glTranslatef(0.0, 0.12, -0.45)
-        glScalef(0.26, 0.2, 0.45)
-        self._emit_unit_cube()
-        glPopMatrix()
-        glPushMatrix()
-        glTranslatef(0.0, -0.18, -0.15)
-        glScalef(0.22, 0.1, 0.8)
-        self._emit_unit_cube()
-        glPopMatrix()
-        for x_dir in (-0.32, 0.32):
-            glPushMatrix()
-            glTranslatef(x_dir, -0.04, -0.2)
-            glScalef(0.18, 0.06, 0.95)
-            self._emit_unit_cube()
-            glPopMatrix()
-        for x_dir in (-0.28, 0.28):
-            glPushMatrix()
-            glTranslatef(x_dir, 0.14, -0.55)
-            glScalef(0.08, 0.2, 0.35)
-            self._emit_unit_cube()
-            glPopMatrix()
-        glPushMatrix()
-        glTranslatef(0.0, 0.28, -0.1)
-        glScalef(0.12, 0.4, 0.55)
-        self._emit_unit_cube()
-        glPopMatrix()
-        for offset in (-0.14, 0.14):
-            glPushMatrix()
-            glTranslatef(offset, -0.06, 0.82)
-            glScalef(0.15, 0.15, 0.32)
-            self._emit_unit_cube()
-            glPopMatrix()
-        glEndList()
-        self.model_lists['ship'] = ship_list
-
-        # Asteroide
-        ast_list = glGenLists(1)
-        glNewList(ast_list, GL_COMPILE)
-        chunk_specs = [
-            (0.0, 0.0, 0.0, 0.75),
-            (-0.35, 0.25, -0.15, 0.55),
-            (0.4, -0.15, -0.25, 0.5),
-            (0.0, -0.3, 0.35, 0.45),
-        ]
-        for tx, ty, tz, scale in chunk_specs:
-            glPushMatrix()
-            glTranslatef(tx, ty, tz)
-            glRotatef(tx * 60 + tz * 30, 0.3, 1.0, 0.2)
-            glScalef(scale, scale * 1.1, scale)
-            self._emit_unit_cube()
-            glPopMatrix()
-        glEndList()
-        self.model_lists['asteroid'] = ast_list
-
-        # Inimigo
-        enemy_list = glGenLists(1)
-        glNewList(enemy_list, GL_COMPILE)
-        glPushMatrix()
-        glScalef(0.32, 0.24, 1.35)
-        self._emit_unit_cube()
-        glPopMatrix()
-        glPushMatrix()
-        glTranslatef(0.0, 0.02, -1.05)
-        glScalef(0.12, 0.14, 0.45)
-        self._emit_unit_cube()
-        glPopMatrix()
-        glPushMatrix()
-        glTranslatef(0.0, 0.16, -0.45)
-        glScalef(0.24, 0.24, 0.5)
-        self._emit_unit_cube()
-        glPopMatrix()
-        glPushMatrix()
-        glTranslatef(0.0, -0.22, -0.15)
-        glScalef(0.26, 0.14, 0.8)
-        self._emit_unit_cube()
-        glPopMatrix()
-        for x_dir in (-0.3, 0.3):
-            glPushMatrix()
-            glTranslatef(x_dir, 0.05, -0.15)
-            glRotatef(18 * x_dir, 0.0, 0.0, 1.0)
-            glScalef(0.1, 0.5, 0.95)
-            self._emit_unit_cube()
-            glPopMatrix()
-        for offset in (-0.12, 0.12):
-            glPushMatrix()
-            glTranslatef(offset, 0.32, 0.1)
-            glScalef(0.08, 0.35, 0.6)
-            self._emit_unit_cube()
-            glPopMatrix()
-        for offset in (-0.2, 0.2):
-            glPushMatrix()
-            glTranslatef(offset, -0.04, 0.72)
-            glScalef(0.16, 0.18, 0.5)
-            self._emit_unit_cube()
-            glPopMatrix()
-            glPushMatrix()
-            glTranslatef(offset, -0.02, 0.97)
-            glScalef(0.12, 0.12, 0.18)
-            self._emit_unit_cube()
-            glPopMatrix()
-        for offset in (-0.38, 0.38):
-            glPushMatrix()
-            glTranslatef(offset, 0.0, -0.2)
-            glScalef(0.08, 0.08, 0.4)
-            self._emit_unit_cube()
-            glPopMatrix()
-        glEndList()
-        self.model_lists['enemy'] = enemy_list
+        for name, mesh in self.meshes.items():
+            display_list = glGenLists(1)
+            glNewList(display_list, GL_COMPILE)
+            self._emit_mesh(mesh)
+            glEndList()
+            self.model_lists[name] = display_list
+
+    def _measure_objects(self) -> None:
+        def extent(points) -> float:
+            return float(np.linalg.norm(points, axis=1).max())
+        radius = self.object_radius
+        radius[KIND_ASTEROID] = extent(self.meshes['asteroid'].positions) * MODEL_SCALE_OBJECT
+        radius[KIND_ENEMY] = extent(self.meshes['enemy'].positions) * MODEL_SCALE_OBJECT * 1.18
+        radius[KIND_PICKUP] = 0.8 * math.sqrt(3) / 2
+        radius[KIND_COLLECTOR_STAR] = extent(STAR_GLOW_TRIANGLES.reshape(-1, 3)) * 0.9
+
+    def _create_starfield(self) -> None:
+        try:
+            self.starfield.initialize(())
+        except ShaderError:
+            return
+        self.starfield_ready = True
+
+    def _create_instanced_models(self) -> None:
+        # Sem suporte a instancing (ou shader recusado): fica nas display lists
+        self.instanced = False
+        if not InstancedModels.supported():
+            return
+        try:
+            self.instancer.initialize({name: self.meshes[name].vertices for name in ('asteroid', 'enemy')})
+        except ShaderError:
+            return
+        self.instanced = True
 
     # ------------------------------------------------------------------
     # Desenho da cena
     # ------------------------------------------------------------------
-    def draw_scene(self) -> None:
+    def draw_scene(self, alpha: float = 1.0) -> None:
+        """Draw the playfield, blending positions ``alpha`` of the way from the previous sim step."""
         state = self.state
         glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
         glLoadIdentity()
         player = state.player
-        cam = state.camera
-        gluLookAt(cam.x, cam.y, cam.z, player.x, 0.5, player.z - 6.0, 0, 1, 0)
-        self._draw_background_stars()
-        self._draw_moon(state.effects.moon_angle)
-        if state.game_mode != GAME_MODE_COLLECTOR:
-            self._draw_charge_ui()
-        self.draw_ship(player.x, 0.2, player.z)
-        if player.shield_time > 0:
-            self._draw_player_shield()
-        for star in state.objects.stars:
-            x, y, z = star[STAR_X], star[STAR_Y], star[STAR_Z]
-            kind = star[STAR_KIND]
-            size = star[STAR_SIZE]
-            color = (star[STAR_R], star[STAR_G], star[STAR_B])
-            spin_angle = star[STAR_SPIN_ANGLE] if len(star) > STAR_SPIN_SPEED else None
-            if kind == 'collector_star':
-                self._draw_collector_star(x, y, z, size, color, spin_angle)
-            elif kind == 'pickup':
-                self._draw_pickup(x, y, z, size, color)
-            elif kind == 'enemy':
-                self.draw_enemy(x, y, z, size, color)
+        prev = state.previous
+        px = _lerp(prev.player_x, player.x, alpha)
+        eye = (_lerp(prev.camera_x, state.camera.x, alpha),
+               _lerp(prev.camera_y, state.camera.y, alpha),
+               _lerp(prev.camera_z, state.camera.z, alpha))
+        gluLookAt(eye[0], eye[1], eye[2], px, 0.5, player.z - 6.0, 0, 1, 0)
+        self._update_frustum()
+        queue = self.queue
+        queue.submit(PASS_OPAQUE_UNLIT, lambda: self._draw_background_stars(eye), label='background')
+        moon_center = (COLS / 2, -105.0, 0.0)
+        if self.frustum.sphere_visible(moon_center, 100):
+            queue.submit(PASS_OPAQUE_LIT, lambda: self._draw_moon(state.effects.moon_angle, px), 'moon', label='moon')
+        queue.submit(PASS_OPAQUE_LIT, lambda: self.draw_ship(px, 0.2, player.z), 'ship', label='objects')
+        shield_center = (px, 0.2, player.z)
+        if player.shield_time > 0 and self.frustum.sphere_visible(shield_center, 0.9):
+            queue.submit(PASS_ALPHA, lambda: self._draw_player_shield(px), depth=self.frustum.distance(shield_center),
+                         label='objects')
+        stars = state.objects.stars
+        with self._timed('objects'):
+            pos = stars.interpolated_pos(alpha)
+            visible, simple = self._cull_objects(pos)
+            pickups = visible & (stars.kind == KIND_PICKUP)
+            collectables = visible & (stars.kind == KIND_COLLECTOR_STAR)
+            is_model = visible & ~(pickups | collectables)
+            models = np.flatnonzero(is_model & ~simple)
+            if self.instanced:
+                queue.submit(PASS_OPAQUE_LIT, lambda: self._draw_model_instances(pos, models), 'instanced',
+                             label='objects')
             else:
-                self.draw_asteroid(x, y, z, size, color, spin_angle)
-        for shot in state.objects.shots:
-            self._draw_cube(shot[0], shot[1], shot[2], size=0.1, color=(0, 1, 1))
-        self._draw_explosions(1 / 60)
+                queue.submit(PASS_OPAQUE_LIT, lambda: self._draw_model_lists(pos, models), label='objects')
+            self._queue_far_models(pos, np.flatnonzero(is_model & simple))
+            self._queue_pickups(pos[pickups], stars.size[pickups], stars.color[pickups])
+            self._queue_shots(alpha)
+            queue.submit(PASS_OPAQUE_UNLIT, self.solid_batch.flush, label='objects')
+        with self._timed('explosions'):
+            self.glow_batch.add_stars(pos[collectables], stars.size[collectables] * 0.9,
+                                      stars.spin_angle[collectables], stars.color[collectables],
+                                      glow=self.quality.glow)
+            self._queue_explosions()
+            queue.submit(PASS_ADDITIVE, self.glow_batch.flush, label='explosions')
+        if state.game_mode != GAME_MODE_COLLECTOR:
+            queue.submit(PASS_OVERLAY, self._draw_charge_ui, label='hud')
         if state.effects.global_slow_time > 0:
-            self._draw_slow_overlay()
-        self._draw_hud()
+            queue.submit(PASS_OVERLAY, self._draw_slow_overlay, label='hud')
+        queue.submit(PASS_OVERLAY, self._draw_hud, label='hud')
+        queue.flush()
+
+    def draw_frame(self, alpha: float, leaderboard_module) -> None:
+        """Draw whatever the current game state shows: menu, paused/game-over overlay, or play."""
+        state = self.state
+        self.textures.upload_ready()
+        if state.game_state == STATE_MENU:
+            self.draw_menu_background()
+        else:
+            self.draw_scene(alpha)
+        if state.game_state in (STATE_MENU, STATE_PAUSED, STATE_GAMEOVER):
+            with self._timed('overlay'):
+                self.draw_menu_overlay(leaderboard_module)
+        if self.show_timings and self.timings is not None:
+            self.queue.submit(PASS_OVERLAY, self._draw_timings)
+            self.queue.flush()
+
+    def _timed(self, phase: str):
+        return self.timings.phase(phase) if self.timings is not None else nullcontext()
 
     def draw_menu_background(self) -> None:
         glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
         glLoadIdentity()
         gluLookAt(0, 2.5, 26, 0, 0, 0, 0, 1, 0)
-        self._draw_background_stars()
-        self._draw_far_moon()
+        self._update_frustum()
+        self.queue.submit(PASS_OPAQUE_UNLIT, self._draw_background_stars, label='background')
+        if self.frustum.sphere_visible((COLS / 2, 34.0, -55.0), 16):
+            self.queue.submit(PASS_OPAQUE_LIT, self._draw_far_moon, 'far_moon', label='moon')
+        self.queue.flush()
 
     # ------------------------------------------------------------------
     # Rederização de objetos
@@ -305,15 +298,17 @@ class Renderer:
         glPushMatrix()
         glTranslatef(x, y, z)
         glScalef(MODEL_SCALE_SHIP, MODEL_SCALE_SHIP, MODEL_SCALE_SHIP)
-        glMaterialfv(GL_FRONT, GL_AMBIENT, [0.18, 0.18, 0.2, 1.0])
-        glMaterialfv(GL_FRONT, GL_DIFFUSE, [0.6, 0.58, 0.62, 1.0])
-        glMaterialfv(GL_FRONT, GL_SPECULAR, [0.8, 0.85, 0.9, 1.0])
-        glMaterialf(GL_FRONT, GL_SHININESS, 80.0)
         ship_list = self.model_lists.get('ship')
         if ship_list:
             glCallList(ship_list)
         glPopMatrix()
 
+    def _apply_ship_material(self) -> None:
+        glMaterialfv(GL_FRONT, GL_AMBIENT, [0.18, 0.18, 0.2, 1.0])
+        glMaterialfv(GL_FRONT, GL_DIFFUSE, [0.6, 0.58, 0.62, 1.0])
+        glMaterialfv(GL_FRONT, GL_SPECULAR, [0.8, 0.85, 0.9, 1.0])
+        glMaterialf(GL_FRONT, GL_SHININESS, 80.0)
+
     def draw_asteroid(self, x: float, y: float, z: float, size: float, color,
                       spin_angle: Optional[float] = None) -> None:
         glPushMatrix()
@@ -351,280 +346,217 @@ class Renderer:
         glMaterialfv(GL_FRONT, GL_EMISSION, [0, 0, 0, 1])
         glPopMatrix()
 
-    def _draw_pickup(self, x, y, z, size, color) -> None:
-        self._draw_cube(x, y, z, size=size * 0.8, color=color)
-        self._draw_cube(x, y + 0.1, z, size=size * 0.4, color=(1, 1, 1))
-
-    # Desenho das estrelas 
-    def _draw_collector_star(self, x, y, z, size, color, spin_angle) -> None:
-        glPushMatrix()
-        glTranslatef(x, y, z)
-        if spin_angle is not None:
-            glRotatef(spin_angle, 0, 1, 0)
-        
-        glDisable(GL_LIGHTING)
-        glEnable(GL_BLEND)
-        glBlendFunc(GL_SRC_ALPHA, GL_ONE)
-        
-        scale = size * 0.9
-        glScalef(scale, scale, scale)
-        
-        glColor4f(color[0], color[1], color[2], 0.9)
-        glBegin(GL_TRIANGLE_FAN)
-        glVertex3f(0, 0, 0)
-        for vx, vy in STAR_MAIN_FAN:
-            glVertex3f(vx, vy, 0)
-        glEnd()
-        
-        glColor4f(color[0], color[1], color[2], 0.3)
-        glBegin(GL_TRIANGLE_FAN)
-        glVertex3f(0, 0, 0)
-        for vx, vy in STAR_GLOW_FAN:
-            glVertex3f(vx, vy, 0)
-        glEnd()
-        
-        glDisable(GL_BLEND)
-        glEnable(GL_LIGHTING)
-        glPopMatrix()
+    def _cull_objects(self, pos: np.ndarray):
+        """Masks over the object store: inside the view, and small enough on screen for a plain cube.
+
+        Also updates ``culled_objects`` and ``simplified_objects``.
+        """
+        stars = self.state.objects.stars
+        radii = stars.size * self.object_radius[stars.kind]
+        visible = self.frustum.spheres_visible(pos, radii)
+        pixels = projected_radius(radii, self.frustum.distances(pos), self.state.window.height)
+        simple = visible & (pixels < OBJECT_LOD_PIXELS) & (stars.kind <= KIND_ENEMY)
+        self.culled_objects = len(stars) - int(np.count_nonzero(visible))
+        self.simplified_objects = int(np.count_nonzero(simple))
+        return visible, simple
+
+    def _queue_far_models(self, pos: np.ndarray, rows: np.ndarray) -> None:
+        """Asteroids and enemies too small to tell apart, as unlit cubes in roughly their lit colour."""
+        stars = self.state.objects.stars
+        color = stars.color[rows]
+        is_asteroid = stars.kind[rows] == KIND_ASTEROID
+        core = _enemy_core(color)
+        # Cor média do modelo iluminado visto de longe; sai acima do difuso porque as
+        # normais das peças escaladas não são renormalizadas (sem GL_NORMALIZE)
+        shade = np.where(is_asteroid[:, None], 1.8 * color, core * (1.95, 1.5, 2.0))
+        self.solid_batch.add_cubes(pos[rows], stars.size[rows] * self.object_radius[stars.kind[rows]],
+                                   np.minimum(shade, 1.0))
+
+    def _draw_model_lists(self, pos: np.ndarray, rows: np.ndarray) -> None:
+        """Fallback for ``_draw_model_instances``: one display list call per object."""
+        stars = self.state.objects.stars
+        for (x, y, z), is_asteroid, size, color, spin_angle in zip(
+                pos[rows].tolist(), (stars.kind[rows] == KIND_ASTEROID).tolist(), stars.size[rows].tolist(),
+                stars.color[rows].tolist(), stars.spin_angle[rows].tolist()):
+            if is_asteroid:
+                self.draw_asteroid(x, y, z, size, color, spin_angle)
+            else:
+                self.draw_enemy(x, y, z, size, color)
 
-    def _draw_cube(self, x, y, z, size=0.4, color=(1, 1, 1)) -> None:
-        glPushMatrix()
-        glDisable(GL_LIGHTING)
-        glTranslatef(x, y, z)
-        glScalef(size, size, size)
-        glMaterialfv(GL_FRONT, GL_EMISSION, [color[0], color[1], color[2], 1.0])
-        glColor3f(*color)
-        glBegin(GL_QUADS)
-        glVertex3f(-0.5, -0.5,  0.5)
-        glVertex3f( 0.5, -0.5,  0.5)
-        glVertex3f( 0.5,  0.5,  0.5)
-        glVertex3f(-0.5,  0.5,  0.5)
-        glVertex3f(-0.5, -0.5, -0.5)
-        glVertex3f(-0.5,  0.5, -0.5)
-        glVertex3f( 0.5,  0.5, -0.5)
-        glVertex3f( 0.5, -0.5, -0.5)
-        glVertex3f(-0.5,  0.5, -0.5)
-        glVertex3f(-0.5,  0.5,  0.5)
-        glVertex3f( 0.5,  0.5,  0.5)
-        glVertex3f( 0.5,  0.5, -0.5)
-        glVertex3f(-0.5, -0.5, -0.5)
-        glVertex3f( 0.5, -0.5, -0.5)
-        glVertex3f( 0.5, -0.5,  0.5)
-        glVertex3f(-0.5, -0.5,  0.5)
-        glVertex3f( 0.5, -0.5, -0.5)
-        glVertex3f( 0.5,  0.5, -0.5)
-        glVertex3f( 0.5,  0.5,  0.5)
-        glVertex3f( 0.5, -0.5,  0.5)
-        glVertex3f(-0.5, -0.5, -0.5)
-        glVertex3f(-0.5, -0.5,  0.5)
-        glVertex3f(-0.5,  0.5,  0.5)
-        glVertex3f(-0.5,  0.5, -0.5)
-        glEnd()
-        glMaterialfv(GL_FRONT, GL_EMISSION, [0, 0, 0, 1])
-        glEnable(GL_LIGHTING)
-        glPopMatrix()
+    def _draw_model_instances(self, pos: np.ndarray, rows: np.ndarray) -> None:
+        """Asteroids and enemies at ``rows`` of the store, one instanced call per model.
+
+        Materials match ``draw_asteroid`` / ``draw_enemy``.
+        """
+        stars = self.state.objects.stars
+        is_asteroid = stars.kind[rows] == KIND_ASTEROID
+        asteroids, enemies = rows[is_asteroid], rows[~is_asteroid]
+        color = stars.color[asteroids]
+        self.instancer.draw('asteroid', instance_rows(
+            pos[asteroids], stars.size[asteroids] * MODEL_SCALE_OBJECT, stars.spin_angle[asteroids],
+            ambient=0.15 * color, diffuse=0.9 * color,
+        ), specular=(0.05, 0.05, 0.05), shininess=6.0, spin_axis=(0.1, 1.0, 0.05))
+        core = _enemy_core(stars.color[enemies])
+        self.instancer.draw('enemy', instance_rows(
+            pos[enemies], stars.size[enemies] * (MODEL_SCALE_OBJECT * 1.18), np.zeros(len(enemies)),
+            ambient=core * (0.6, 0.3, 0.4), diffuse=core, emission=core * (0.55, 0.4, 0.8),
+        ), specular=(0.95, 0.3, 0.5), shininess=90.0)
+
+    def _queue_pickups(self, centers: np.ndarray, sizes: np.ndarray, colors: np.ndarray) -> None:
+        self.solid_batch.add_cubes(centers, sizes * 0.8, colors)
+        cores = centers.copy()
+        cores[:, 1] += 0.1
+        self.solid_batch.add_cubes(cores, sizes * 0.4, np.ones_like(colors))
+
+    def _queue_shots(self, alpha: float) -> None:
+        shots = self.state.objects.shots
+        if not len(shots):
+            return
+        data = np.array(shots.active, dtype=np.float32)
+        centers = data[:, :3].copy()
+        centers[:, 2] = data[:, 3] + (data[:, 2] - data[:, 3]) * alpha
+        n = len(data)
+        self.solid_batch.add_cubes(centers, np.full(n, 0.1), np.tile((0.0, 1.0, 1.0), (n, 1)))
 
     # ------------------------------------------------------------------
     # Fundo e Ambiente
     # ------------------------------------------------------------------
-    def _draw_moon(self, angle: float) -> None:
-        state = self.state
-        glPushMatrix()
-        glTranslatef(COLS / 2, -105.0, 0)
-        glRotatef(angle, 1, 0, 0)
-        glRotatef(state.player.x * -0.4, 0, 0, 1)
+    def _apply_moon_material(self) -> None:
         glMaterialfv(GL_FRONT, GL_AMBIENT_AND_DIFFUSE, [1.0, 1.0, 1.0, 1.0])
         glMaterialfv(GL_FRONT, GL_SPECULAR, [0.05, 0.05, 0.05, 1.0])
         glMaterialf(GL_FRONT, GL_SHININESS, 8.0)
         glColor3f(1, 1, 1)
-        if state.moon_texture:
-            glBindTexture(GL_TEXTURE_2D, state.moon_texture)
-        quad = gluNewQuadric()
-        gluQuadricTexture(quad, GL_TRUE)
-        gluSphere(quad, 100, 50, 50)
-        gluDeleteQuadric(quad)
+        if self.state.moon_texture:
+            glBindTexture(GL_TEXTURE_2D, self.state.moon_texture)
+
+    def _draw_moon(self, angle: float, player_x: float) -> None:
+        center = (COLS / 2, -105.0, 0.0)
+        glPushMatrix()
+        glTranslatef(*center)
+        glRotatef(angle, 1, 0, 0)
+        glRotatef(player_x * -0.4, 0, 0, 1)
+        self.spheres.draw(100, self._sphere_slices(center, 100), textured=True)
         glPopMatrix()
 
-    def _draw_background_stars(self) -> None:
+    def _update_frustum(self) -> None:
+        self.frustum = Frustum(glGetFloatv(GL_MODELVIEW_MATRIX), glGetFloatv(GL_PROJECTION_MATRIX))
+
+    def _sphere_slices(self, center, radius: float) -> int:
+        pixels = projected_radius(radius, self.frustum.distance(center), self.state.window.height)
+        return lod_slices(pixels, self.quality.sphere_slices)
+
+    def _draw_background_stars(self, eye: Optional[tuple] = None) -> None:
         state = self.state
         glPushMatrix()
         cam = state.camera
-        glTranslatef(cam.x, cam.y, cam.z)
-        glDisable(GL_LIGHTING)
-        glPointSize(3.5) 
-        glBegin(GL_POINTS)
-        t = time.time()
-        for sx, sy, sz, intensity in state.effects.background_stars:
-            tw = 0.5 + 0.5 * math.sin((sx + sy + sz) * 0.01 + t * 3.0)
-            c = max(0.1, min(1.0, intensity * tw))
-            glColor3f(c, c, c)
-            glVertex3f(sx, sy, sz)
-        glEnd()
-        glEnable(GL_LIGHTING)
+        glTranslatef(*(eye or (cam.x, cam.y, cam.z)))
+        glPointSize(3.5)
+        # Proporcional ao campo gerado (BACKGROUND_STAR_COUNT); o nível mais alto desenha todas
+        stars = state.effects.background_stars
+        limit = int(len(stars) * self.quality.star_fraction)
+        if self.starfield_ready:
+            self.starfield.draw(self.clock(), limit)
+        else:
+            glBegin(GL_POINTS)
+            t = self.clock()
+            for sx, sy, sz, intensity in stars[:limit]:
+                tw = 0.5 + 0.5 * math.sin((sx + sy + sz) * 0.01 + t * 3.0)
+                c = max(0.1, min(1.0, intensity * tw))
+                glColor3f(c, c, c)
+                glVertex3f(sx, sy, sz)
+            glEnd()
         glPopMatrix()
 
-    def _draw_far_moon(self) -> None:
-        glPushMatrix()
-        glTranslatef(COLS / 2, 34.0, -55.0)
-        glRotatef(self.state.effects.moon_angle * 0.25, 0, 1, 0)
+    def _apply_far_moon_material(self) -> None:
         if self.state.moon_texture:
             glBindTexture(GL_TEXTURE_2D, self.state.moon_texture)
         glEnable(GL_TEXTURE_2D)
         glMaterialfv(GL_FRONT, GL_AMBIENT_AND_DIFFUSE, [0.9, 0.9, 0.95, 1.0])
         glMaterialfv(GL_FRONT, GL_SPECULAR, [0.06, 0.06, 0.08, 1.0])
         glMaterialf(GL_FRONT, GL_SHININESS, 12.0)
-        quad = gluNewQuadric()
-        gluQuadricTexture(quad, GL_TRUE)
-        gluSphere(quad, 16, 30, 30)
-        gluDeleteQuadric(quad)
+
+    def _draw_far_moon(self) -> None:
+        center = (COLS / 2, 34.0, -55.0)
+        glPushMatrix()
+        glTranslatef(*center)
+        glRotatef(self.state.effects.moon_angle * 0.25, 0, 1, 0)
+        self.spheres.draw(16, self._sphere_slices(center, 16), textured=True)
         glPopMatrix()
 
-    def _draw_player_shield(self) -> None:
+    def _draw_player_shield(self, player_x: float) -> None:
         player = self.state.player
+        center = (player_x, 0.2, player.z)
         glPushMatrix()
-        glTranslatef(player.x, 0.2, player.z)
-        glEnable(GL_BLEND)
-        glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
-        glDepthMask(GL_FALSE)
-        glDisable(GL_LIGHTING)
-        alpha = max(0.15, min(0.6, (player.shield_time / 5.0) * 0.5 + 0.15 * math.sin(time.time() * 8.0)))
+        glTranslatef(*center)
+        alpha = max(0.15, min(0.6, (player.shield_time / 5.0) * 0.5 + 0.15 * math.sin(self.clock() * 8.0)))
         glColor4f(0.2, 0.85, 1.0, alpha)
-        quad = gluNewQuadric()
-        gluSphere(quad, 0.9, 18, 18)
-        gluDeleteQuadric(quad)
-        glEnable(GL_LIGHTING)
-        glDepthMask(GL_TRUE)
-        glDisable(GL_BLEND)
+        self.spheres.draw(0.9, self._sphere_slices(center, 0.9))
         glPopMatrix()
 
-    def _draw_explosions(self, delta: float) -> None:
-        explosions = self.state.objects.explosions
-        glDisable(GL_LIGHTING)
-        glEnable(GL_BLEND)
-        glBlendFunc(GL_SRC_ALPHA, GL_ONE)
-        to_remove = []
-        for e in explosions:
-            x, y, z, size, life, maxlife = e
-            e[4] += delta
-            e[3] += delta * 4
-            alpha = 1.0 - (e[4] / maxlife)
-            if alpha < 0:
-                alpha = 0
-            glColor4f(1.0, 0.8, 0.2, alpha)
-            glPushMatrix()
-            glTranslatef(x, y, z)
-            glScalef(size, size, size)
-            glBegin(GL_QUADS)
-            glVertex3f(-1, -1, 0)
-            glVertex3f(1, -1, 0)
-            glVertex3f(1, 1, 0)
-            glVertex3f(-1, 1, 0)
-            glEnd()
-            glPopMatrix()
-            if e[4] >= maxlife:
-                to_remove.append(e)
-        for e in to_remove:
-            explosions.remove(e)
-        glDisable(GL_BLEND)
-        glEnable(GL_LIGHTING)
-
+    def _queue_explosions(self) -> None:
+        parts = self.state.objects.explosions.live()
+        # Qualidade reduzida: uma a cada `stride` partículas
+        stride = max(1, round(1.0 / self.quality.explosion_detail))
+        parts = parts[::stride]
+        fade = 1.0 - parts[:, P_LIFE] / parts[:, P_MAXLIFE]
+        visible = fade > 0
+        colors = np.empty((int(visible.sum()), 4), dtype=np.float32)
+        colors[:, :3] = (1.0, 0.8, 0.2)
+        colors[:, 3] = fade[visible]
+        self.glow_batch.add_sprites(parts[visible, :3], parts[visible, P_SIZE], colors)
+
+    # Os três abaixo rodam no pass PASS_OVERLAY, que já monta a projeção 2D
     def _draw_slow_overlay(self) -> None:
         width, height = self.state.window.width, self.state.window.height
-        glMatrixMode(GL_PROJECTION)
-        glPushMatrix()
-        glLoadIdentity()
-        glOrtho(0, width, height, 0, -1, 1)
-        glMatrixMode(GL_MODELVIEW)
-        glPushMatrix()
-        glLoadIdentity()
-        glDisable(GL_LIGHTING)
-        glEnable(GL_BLEND)
-        glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
-        t = time.time()
+        t = self.clock()
         slow = self.state.effects.global_slow_time
         alpha = min(0.6, (slow / 6.0) * 0.6 + 0.05 * math.sin(t * 6.0))
-        glColor4f(0.05, 0.2, 0.5, alpha)
-        glBegin(GL_QUADS)
-        glVertex2f(0, 0)
-        glVertex2f(width, 0)
-        glVertex2f(width, height)
-        glVertex2f(0, height)
-        glEnd()
-        glDisable(GL_BLEND)
-        glEnable(GL_LIGHTING)
-        glMatrixMode(GL_PROJECTION)
-        glPopMatrix()
-        glMatrixMode(GL_MODELVIEW)
-        glPopMatrix()
+        self.overlay_batch.add_rect(0, 0, width, height, (0.05, 0.2, 0.5, alpha))
+        self.overlay_batch.flush()
 
     def _draw_hud(self) -> None:
-        width, height = self.state.window.width, self.state.window.height
-        glMatrixMode(GL_PROJECTION)
-        glPushMatrix()
-        glLoadIdentity()
-        glOrtho(0, width, height, 0, -1, 1)
-        glMatrixMode(GL_MODELVIEW)
-        glPushMatrix()
-        glLoadIdentity()
-        glDisable(GL_LIGHTING)
-        glDisable(GL_DEPTH_TEST)
-        glColor3f(1, 0, 0)
+        height = self.state.window.height
         menu = self.state.menu
         
         if self.state.game_mode == GAME_MODE_COLLECTOR:
             difficulty_name = menu.difficulty_names[menu.difficulty_index]
-            max_misses = COLLECTOR_DIFFICULTY[difficulty_name]['max_misses']
+            max_misses = COLLECTOR_DIFFICULTY[DIFFICULTY_KEYS[menu.difficulty_index]]['max_misses']
             hud_text = f"Tempo: {int(self.state.time_alive)}s  Estrelas: {self.state.score}  Perdidos: {self.state.missed_stars}/{max_misses}  Dif.: {difficulty_name}"
         else:
             hud_text = f"Pontuação: {self.state.score}  Tempo: {int(self.state.time_alive)}s  Dif.: {menu.difficulty_names[menu.difficulty_index]}"
         
-        glRasterPos2f(8, height - 18)
-        for ch in hud_text:
-            glutBitmapCharacter(GLUT_BITMAP_HELVETICA_18, ord(ch))
-        glEnable(GL_DEPTH_TEST)
-        glEnable(GL_LIGHTING)
-        glMatrixMode(GL_PROJECTION)
-        glPopMatrix()
-        glMatrixMode(GL_MODELVIEW)
-        glPopMatrix()
+        self.text.draw(hud_text, 8, height - 18, (1, 0, 0))
 
     def _draw_charge_ui(self) -> None:
-        width, height = self.state.window.width, self.state.window.height
-        glMatrixMode(GL_PROJECTION)
-        glPushMatrix()
-        glLoadIdentity()
-        glOrtho(0, width, height, 0, -1, 1)
-        glMatrixMode(GL_MODELVIEW)
-        glPushMatrix()
-        glLoadIdentity()
-        glDisable(GL_LIGHTING)
-        glDisable(GL_DEPTH_TEST)
         bar_x, bar_y, bar_w, bar_h = 20, 20, 200, 20
-        glColor3f(0.1, 0.1, 0.1)
-        glBegin(GL_QUADS)
-        glVertex2f(bar_x, bar_y)
-        glVertex2f(bar_x + bar_w, bar_y)
-        glVertex2f(bar_x + bar_w, bar_y + bar_h)
-        glVertex2f(bar_x, bar_y + bar_h)
-        glEnd()
-        glColor3f(0.0, 1.0, 1.0)
         width_fill = bar_w * self.state.player.shot_charge
-        glBegin(GL_QUADS)
-        glVertex2f(bar_x, bar_y)
-        glVertex2f(bar_x + width_fill, bar_y)
-        glVertex2f(bar_x + width_fill, bar_y + bar_h)
-        glVertex2f(bar_x, bar_y + bar_h)
-        glEnd()
-        glColor3f(1, 1, 1)
-        glRasterPos2f(bar_x + 4, bar_y + (bar_h // 2) + 4)
-        for ch in "CARGA":
-            glutBitmapCharacter(GLUT_BITMAP_HELVETICA_18, ord(ch))
-        glEnable(GL_DEPTH_TEST)
-        glEnable(GL_LIGHTING)
-        glMatrixMode(GL_PROJECTION)
-        glPopMatrix()
-        glMatrixMode(GL_MODELVIEW)
-        glPopMatrix()
+        self.overlay_batch.add_rect(bar_x, bar_y, bar_x + bar_w, bar_y + bar_h, (0.1, 0.1, 0.1))
+        self.overlay_batch.add_rect(bar_x, bar_y, bar_x + width_fill, bar_y + bar_h, (0.0, 1.0, 1.0))
+        self.overlay_batch.flush()
+        self.text.draw("CARGA", bar_x + 4, bar_y + (bar_h // 2) + 4, (1, 1, 1))
+
+    def _draw_timings(self) -> None:
+        """Rolling p50/p95/p99 per frame phase and the quality level, in the top-right corner."""
+        width = self.state.window.width
+        rows = self.timings.percentiles()
+        left, top, line = width - 330, 12, 20
+        self.overlay_batch.add_rect(left - 8, top, width - 8, top + line * (len(rows) + 2) + 10, (0.0, 0.0, 0.0, 0.7))
+        self.overlay_batch.flush()
+        columns = (left, left + 130, left + 190, left + 250)
+        y = top + line
+        for x, title in zip(columns, ("ms", "p50", "p95", "p99")):
+            self.text.draw(title, x, y, (0.7, 0.7, 0.8))
+        for name, values in rows.items():
+            y += line
+            self.text.draw(name, columns[0], y, (0.9, 0.9, 0.9))
+            for x, value in zip(columns[1:], values):
+                self.text.draw(f"{value:.1f}", x, y, (1.0, 0.9, 0.4) if value > 16.7 else (0.9, 0.9, 0.9))
+        if self.quality in QUALITY_LEVELS:
+            level = QUALITY_LEVELS.index(self.quality)
+            self.text.draw(f"quality {level}/{len(QUALITY_LEVELS) - 1}", columns[0], y + line, (0.7, 0.7, 0.8))
+        tex = self.textures.cache.stats()
+        self.text.draw(f"tex {tex.resident_bytes / 2**20:.1f}/{tex.budget_bytes / 2**20:.0f} MiB",
+                       columns[2] - 60, y + line, (0.7, 0.7, 0.8))
 
     # ------------------------------------------------------------------
     # Overlay do menu
@@ -643,29 +575,16 @@ class Renderer:
         glDisable(GL_DEPTH_TEST)
         glEnable(GL_BLEND)
         glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
-        glColor4f(0.03, 0.03, 0.06, 0.8)
-        glBegin(GL_QUADS)
-        glVertex2f(0, 0)
-        glVertex2f(width, 0)
-        glVertex2f(width, height)
-        glVertex2f(0, height)
-        glEnd()
-        glColor3f(1, 1, 1)
+        self.overlay_batch.add_rect(0, 0, width, height, (0.03, 0.03, 0.06, 0.8))
+        self.overlay_batch.flush()
         title = "SPACE DODGER"
         center_x = width / 2
         title_x = center_x - 120
         title_y = int(height * 0.12)
-        glRasterPos2f(title_x - 2, title_y - 2)
-        for ch in title:
-            glutBitmapCharacter(GLUT_BITMAP_HELVETICA_18, ord(ch))
-        glRasterPos2f(title_x, title_y)
-        for ch in title:
-            glutBitmapCharacter(GLUT_BITMAP_HELVETICA_18, ord(ch))
+        self.text.draw(title, title_x - 2, title_y - 2, (1, 1, 1))
+        self.text.draw(title, title_x, title_y, (1, 1, 1))
         authors = "por JeanRGW & QuatiGKT"
-        glColor3f(0.8, 0.8, 0.9)
-        glRasterPos2f(center_x - 80, title_y + 28)
-        for ch in authors:
-            glutBitmapCharacter(GLUT_BITMAP_HELVETICA_18, ord(ch))
+        self.text.draw(authors, center_x - 80, title_y + 28, (0.8, 0.8, 0.9))
         state = self.state
         if state.game_state == STATE_MENU:
             if state.menu.show_leaderboard:
@@ -676,6 +595,8 @@ class Renderer:
             self._draw_pause_menu(center_x, height)
         elif state.game_state == STATE_GAMEOVER:
             self._draw_gameover_overlay(center_x, height)
+        # Cursores das listas
+        self.overlay_batch.flush()
         glDisable(GL_BLEND)
         glEnable(GL_DEPTH_TEST)
         glEnable(GL_LIGHTING)
@@ -689,31 +610,19 @@ class Renderer:
         difficulty_name = menu.difficulty_names[menu.difficulty_index]
         mode_name = menu.mode_names[menu.mode_index]
         lb_key = difficulty_name + ("-Coletor" if mode_name.lower().startswith("coletor") else "")
-        glColor3f(1.0, 0.95, 0.6)
-        glRasterPos2f(center_x - 180, int(height * 0.24))
         header = f"LEADERBOARD - {mode_name} / {difficulty_name}" if mode_name != 'Sobrevivência' else f"LEADERBOARD - {difficulty_name}"
-        for ch in header:
-            glutBitmapCharacter(GLUT_BITMAP_HELVETICA_18, ord(ch))
+        self.text.draw(header, center_x - 180, int(height * 0.24), (1.0, 0.95, 0.6))
         entries = leaderboard_module.get_leaderboard(lb_key)
         base_y = int(height * 0.32)
         if len(entries) == 0:
-            glColor3f(0.8, 0.8, 0.85)
-            glRasterPos2f(center_x - 120, base_y)
-            for ch in "Sem registros ainda.":
-                glutBitmapCharacter(GLUT_BITMAP_HELVETICA_18, ord(ch))
+            self.text.draw("Sem registros ainda.", center_x - 120, base_y, (0.8, 0.8, 0.85))
         else:
             for i, entry in enumerate(entries):
                 y = base_y + i * 36
-                glColor3f(0.95 if i < 3 else 0.9, 0.9, 0.7)
-                glRasterPos2f(center_x - 140, y)
                 text = f"{i+1:>2}. {entry['name'][:18]:18}  {entry['score']:>5}"
-                for ch in text:
-                    glutBitmapCharacter(GLUT_BITMAP_HELVETICA_18, ord(ch))
-        glColor3f(0.7, 0.7, 0.85)
-        glRasterPos2f(center_x - 180, base_y + 11 * 36)
+                self.text.draw(text, center_x - 140, y, (0.95 if i < 3 else 0.9, 0.9, 0.7))
         hint = "ESQ/DIR: Dificuldade  CIMA/BAIXO: Modo  Esc/Enter: Fechar"
-        for ch in hint:
-            glutBitmapCharacter(GLUT_BITMAP_HELVETICA_18, ord(ch))
+        self.text.draw(hint, center_x - 180, base_y + 11 * 36, (0.7, 0.7, 0.85))
 
     def _draw_menu_entries(self, center_x: float, height: int) -> None:
         menu = self.state.menu
@@ -730,115 +639,87 @@ class Renderer:
             y = int(height * 0.33) + idx * 56
             is_selected = idx == menu.selected
             color = (1.0, 1.0, 0.2) if is_selected else (0.85, 0.85, 0.85)
-            glColor3f(*color)
             menu_x = center_x - 60
-            glRasterPos2f(menu_x, y)
-            for ch in text:
-                glutBitmapCharacter(GLUT_BITMAP_HELVETICA_18, ord(ch))
+            self.text.draw(text, menu_x, y, color)
             if is_selected:
                 offset = 8.0 * math.sin(menu.anim * 6.0)
                 cx = menu_x - 40 + offset
                 cy = y - 6
-                glColor3f(1.0, 0.9, 0.2)
-                glBegin(GL_TRIANGLES)
-                glVertex2f(cx + 12, cy)
-                glVertex2f(cx, cy - 6)
-                glVertex2f(cx, cy + 6)
-                glEnd()
+                self.overlay_batch.add_triangle((cx + 12, cy), (cx, cy - 6), (cx, cy + 6), (1.0, 0.9, 0.2))
 
     def _draw_pause_menu(self, center_x: float, height: int) -> None:
         options = ["Continuar (P / Esc)", "Menu Principal (M)", "Sair (Q)"]
-        glColor3f(1.0, 0.9, 0.4)
-        glRasterPos2f(center_x - 40, height * 0.26)
-        for ch in "PAUSADO":
-            glutBitmapCharacter(GLUT_BITMAP_HELVETICA_18, ord(ch))
+        self.text.draw("PAUSADO", center_x - 40, height * 0.26, (1.0, 0.9, 0.4))
         opt_x = center_x - 80
         base_y = int(height * 0.32)
         for i, text in enumerate(options):
             y = base_y + i * 48
             is_selected = (i == self.state.menu.pause_selected)
             color = (1.0, 0.95, 0.6) if is_selected else (0.8, 0.8, 0.85)
-            glColor3f(*color)
-            glRasterPos2f(opt_x, y)
-            for ch in text:
-                glutBitmapCharacter(GLUT_BITMAP_HELVETICA_18, ord(ch))
+            self.text.draw(text, opt_x, y, color)
             if is_selected:
                 offset = 6.0 * math.sin(self.state.menu.anim * 6.0)
                 cx = opt_x - 40 + offset
                 cy = y - 6
-                glColor3f(1.0, 0.85, 0.2)
-                glBegin(GL_TRIANGLES)
-                glVertex2f(cx + 12, cy)
-                glVertex2f(cx, cy - 6)
-                glVertex2f(cx, cy + 6)
-                glEnd()
+                self.overlay_batch.add_triangle((cx + 12, cy), (cx, cy - 6), (cx, cy + 6), (1.0, 0.85, 0.2))
 
     def _draw_gameover_overlay(self, center_x: float, height: int) -> None:
         lb_state = self.state.leaderboard
         if lb_state.capturing_name:
-            glColor3f(1.0, 0.95, 0.7)
             title_y = int(height * 0.32)
-            glRasterPos2f(center_x - 160, title_y)
-            for ch in "NOVO RECORDE":
-                glutBitmapCharacter(GLUT_BITMAP_HELVETICA_18, ord(ch))
-            glColor3f(0.95, 0.95, 0.98)
+            self.text.draw("NOVO RECORDE", center_x - 160, title_y, (1.0, 0.95, 0.7))
             instr_y = title_y + 36
-            glRasterPos2f(center_x - 220, instr_y)
-            for ch in "Digite seu nome (Enter para salvar, Esc para pular)":
-                glutBitmapCharacter(GLUT_BITMAP_HELVETICA_18, ord(ch))
+            self.text.draw("Digite seu nome (Enter para salvar, Esc para pular)", center_x - 220, instr_y, (0.95, 0.95, 0.98))
             name_y = instr_y + 42
-            glColor3f(1.0, 1.0, 1.0)
-            glRasterPos2f(center_x - 120, name_y)
             display = lb_state.name_buffer or "_"
-            for ch in display:
-                glutBitmapCharacter(GLUT_BITMAP_HELVETICA_18, ord(ch))
+            self.text.draw(display, center_x - 120, name_y, (1.0, 1.0, 1.0))
             
             if self.state.game_mode == GAME_MODE_COLLECTOR:
                 sline = f"Tempo: {int(self.state.time_alive)}s    Estrelas: {self.state.score}    Dif.: {lb_state.last_played_difficulty or '-'}"
             else:
                 sline = f"Pontuação: {self.state.score}    Dif.: {lb_state.last_played_difficulty or '-'}"
             
-            glColor3f(0.8, 0.8, 0.85)
             stats_y = name_y + 44
-            glRasterPos2f(center_x - 180, stats_y)
-            for ch in sline:
-                glutBitmapCharacter(GLUT_BITMAP_HELVETICA_18, ord(ch))
+            self.text.draw(sline, center_x - 180, stats_y, (0.8, 0.8, 0.85))
         else:
             # Panel background
             glEnable(GL_BLEND)
             glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
-            glColor4f(0.1, 0.1, 0.15, 0.75)
             panel_w = 540
             panel_h = 180
             panel_x = center_x - panel_w / 2
             panel_y = int(height * 0.34)
-            glBegin(GL_QUADS)
-            glVertex2f(panel_x, panel_y)
-            glVertex2f(panel_x + panel_w, panel_y)
-            glVertex2f(panel_x + panel_w, panel_y + panel_h)
-            glVertex2f(panel_x, panel_y + panel_h)
-            glEnd()
+            self.overlay_batch.add_rect(panel_x, panel_y, panel_x + panel_w, panel_y + panel_h, (0.1, 0.1, 0.15, 0.75))
+            self.overlay_batch.flush()
             glDisable(GL_BLEND)
 
-            glColor3f(1.0, 0.3, 0.3)
             title_y = panel_y + 28
-            glRasterPos2f(center_x - 60, title_y)
-            for ch in "GAME OVER":
-                glutBitmapCharacter(GLUT_BITMAP_HELVETICA_18, ord(ch))
+            self.text.draw("GAME OVER", center_x - 60, title_y, (1.0, 0.3, 0.3))
 
-            glColor3f(0.9, 0.9, 0.95)
             stats_y = title_y + 36
-            glRasterPos2f(center_x - 220, stats_y)
             if self.state.game_mode == GAME_MODE_COLLECTOR:
                 stats = f"Tempo: {int(self.state.time_alive)}s    Estrelas: {self.state.score}"
             else:
                 stats = f"Pontuação: {self.state.score}    Tempo: {int(self.state.time_alive)}s"
-            for ch in stats:
-                glutBitmapCharacter(GLUT_BITMAP_HELVETICA_18, ord(ch))
+            self.text.draw(stats, center_x - 220, stats_y, (0.9, 0.9, 0.95))
 
-            glColor3f(0.85, 0.85, 0.9)
             hint_y = stats_y + 44
-            glRasterPos2f(center_x - 220, hint_y)
             hints = "Enter: Reiniciar    M: Menu    Q: Sair"
-            for ch in hints:
-                glutBitmapCharacter(GLUT_BITMAP_HELVETICA_18, ord(ch))
+            self.text.draw(hints, center_x - 220, hint_y, (0.85, 0.85, 0.9))
+
+
+def _untimed(name: str):
+    return nullcontext()
+
+
+def _enemy_core(color: np.ndarray) -> np.ndarray:
+    """Vectorised core colour of ``draw_enemy``."""
+    core = np.empty_like(color)
+    core[:, 0] = np.clip(color[:, 0], 0.85, 1.0)
+    core[:, 1] = np.minimum(1.0, color[:, 1] * 0.7 + 0.1)
+    core[:, 2] = np.minimum(1.0, color[:, 2] * 0.6 + 0.15)
+    return core
+
+
+def _lerp(a: float, b: float, t: float) -> float:
+    return a + (b - a) * t
@@ -0,0 +1,143 @@
+"""Deferred draw submission sorted by render pass and material."""
+
+from __future__ import annotations
+
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+from OpenGL.GL import (
+    GL_BLEND,
+    GL_DEPTH_TEST,
+    GL_FALSE,
+    GL_LIGHTING,
+    GL_MODELVIEW,
+    GL_ONE,
+    GL_ONE_MINUS_SRC_ALPHA,
+    GL_PROJECTION,
+    GL_SRC_ALPHA,
+    GL_TRUE,
+    glBlendFunc,
+    glDepthMask,
+    glDisable,
+    glEnable,
+    glLoadIdentity,
+    glMatrixMode,
+    glOrtho,
+    glPopMatrix,
+    glPushMatrix,
+)
+
+# Passes, na ordem em que são desenhados
+PASS_OPAQUE_LIT = 0
+PASS_OPAQUE_UNLIT = 1
+PASS_ADDITIVE = 2
+PASS_ALPHA = 3  # de trás para frente
+PASS_OVERLAY = 4  # 2D em pixels, na ordem de envio
+
+_SORTED_BACK_TO_FRONT = (PASS_ADDITIVE, PASS_ALPHA)
+
+DrawFn = Callable[[], None]
+
+
+class RenderQueue:
+    """Collects a frame's draws and submits them grouped by pass, then material.
+
+    Opaque passes are grouped by material so each material is applied
+    once; blended passes are ordered back to front by ``depth`` (distance
+    from the eye). Pass state (lighting, blending, depth writes, the 2D
+    projection) is set once per pass, and the GL resting state — lighting
+    and depth test on, blending off, depth writes on — is restored after
+    :meth:`flush`. Draw functions only issue geometry.
+
+    When ``timings`` is set, each draw submitted with a ``label`` adds its
+    time to that phase of the current frame.
+    """
+
+    def __init__(self) -> None:
+        self.items: List[Tuple[int, str, float, int, DrawFn, Optional[str]]] = []
+        self.materials: Dict[str, DrawFn] = {}
+        self.viewport: Tuple[int, int] = (1, 1)
+        # Trocas de estado (pass + material) do último flush
+        self.state_changes = 0
+        self.timings = None  # FrameTimings opcional
+
+    def submit(self, pass_id: int, draw: DrawFn, material: Optional[str] = None, depth: float = 0.0,
+               label: Optional[str] = None) -> None:
+        self.items.append((pass_id, material or '', depth, len(self.items), draw, label))
+
+    def flush(self) -> None:
+        def order(item):
+            pass_id, material, depth, seq = item[:4]
+            if pass_id in _SORTED_BACK_TO_FRONT:
+                return (pass_id, -depth, seq)
+            if pass_id == PASS_OVERLAY:
+                return (pass_id, seq)
+            return (pass_id, material, seq)
+
+        changes = 0
+        current_pass = current_material = None
+        timings = self.timings
+        for pass_id, material, _, _, draw, label in sorted(self.items, key=order):
+            if pass_id != current_pass:
+                if current_pass is not None:
+                    _leave_pass(current_pass)
+                _enter_pass(pass_id, self.viewport)
+                current_pass, current_material = pass_id, None
+                changes += 1
+            if material != current_material:
+                apply = self.materials.get(material)
+                if apply is not None:
+                    apply()
+                    changes += 1
+                current_material = material
+            if timings is None or label is None:
+                draw()
+            else:
+                start = time.perf_counter()
+                draw()
+                timings.add(label, time.perf_counter() - start)
+        if current_pass is not None:
+            _leave_pass(current_pass)
+        self.items.clear()
+        self.state_changes = changes
+
+
+def _enter_pass(pass_id: int, viewport: Tuple[int, int]) -> None:
+    if pass_id == PASS_OPAQUE_LIT:
+        return
+    glDisable(GL_LIGHTING)
+    if pass_id == PASS_ADDITIVE:
+        glEnable(GL_BLEND)
+        glBlendFunc(GL_SRC_ALPHA, GL_ONE)
+        glDepthMask(GL_FALSE)
+    elif pass_id == PASS_ALPHA:
+        glEnable(GL_BLEND)
+        glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
+        glDepthMask(GL_FALSE)
+    elif pass_id == PASS_OVERLAY:
+        glMatrixMode(GL_PROJECTION)
+        glPushMatrix()
+        glLoadIdentity()
+        glOrtho(0, viewport[0], viewport[1], 0, -1, 1)
+        glMatrixMode(GL_MODELVIEW)
+        glPushMatrix()
+        glLoadIdentity()
+        glDisable(GL_DEPTH_TEST)
+        glEnable(GL_BLEND)
+        glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
+
+
+def _leave_pass(pass_id: int) -> None:
+    if pass_id == PASS_OPAQUE_LIT:
+        return
+    glEnable(GL_LIGHTING)
+    if pass_id in (PASS_ADDITIVE, PASS_ALPHA):
+        glDisable(GL_BLEND)
+        glDepthMask(GL_TRUE)
+    elif pass_id == PASS_OVERLAY:
+        glDisable(GL_BLEND)
+        glEnable(GL_DEPTH_TEST)
+        glMatrixMode(GL_PROJECTION)
+        glPopMatrix()
+        glMatrixMode(GL_MODELVIEW)
+        glPopMatrix()
@@ -0,0 +1,53 @@
+"""Small helpers for compiling and linking GLSL programs."""
+
+from __future__ import annotations
+
+from typing import Iterable
+
+from OpenGL.GL import (
+    GL_COMPILE_STATUS,
+    GL_FRAGMENT_SHADER,
+    GL_LINK_STATUS,
+    GL_VERTEX_SHADER,
+    glAttachShader,
+    glBindAttribLocation,
+    glCompileShader,
+    glCreateProgram,
+    glCreateShader,
+    glDeleteShader,
+    glGetProgramInfoLog,
+    glGetProgramiv,
+    glGetShaderInfoLog,
+    glGetShaderiv,
+    glLinkProgram,
+    glShaderSource,
+)
+
+
+class ShaderError(RuntimeError):
+    """A shader failed to compile or link."""
+
+
+def link_program(vertex_source: str, fragment_source: str, attributes: Iterable[str] = ()) -> int:
+    """Compile and link a program, binding ``attributes`` to locations 0, 1, 2...; raises ShaderError."""
+    program = glCreateProgram()
+    shaders = [_compile(GL_VERTEX_SHADER, vertex_source), _compile(GL_FRAGMENT_SHADER, fragment_source)]
+    for shader in shaders:
+        glAttachShader(program, shader)
+    for index, name in enumerate(attributes):
+        glBindAttribLocation(program, index, name)
+    glLinkProgram(program)
+    for shader in shaders:
+        glDeleteShader(shader)
+    if not glGetProgramiv(program, GL_LINK_STATUS):
+        raise ShaderError(glGetProgramInfoLog(program).decode(errors='replace'))
+    return program
+
+
+def _compile(kind: int, source: str) -> int:
+    shader = glCreateShader(kind)
+    glShaderSource(shader, source)
+    glCompileShader(shader)
+    if not glGetShaderiv(shader, GL_COMPILE_STATUS):
+        raise ShaderError(glGetShaderInfoLog(shader).decode(errors='replace'))
+    return shader
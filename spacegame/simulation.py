@@ -0,0 +1,208 @@
+"""Headless gameplay step: advances a GameState without pygame or OpenGL."""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from typing import Callable, List, Optional, Sequence, Tuple
+
+from .constants import (
+    COLS,
+    DIFFICULTY,
+    DIFFICULTY_KEYS,
+    COLLECTOR_DIFFICULTY,
+    STATE_GAMEOVER,
+    STATE_PAUSED,
+    STATE_PLAYING,
+    GAME_MODE_SURVIVAL,
+    GAME_MODE_COLLECTOR,
+    MAX_CATCHUP_STEPS,
+    SIM_DT,
+)
+from .gameplay import fire_shot, spawn_stars, update_shots, update_stars, spawn_collector_stars, update_collector_stars
+from .state import GameState
+
+
+@dataclass(frozen=True)
+class TickInput:
+    """Keys pressed during one tick (edge-triggered, like KEYDOWN events)."""
+    left: bool = False
+    right: bool = False
+    fire: bool = False
+    pause: bool = False
+
+
+NO_INPUT = TickInput()
+
+# Script de entrada: (índice do tick, estado) -> teclas daquele tick
+InputScript = Callable[[int, GameState], TickInput]
+# Entradas gravadas: (passos já simulados quando a tecla chegou, teclas)
+InputLog = List[Tuple[int, TickInput]]
+
+
+class Simulator:
+    """Owns a GameState and steps gameplay from scripted inputs."""
+
+    def __init__(self, state: Optional[GameState] = None) -> None:
+        self.state = state if state is not None else GameState()
+        # Tempo real ainda não consumido por passos fixos
+        self.accumulator = 0.0
+        # Passos desde start() e as entradas recebidas, para replay
+        self.ticks = 0
+        self.input_log: InputLog = []
+
+    @property
+    def difficulty_name(self) -> str:
+        return DIFFICULTY_KEYS[self.state.menu.difficulty_index]
+
+    def start(self, mode: int = GAME_MODE_SURVIVAL, difficulty: str = 'Normal',
+              seed: Optional[int] = None) -> None:
+        """Begin a session; the same seed and input log replay it exactly."""
+        state = self.state
+        menu = state.menu
+        menu.mode_index = mode
+        menu.difficulty_index = DIFFICULTY_KEYS.index(difficulty)
+        state.game_mode = mode
+        state.leaderboard.last_played_difficulty = menu.difficulty_names[menu.difficulty_index]
+        state.leaderboard.prompted = False
+        state.reset(seed)
+        state.game_state = STATE_PLAYING
+        self.accumulator = 0.0
+        self.ticks = 0
+        self.input_log = []
+        self._save_previous()
+
+    def apply_input(self, inputs: TickInput) -> None:
+        state = self.state
+        if inputs != NO_INPUT:
+            self.input_log.append((self.ticks, inputs))
+        if state.game_state == STATE_PLAYING:
+            player = state.player
+            if inputs.left:
+                player.target_x -= 1
+            if inputs.right:
+                player.target_x += 1
+            if inputs.fire and state.game_mode == GAME_MODE_SURVIVAL:
+                fire_shot(state)
+            if inputs.pause:
+                state.menu.pause_selected = 0
+                state.game_state = STATE_PAUSED
+        elif state.game_state == STATE_PAUSED and inputs.pause:
+            state.game_state = STATE_PLAYING
+
+    def advance(self, elapsed: float) -> float:
+        """Run the fixed steps covered by ``elapsed`` seconds of wall time.
+
+        At most MAX_CATCHUP_STEPS run per call; a longer hitch is dropped
+        instead of replayed, so the game slows down rather than spiralling.
+        Returns how far (0..1) the leftover time is into the next step, for
+        render interpolation.
+        """
+        self.accumulator += elapsed
+        steps = 0
+        while self.accumulator >= SIM_DT:
+            if steps == MAX_CATCHUP_STEPS:
+                self.accumulator = 0.0
+                break
+            self.update(SIM_DT)
+            self.accumulator -= SIM_DT
+            steps += 1
+        return self.accumulator / SIM_DT
+
+    def _save_previous(self) -> None:
+        state = self.state
+        previous = state.previous
+        previous.player_x = state.player.x
+        previous.camera_x = state.camera.x
+        previous.camera_y = state.camera.y
+        previous.camera_z = state.camera.z
+        state.objects.stars.save_previous()
+
+    def update(self, delta: float) -> None:
+        state = self.state
+        self._save_previous()
+        self.ticks += 1
+        state.spawn_timer += delta
+        if state.game_state == STATE_PLAYING:
+            player = state.player
+            player.target_x = max(0, min(COLS - 1, player.target_x))
+            diff = player.target_x - player.x
+            player.x = smooth_lerp(player.x, player.target_x, delta, 10)
+            lateral = abs(player.target_x - player.x)
+            desired_z = 12.0 - min(4.5, lateral * 2.0)
+            v = diff / max(delta, 1e-6)
+            look_ahead = max(-2.0, min(2.0, v * 0.02))
+            desired_x = player.x + look_ahead
+            desired_y = 3.0
+            state.camera.x = smooth_lerp(state.camera.x, desired_x, delta, 10.0)
+            state.camera.y = smooth_lerp(state.camera.y, desired_y, delta, 6.0)
+            state.camera.z = smooth_lerp(state.camera.z, desired_z, delta, 6.0)
+            difficulty_name = self.difficulty_name
+
+            # Modos de jogo
+            if state.game_mode == GAME_MODE_COLLECTOR:
+                # Lógica do modo Collector
+                cfg = COLLECTOR_DIFFICULTY[difficulty_name]
+                if state.spawn_timer > cfg['spawn_interval']:
+                    spawn_collector_stars(state, difficulty_name)
+                    state.spawn_timer = 0
+                alive = update_collector_stars(state, difficulty_name, delta)
+                if not alive:
+                    state.game_state = STATE_GAMEOVER
+            else:
+                # Lógica do modo Survival
+                if state.spawn_timer > DIFFICULTY[difficulty_name]['spawn_interval']:
+                    spawn_stars(state, difficulty_name)
+                    state.spawn_timer = 0
+                alive = update_stars(state, difficulty_name, delta)
+                if not alive:
+                    state.game_state = STATE_GAMEOVER
+                update_shots(state, delta)
+
+            state.time_alive += delta
+        state.menu.anim += delta
+        player = state.player
+        player.shot_charge = min(1.0, player.shot_charge + delta / player.shot_cooldown)
+        if player.shield_time > 0:
+            player.shield_time = max(0.0, player.shield_time - delta)
+        if state.effects.global_slow_time > 0:
+            state.effects.global_slow_time = max(0.0, state.effects.global_slow_time - delta)
+        state.effects.moon_angle += delta * 2
+        state.objects.explosions.update(delta)
+
+    def tick(self, delta: float, inputs: TickInput = NO_INPUT) -> None:
+        self.apply_input(inputs)
+        self.update(delta)
+
+    def run(self, ticks: int, delta: float = SIM_DT, script: Optional[InputScript] = None) -> int:
+        """Step up to ``ticks`` ticks, stopping at game over. Returns the ticks run."""
+        state = self.state
+        for i in range(ticks):
+            if state.game_state == STATE_GAMEOVER:
+                return i
+            self.tick(delta, script(i, state) if script else NO_INPUT)
+        return ticks
+
+    @classmethod
+    def replay(cls, seed: int, mode: int, difficulty: str, input_log: Sequence[Tuple[int, TickInput]],
+               max_ticks: int, delta: float = SIM_DT) -> "Simulator":
+        """Re-run a recorded session headlessly, e.g. to verify a reported score."""
+        sim = cls()
+        sim.start(mode, difficulty, seed)
+        pending = list(input_log)
+        cursor = 0
+        state = sim.state
+        while sim.ticks < max_ticks and state.game_state != STATE_GAMEOVER:
+            while cursor < len(pending) and pending[cursor][0] <= sim.ticks:
+                sim.apply_input(pending[cursor][1])
+                cursor += 1
+            sim.update(delta)
+        return sim
+
+
+# Suavizar movimento
+def smooth_lerp(current: float, target: float, dt: float, speed: float) -> float:
+    if dt <= 0:
+        return target
+    alpha = 1.0 - math.exp(-speed * dt)
+    return current + (target - current) * alpha
@@ -0,0 +1,119 @@
+"""Lane-bucketed spatial index over an :class:`EntityStore`."""
+
+from __future__ import annotations
+
+import bisect
+import math
+from typing import List, Tuple
+
+import numpy as np
+
+from .constants import COLS
+from .entities import EntityStore
+
+# Maior que qualquer faixa de z em jogo, para que a linha domine a chave de ordenação
+_LANE_STRIDE = 1.0e6
+
+
+class LaneIndex:
+    """Objects bucketed by lane (rounded x), each bucket sorted by z.
+
+    The index is rebuilt from the store after every update pass and takes
+    single inserts and batch removals in between, so a neighbourhood query
+    only touches the lanes and the z window it asks about instead of every
+    live object.
+    """
+
+    def __init__(self, lanes: int = COLS) -> None:
+        self.lanes = lanes
+        # Versão do store refletida no índice (-1 -> nunca sincronizado)
+        self.version = -1
+        self._rows = np.empty(0, dtype=np.intp)
+        self._keys = np.empty(0, dtype=np.float64)
+        self._x = np.empty(0, dtype=np.float32)
+        # Inserções desde o último rebuild: (z, x, row) ordenado por z, por linha
+        self._extra: List[List[Tuple[float, float, int]]] = [[] for _ in range(lanes)]
+
+    def _lane(self, x: float) -> int:
+        return min(self.lanes - 1, max(0, round(x)))
+
+    def rebuild(self, store: EntityStore) -> None:
+        lane = np.clip(np.rint(store.x), 0, self.lanes - 1)
+        # Chave composta (linha, z): exata em float64 e bem mais barata que lexsort
+        keys = lane * _LANE_STRIDE + store.z.astype(np.float64)
+        order = np.argsort(keys)
+        self._rows = order
+        self._keys = keys[order]
+        self._x = store.x[order]
+        for bucket in self._extra:
+            bucket.clear()
+        self.version = store.version
+
+    def sync(self, store: EntityStore) -> None:
+        if self.version != store.version:
+            self.rebuild(store)
+
+    def insert(self, store: EntityStore, row: int) -> None:
+        """Register ``row`` right after it was appended to ``store``."""
+        if self.version != store.version - 1:
+            # O store mudou por outro caminho desde o último sync
+            self.rebuild(store)
+            return
+        x, z = float(store.x[row]), float(store.z[row])
+        bisect.insort(self._extra[self._lane(x)], (z, x, row))
+        self.version = store.version
+
+    def remove(self, store: EntityStore, rows) -> None:
+        """Drop ``rows`` right after ``store.remove(rows)``; the rows above them are renumbered.
+
+        Compaction keeps the store order, so the surviving entries stay
+        sorted and are only filtered and shifted: O(n) with no re-sort.
+        """
+        if self.version != store.version - 1:
+            self.rebuild(store)
+            return
+        dead = np.zeros(len(store) + len(rows), dtype=bool)
+        dead[np.asarray(list(rows), dtype=np.intp)] = True
+        # Removidas abaixo de cada linha: quanto ela desce na compactação
+        below = np.cumsum(dead)
+        keep = ~dead[self._rows]
+        self._rows = (self._rows - below[self._rows])[keep]
+        self._keys = self._keys[keep]
+        self._x = self._x[keep]
+        for i, bucket in enumerate(self._extra):
+            if bucket:
+                self._extra[i] = [(z, x, row - int(below[row])) for z, x, row in bucket if not dead[row]]
+        self.version = store.version
+
+    def query(self, x: float, z: float, dx: float, dz: float) -> List[int]:
+        """Rows with ``|obj.x - x| < dx`` and ``|obj.z - z| < dz``."""
+        found: List[int] = []
+        for ox, row in self._candidates(x, z, dx, dz):
+            if abs(ox - x) < dx:
+                found.append(row)
+        return found
+
+    def any_within(self, x: float, z: float, dx: float, dz: float) -> bool:
+        return any(abs(ox - x) < dx for ox, _ in self._candidates(x, z, dx, dz))
+
+    def _candidates(self, x: float, z: float, dx: float, dz: float) -> List[Tuple[float, int]]:
+        """(x, row) of every object in the lanes near ``x`` with z strictly inside ``z ± dz``."""
+        lanes = range(self._lane(x - dx), self._lane(x + dx) + 1)
+        # Uma única busca binária para todas as linhas; nextafter torna o limite inferior estrito
+        bounds = []
+        for lane in lanes:
+            base = lane * _LANE_STRIDE
+            bounds.append(math.nextafter(base + (z - dz), math.inf))
+            bounds.append(base + (z + dz))
+        edges = np.searchsorted(self._keys, bounds).tolist()
+        found: List[Tuple[float, int]] = []
+        for i, lane in enumerate(lanes):
+            lo, hi = edges[2 * i], edges[2 * i + 1]
+            if hi > lo:
+                found.extend(zip(self._x[lo:hi].tolist(), self._rows[lo:hi].tolist()))
+            bucket = self._extra[lane]
+            if bucket:
+                lo = bisect.bisect_right(bucket, (z - dz, math.inf))
+                hi = bisect.bisect_left(bucket, (z + dz, -math.inf))
+                found.extend((ex, row) for _, ex, row in bucket[lo:hi])
+        return found
@@ -0,0 +1,57 @@
+"""Sphere tessellations compiled once into display lists and picked by screen size."""
+
+from __future__ import annotations
+
+from typing import Dict, Tuple
+
+from OpenGL.GL import GL_COMPILE, GL_TRUE, glCallList, glDeleteLists, glEndList, glGenLists, glNewList
+from OpenGL.GLU import gluDeleteQuadric, gluNewQuadric, gluQuadricTexture, gluSphere
+
+# (raio projetado máximo em pixels, fatias); acima do último, SPHERE_MAX_SLICES.
+# Os tamanhos atuais na tela caem nas mesmas tesselações de antes (18, 30 e 50)
+SPHERE_LOD_LEVELS = ((20.0, 10), (60.0, 18), (200.0, 30))
+SPHERE_MAX_SLICES = 50
+
+
+def lod_slices(projected_radius: float, max_slices: int = SPHERE_MAX_SLICES) -> int:
+    """Slices (and stacks) for a sphere covering ``projected_radius`` pixels."""
+    for limit, slices in SPHERE_LOD_LEVELS:
+        if projected_radius < limit:
+            return min(slices, max_slices)
+    return max_slices
+
+
+class SphereCache:
+    """``gluSphere`` output keyed by radius, tessellation and texturing.
+
+    The radius is part of the key instead of scaling a unit sphere because
+    the fixed pipeline runs without ``GL_NORMALIZE``: a scaled sphere
+    would light differently.
+    """
+
+    def __init__(self) -> None:
+        self.lists: Dict[Tuple[float, int, bool], int] = {}
+
+    def draw(self, radius: float, slices: int, textured: bool = False) -> None:
+        key = (radius, slices, textured)
+        display_list = self.lists.get(key)
+        if display_list is None:
+            display_list = self.lists[key] = self._compile(radius, slices, textured)
+        glCallList(display_list)
+
+    def clear(self) -> None:
+        for display_list in self.lists.values():
+            glDeleteLists(display_list, 1)
+        self.lists.clear()
+
+    @staticmethod
+    def _compile(radius: float, slices: int, textured: bool) -> int:
+        display_list = glGenLists(1)
+        glNewList(display_list, GL_COMPILE)
+        quad = gluNewQuadric()
+        if textured:
+            gluQuadricTexture(quad, GL_TRUE)
+        gluSphere(quad, radius, slices, slices)
+        gluDeleteQuadric(quad)
+        glEndList()
+        return display_list
@@ -0,0 +1,109 @@
+"""Background starfield baked into a static buffer, twinkling on the GPU."""
+
+from __future__ import annotations
+
+import ctypes
+import math
+from typing import Optional, Sequence, Tuple
+
+import numpy as np
+from OpenGL.GL import (
+    GL_ARRAY_BUFFER,
+    GL_FLOAT,
+    GL_POINTS,
+    GL_STATIC_DRAW,
+    glBindBuffer,
+    glBufferData,
+    glDisableVertexAttribArray,
+    glDrawArrays,
+    glEnableVertexAttribArray,
+    glGenBuffers,
+    glGetUniformLocation,
+    glUniform1f,
+    glUseProgram,
+    glVertexAttribPointer,
+)
+
+from .shaders import link_program
+
+# Mesmo brilho do laço antigo: clamp(intensidade * (0.5 + 0.5 sen(fase + 3t)), 0.1, 1)
+VERTEX_SHADER = """
+#version 120
+attribute vec3 a_position;
+attribute float a_phase;
+attribute float a_intensity;
+uniform float u_twinkle;
+varying vec4 v_color;
+void main() {
+    float c = clamp(a_intensity * (0.5 + 0.5 * sin(a_phase + u_twinkle)), 0.1, 1.0);
+    v_color = vec4(c, c, c, 1.0);
+    gl_Position = gl_ModelViewProjectionMatrix * vec4(a_position, 1.0);
+}
+"""
+
+FRAGMENT_SHADER = """
+#version 120
+varying vec4 v_color;
+void main() {
+    gl_FragColor = v_color;
+}
+"""
+
+_ATTRIBUTES = (('a_position', 3), ('a_phase', 1), ('a_intensity', 1))
+_STRIDE = 5 * 4
+
+
+def twinkle_angle(t: float) -> float:
+    """Time term of the twinkle, wrapped to one period so it survives float32."""
+    return (t * 3.0) % (2.0 * math.pi)
+
+
+class Starfield:
+    """Static point cloud of ``(x, y, z, intensity)`` stars drawn in one call.
+
+    Positions, phases and intensities are uploaded once; per frame only
+    the twinkle angle uniform changes, so the cost no longer depends on
+    the number of stars.
+    """
+
+    def __init__(self) -> None:
+        self.program = None
+        self.vbo = None
+        self.count = 0
+        self.twinkle_location = -1
+
+    def initialize(self, stars: Sequence[Tuple[float, float, float, float]]) -> None:
+        """Compile the shader and upload ``stars``; raises ShaderError."""
+        if self.program is None:
+            self.program = link_program(VERTEX_SHADER, FRAGMENT_SHADER, [name for name, _ in _ATTRIBUTES])
+            self.twinkle_location = glGetUniformLocation(self.program, 'u_twinkle')
+            self.vbo = glGenBuffers(1)
+        data = np.zeros((len(stars), 5), dtype=np.float32)
+        if len(stars):
+            columns = np.asarray(stars, dtype=np.float64)
+            data[:, 0:3] = columns[:, 0:3]
+            data[:, 3] = (columns[:, 0] + columns[:, 1] + columns[:, 2]) * 0.01
+            data[:, 4] = columns[:, 3]
+        glBindBuffer(GL_ARRAY_BUFFER, self.vbo)
+        glBufferData(GL_ARRAY_BUFFER, data, GL_STATIC_DRAW)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+        self.count = len(stars)
+
+    def draw(self, t: float, limit: Optional[int] = None) -> None:
+        """Draw the stars (only the first ``limit`` of them, if given) twinkling at time ``t``."""
+        count = self.count if limit is None else min(limit, self.count)
+        if not count:
+            return
+        glUseProgram(self.program)
+        glUniform1f(self.twinkle_location, twinkle_angle(t))
+        glBindBuffer(GL_ARRAY_BUFFER, self.vbo)
+        offset = 0
+        for index, (_, size) in enumerate(_ATTRIBUTES):
+            glEnableVertexAttribArray(index)
+            glVertexAttribPointer(index, size, GL_FLOAT, False, _STRIDE, ctypes.c_void_p(offset))
+            offset += size * 4
+        glDrawArrays(GL_POINTS, 0, count)
+        for index in range(len(_ATTRIBUTES)):
+            glDisableVertexAttribArray(index)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+        glUseProgram(0)
@@ -0,0 +1,72 @@
+"""Wall-clock report of the startup phases, from process start to the first frame."""
+
+from __future__ import annotations
+
+import os
+import sys
+import time
+from contextlib import contextmanager
+from typing import Iterator, List, Optional, TextIO, Tuple
+
+
+def process_age() -> Optional[float]:
+    """Seconds since the OS started this process (Linux ``/proc``; None elsewhere)."""
+    try:
+        with open('/proc/self/stat', 'r', encoding='ascii') as fh:
+            # O nome do executável pode ter espaços: contar campos depois do ')'
+            start_ticks = int(fh.read().rsplit(')', 1)[1].split()[19])
+        with open('/proc/uptime', 'r', encoding='ascii') as fh:
+            uptime = float(fh.read().split()[0])
+        return max(0.0, uptime - start_ticks / os.sysconf('SC_CLK_TCK'))
+    except Exception:
+        return None
+
+
+class StartupReport:
+    """Nested, timed startup phases, printed once the first frame is on screen.
+
+    ``origin`` is a ``time.perf_counter()`` reading taken as early as
+    possible (the top of ``game.py``); the time the interpreter spent
+    before that comes from :func:`process_age` where the OS exposes it.
+    """
+
+    def __init__(self, origin: Optional[float] = None) -> None:
+        now = time.perf_counter()
+        self.origin = now if origin is None else origin
+        age = process_age()
+        # Antes da origem: carregar o interpretador e o site
+        self.interpreter = None if age is None else max(0.0, age - (now - self.origin))
+        self.phases: List[Tuple[int, str, float, float]] = []  # (profundidade, nome, início, duração)
+        self._depth = 0
+        self.done = False
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        index = len(self.phases)
+        start = time.perf_counter()
+        self.phases.append((self._depth, name, start - self.origin, 0.0))
+        self._depth += 1
+        try:
+            yield
+        finally:
+            self._depth -= 1
+            self.phases[index] = (self._depth, name, start - self.origin, time.perf_counter() - start)
+
+    def first_frame(self, out: TextIO = sys.stderr) -> None:
+        """Close the report at the first presented frame and print it (only the first call counts)."""
+        if self.done:
+            return
+        self.done = True
+        total = time.perf_counter() - self.origin
+        out.write(self.format(total))
+        out.flush()
+
+    def format(self, total: float) -> str:
+        lines = [f"{'at ms':>9} {'took ms':>9}  phase"]
+        if self.interpreter is not None:
+            lines.append(f"{-self.interpreter * 1e3:9.1f} {self.interpreter * 1e3:9.1f}  python startup")
+        for depth, name, start, duration in self.phases:
+            lines.append(f"{start * 1e3:9.1f} {duration * 1e3:9.1f}  {'  ' * depth}{name}")
+        first = total + (self.interpreter or 0.0)
+        lines.append(f"{total * 1e3:9.1f} {'':9}  first frame ({first * 1e3:.1f} ms after process start)")
+        return '\n'.join(lines) + '\n'
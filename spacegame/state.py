@@ -2,10 +2,15 @@
 
 from __future__ import annotations
 
+import random
 from dataclasses import dataclass, field
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
 from .constants import COLS, SCREEN_W, SCREEN_H, STATE_MENU
+from .entities import EntityStore
+from .particles import ParticleRing
+from .pools import SlotPool
+from .spatial import LaneIndex
 
 
 Vec3 = Tuple[float, float, float]
@@ -36,6 +41,15 @@ class CameraState:
     z: float = 12.0
 
 
+@dataclass
+class PreviousStep:
+    """Values from the previous simulation step, blended with the current ones when rendering."""
+    player_x: float = COLS / 2
+    camera_x: float = COLS / 2
+    camera_y: float = 3.0
+    camera_z: float = 12.0
+
+
 @dataclass
 class MenuState:
     items: Tuple[str, ...] = ("Iniciar jogo", "Modo: {}", "Dificuldade: {}", "Leaderboard", "Sair")
@@ -60,9 +74,44 @@ class LeaderboardState:
 
 @dataclass
 class GameObjects:
-    stars: List[list] = field(default_factory=list)
-    shots: List[List[float]] = field(default_factory=list)
-    explosions: List[list] = field(default_factory=list)
+    stars: EntityStore = field(default_factory=EntityStore)
+    lane_index: LaneIndex = field(default_factory=LaneIndex)
+    # tiro: [x, y, z, z do passo anterior]
+    shots: SlotPool = field(default_factory=lambda: SlotPool(4, 32))
+    explosions: ParticleRing = field(default_factory=ParticleRing)
+
+    def end_frame(self) -> dict:
+        """Close the frame's pool counters; returns {pool: (allocations, reuses)}."""
+        return {
+            'stars': self.stars.counter.end_frame(),
+            'shots': self.shots.counter.end_frame(),
+            'explosions': self.explosions.counter.end_frame(),
+        }
+
+
+@dataclass
+class RandomStreams:
+    """One generator per subsystem, all derived from a single session seed.
+
+    Streams are seeded independently, so drawing more cosmetic numbers (or
+    fewer pickups) never shifts what the spawner produces for the same seed.
+    """
+    seed: Optional[int] = None
+    spawn: random.Random = field(default_factory=random.Random)
+    pickups: random.Random = field(default_factory=random.Random)
+    cosmetic: random.Random = field(default_factory=random.Random)
+
+    def __post_init__(self) -> None:
+        self.reseed(self.seed)
+
+    def reseed(self, seed: Optional[int] = None) -> None:
+        if seed is None:
+            seed = random.SystemRandom().getrandbits(32)
+        self.seed = seed
+        # Sementes em str passam por SHA-512: estáveis entre execuções e versões do Python
+        self.spawn.seed(f"{seed}:spawn")
+        self.pickups.seed(f"{seed}:pickups")
+        self.cosmetic.seed(f"{seed}:cosmetic")
 
 
 @dataclass
@@ -76,10 +125,12 @@ class GameState:
     player: PlayerState = field(default_factory=PlayerState)
     effects: EffectsState = field(default_factory=EffectsState)
     camera: CameraState = field(default_factory=CameraState)
+    previous: PreviousStep = field(default_factory=PreviousStep)
     menu: MenuState = field(default_factory=MenuState)
     leaderboard: LeaderboardState = field(default_factory=LeaderboardState)
     objects: GameObjects = field(default_factory=GameObjects)
     window: WindowState = field(default_factory=WindowState)
+    rng: RandomStreams = field(default_factory=RandomStreams)
     score: int = 0
     time_alive: float = 0.0
     spawn_timer: float = 0.0
@@ -89,7 +140,9 @@ class GameState:
     missed_stars: int = 0  # p/ modo coletor
     capturing_name: bool = False 
 
-    def reset(self) -> None:
+    def reset(self, seed: Optional[int] = None) -> None:
+        """Start a new session; ``seed`` None draws a fresh session seed."""
+        self.rng.reseed(seed)
         self.objects.stars.clear()
         self.objects.shots.clear()
         self.objects.explosions.clear()
@@ -0,0 +1,236 @@
+"""Bitmap-free text: a glyph atlas texture plus cached per-string quad meshes."""
+
+from __future__ import annotations
+
+import ctypes
+import importlib.util
+import os
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+from OpenGL.GL import (
+    GL_ALPHA,
+    GL_ARRAY_BUFFER,
+    GL_BLEND,
+    GL_COLOR_BUFFER_BIT,
+    GL_CURRENT_BIT,
+    GL_ENABLE_BIT,
+    GL_FLOAT,
+    GL_LIGHTING,
+    GL_LINEAR,
+    GL_ONE_MINUS_SRC_ALPHA,
+    GL_SRC_ALPHA,
+    GL_STATIC_DRAW,
+    GL_TEXTURE_2D,
+    GL_TEXTURE_BIT,
+    GL_TEXTURE_COORD_ARRAY,
+    GL_TEXTURE_MAG_FILTER,
+    GL_TEXTURE_MIN_FILTER,
+    GL_TRIANGLES,
+    GL_UNPACK_ALIGNMENT,
+    GL_UNSIGNED_BYTE,
+    GL_VERTEX_ARRAY,
+    glBindBuffer,
+    glBindTexture,
+    glBlendFunc,
+    glBufferData,
+    glColor4f,
+    glDeleteBuffers,
+    glDeleteTextures,
+    glDisable,
+    glDisableClientState,
+    glDrawArrays,
+    glEnable,
+    glEnableClientState,
+    glGenBuffers,
+    glGenTextures,
+    glPixelStorei,
+    glPopAttrib,
+    glPopMatrix,
+    glPushAttrib,
+    glPushMatrix,
+    glTexCoordPointer,
+    glTexImage2D,
+    glTexParameteri,
+    glTranslatef,
+    glVertexPointer,
+)
+from PIL import Image, ImageDraw, ImageFont
+
+DEFAULT_FONT = None  # freesansbold.ttf, que acompanha o pygame
+DEFAULT_SIZE = 18
+# Latin-1 cobre os acentos dos textos em português
+FIRST_CHAR, LAST_CHAR = 32, 255
+FALLBACK_CHAR = '?'
+TEXT_CACHE_SIZE = 256
+
+# x, y, u, v por vértice
+_STRIDE = 4 * 4
+
+
+def _load_font(font: Optional[str], size: int) -> ImageFont.ImageFont:
+    if font is None:
+        # Localizar sem importar o pygame; a fonte embutida do Pillow não tem acentos
+        spec = importlib.util.find_spec('pygame')
+        for folder in (spec.submodule_search_locations or []) if spec else []:
+            path = os.path.join(folder, 'freesansbold.ttf')
+            if os.path.exists(path):
+                return ImageFont.truetype(path, size)
+        return ImageFont.load_default(size)
+    return ImageFont.truetype(font, size)
+
+
+class GlyphAtlas:
+    """Every Latin-1 glyph of one font and size rasterised into a single alpha texture.
+
+    ``boxes`` holds, per character code, the glyph quad relative to the pen
+    position on the baseline (left, top, right, bottom, in pixels with y
+    down), its texture coordinates, and the pen advance.
+    """
+
+    def __init__(self, font: Optional[str] = DEFAULT_FONT, size: int = DEFAULT_SIZE) -> None:
+        face = _load_font(font, size)
+        chars = [chr(code) for code in range(FIRST_CHAR, LAST_CHAR + 1)]
+        boxes = [face.getbbox(ch, anchor='ls') for ch in chars]
+        cell_w = max(r - l for l, _, r, _ in boxes) + 2
+        cell_h = max(b - t for _, t, _, b in boxes) + 2
+        columns = 16
+        rows = -(-len(chars) // columns)
+        width, height = _next_pow2(columns * cell_w), _next_pow2(rows * cell_h)
+        image = Image.new('L', (width, height), 0)
+        draw = ImageDraw.Draw(image)
+        # (esquerda, topo, direita, base, u0, v0, u1, v1, avanço) por código
+        self.boxes = np.zeros((LAST_CHAR + 1, 9), dtype=np.float32)
+        for i, (ch, (l, t, r, b)) in enumerate(zip(chars, boxes)):
+            cx, cy = (i % columns) * cell_w + 1, (i // columns) * cell_h + 1
+            draw.text((cx - l, cy - t), ch, font=face, fill=255, anchor='ls')
+            self.boxes[ord(ch)] = (l, t, r, b, cx / width, cy / height,
+                                   (cx + r - l) / width, (cy + b - t) / height, face.getlength(ch))
+        self.size = (width, height)
+        self.pixels = image.tobytes()
+        self.texture = None
+
+    def upload(self) -> None:
+        self.texture = glGenTextures(1)
+        glBindTexture(GL_TEXTURE_2D, self.texture)
+        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_LINEAR)
+        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_LINEAR)
+        glPixelStorei(GL_UNPACK_ALIGNMENT, 1)
+        glTexImage2D(GL_TEXTURE_2D, 0, GL_ALPHA, self.size[0], self.size[1], 0,
+                     GL_ALPHA, GL_UNSIGNED_BYTE, self.pixels)
+        glPixelStorei(GL_UNPACK_ALIGNMENT, 4)
+
+    def layout(self, text: str) -> np.ndarray:
+        """Triangle vertices (x, y, u, v) for ``text`` with the pen starting at the origin."""
+        codes = np.array([ord(ch) for ch in text], dtype=np.int64)
+        codes[(codes < FIRST_CHAR) | (codes > LAST_CHAR)] = ord(FALLBACK_CHAR)
+        glyphs = self.boxes[codes]
+        pen = np.concatenate(([0.0], np.cumsum(glyphs[:, 8])[:-1]))
+        left, top, right, bottom = (glyphs[:, 0] + pen, glyphs[:, 1], glyphs[:, 2] + pen, glyphs[:, 3])
+        u0, v0, u1, v1 = glyphs[:, 4], glyphs[:, 5], glyphs[:, 6], glyphs[:, 7]
+        corners = [(left, top, u0, v0), (right, top, u1, v0), (right, bottom, u1, v1),
+                   (left, top, u0, v0), (right, bottom, u1, v1), (left, bottom, u0, v1)]
+        quads = np.stack([np.stack(c, axis=1) for c in corners], axis=1)
+        return quads.reshape(-1, 4).astype(np.float32)
+
+
+class TextRenderer:
+    """Draws strings in an orthographic, y-down 2D pass with one call per string.
+
+    Each (text, font, size) gets a quad mesh in its own VBO, kept in an
+    LRU cache of ``capacity`` strings, so labels that do not change from
+    frame to frame are never laid out again. ``(x, y)`` is the start of
+    the baseline, as ``glRasterPos2f`` was for the GLUT bitmap fonts.
+    """
+
+    def __init__(self, capacity: int = TEXT_CACHE_SIZE) -> None:
+        self.capacity = capacity
+        self.atlases: Dict[Tuple[Optional[str], int], GlyphAtlas] = {}
+        self.building: Dict[Tuple[Optional[str], int], Future] = {}  # atlas rasterizando em outra thread
+        self.meshes: OrderedDict = OrderedDict()  # (texto, fonte, tamanho) -> (vbo, vértices)
+        self.hits = 0
+        self.misses = 0
+
+    def draw(self, text: str, x: float, y: float, color=(1.0, 1.0, 1.0),
+             font: Optional[str] = DEFAULT_FONT, size: int = DEFAULT_SIZE) -> None:
+        if not text:
+            return
+        # Tudo dentro do push: o upload do atlas também troca a textura ligada
+        glPushAttrib(GL_ENABLE_BIT | GL_COLOR_BUFFER_BIT | GL_TEXTURE_BIT | GL_CURRENT_BIT)
+        atlas = self._atlas(font, size)
+        vbo, count = self._mesh(text, font, size, atlas)
+        glDisable(GL_LIGHTING)
+        glEnable(GL_TEXTURE_2D)
+        glEnable(GL_BLEND)
+        glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
+        glBindTexture(GL_TEXTURE_2D, atlas.texture)
+        glColor4f(*(tuple(color) + (1.0,))[:4])
+        glPushMatrix()
+        glTranslatef(x, y, 0)
+        glBindBuffer(GL_ARRAY_BUFFER, vbo)
+        glEnableClientState(GL_VERTEX_ARRAY)
+        glEnableClientState(GL_TEXTURE_COORD_ARRAY)
+        glVertexPointer(2, GL_FLOAT, _STRIDE, ctypes.c_void_p(0))
+        glTexCoordPointer(2, GL_FLOAT, _STRIDE, ctypes.c_void_p(8))
+        glDrawArrays(GL_TRIANGLES, 0, count)
+        glDisableClientState(GL_TEXTURE_COORD_ARRAY)
+        glDisableClientState(GL_VERTEX_ARRAY)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+        glPopMatrix()
+        glPopAttrib()
+
+    def preload(self, font: Optional[str] = DEFAULT_FONT, size: int = DEFAULT_SIZE) -> None:
+        """Rasterise an atlas on a worker thread now; the first ``draw`` only uploads it."""
+        key = (font, size)
+        if key in self.atlases or key in self.building:
+            return
+        executor = ThreadPoolExecutor(1, thread_name_prefix='glyph-atlas')
+        self.building[key] = executor.submit(GlyphAtlas, font, size)
+        executor.shutdown(wait=False)
+
+    def clear(self) -> None:
+        for vbo, _ in self.meshes.values():
+            glDeleteBuffers(1, [vbo])
+        self.meshes.clear()
+        for atlas in self.atlases.values():
+            if atlas.texture is not None:
+                glDeleteTextures([atlas.texture])
+        self.atlases.clear()
+
+    def _atlas(self, font: Optional[str], size: int) -> GlyphAtlas:
+        atlas = self.atlases.get((font, size))
+        if atlas is None:
+            pending = self.building.pop((font, size), None)
+            atlas = pending.result() if pending is not None else GlyphAtlas(font, size)
+            self.atlases[(font, size)] = atlas
+        if atlas.texture is None:
+            atlas.upload()
+        return atlas
+
+    def _mesh(self, text: str, font: Optional[str], size: int, atlas: GlyphAtlas) -> Tuple[int, int]:
+        key = (text, font, size)
+        mesh = self.meshes.get(key)
+        if mesh is not None:
+            self.meshes.move_to_end(key)
+            self.hits += 1
+            return mesh
+        self.misses += 1
+        vertices = atlas.layout(text)
+        vbo = glGenBuffers(1)
+        glBindBuffer(GL_ARRAY_BUFFER, vbo)
+        glBufferData(GL_ARRAY_BUFFER, vertices, GL_STATIC_DRAW)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+        mesh = self.meshes[key] = (vbo, len(vertices))
+        while len(self.meshes) > self.capacity:
+            (old_vbo, _) = self.meshes.popitem(last=False)[1]
+            glDeleteBuffers(1, [old_vbo])
+        return mesh
+
+
+def _next_pow2(n: int) -> int:
+    size = 1
+    while size < n:
+        size *= 2
+    return size
@@ -0,0 +1,291 @@
+"""Texture loading: a threaded decode (with an on-disk pixel cache), a main-thread upload and a budgeted GL cache."""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import struct
+import tempfile
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+# Cabeçalho do cache: assinatura, largura, altura; depois os pixels RGBA crus
+_MAGIC = b'SGRGBA01'
+_HEADER = struct.Struct('<8sII')
+TEXTURE_WORKERS = 4
+# Teto estimado de memória de vídeo das texturas (GPUs integradas dividem a RAM)
+TEXTURE_BUDGET_BYTES = 64 * 1024 * 1024
+
+
+class DecodedImage(NamedTuple):
+    width: int
+    height: int
+    pixels: np.ndarray  # (altura, largura, 4) uint8, linha de baixo primeiro, como o GL espera
+
+
+def default_cache_dir(kind: str = 'textures') -> str:
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'spacegame', kind)
+
+
+def cache_path(path: str, cache_dir: str) -> str:
+    """Cache file for ``path``; it changes whenever the file is edited or replaced."""
+    info = os.stat(path)
+    key = f"{os.path.abspath(path)}|{info.st_mtime_ns}|{info.st_size}"
+    return os.path.join(cache_dir, hashlib.sha1(key.encode('utf-8')).hexdigest() + '.rgba')
+
+
+def decode_image(path: str, cache_dir: Optional[str] = None) -> DecodedImage:
+    """RGBA pixels of the image at ``path``, memory-mapped from the cache when it has them.
+
+    A miss decodes with PIL and writes the cache; a cache that cannot be
+    read or written (read-only disk, truncated file) is skipped, never fatal.
+    """
+    cached = cache_path(path, cache_dir) if cache_dir else None
+    if cached and os.path.exists(cached):
+        try:
+            return _read_cached(cached)
+        except Exception:
+            pass
+    from PIL import Image
+
+    with Image.open(path) as img:
+        rgba = img.transpose(Image.FLIP_TOP_BOTTOM).convert('RGBA')
+    pixels = np.asarray(rgba, dtype=np.uint8)
+    decoded = DecodedImage(rgba.width, rgba.height, pixels)
+    if cached:
+        try:
+            _write_cached(cached, decoded)
+        except Exception:
+            pass
+    return decoded
+
+
+def _read_cached(cached: str) -> DecodedImage:
+    with open(cached, 'rb') as fh:
+        magic, width, height = _HEADER.unpack(fh.read(_HEADER.size))
+    if magic != _MAGIC or os.path.getsize(cached) != _HEADER.size + width * height * 4:
+        raise ValueError(f"bad texture cache file {cached}")
+    pixels = np.memmap(cached, dtype=np.uint8, mode='r', offset=_HEADER.size, shape=(height, width, 4))
+    return DecodedImage(width, height, pixels)
+
+
+def _write_cached(cached: str, decoded: DecodedImage) -> None:
+    folder = os.path.dirname(cached)
+    os.makedirs(folder, exist_ok=True)
+    # Escrever ao lado e renomear: outro processo nunca lê um arquivo pela metade
+    fd, tmp = tempfile.mkstemp(dir=folder, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as fh:
+            fh.write(_HEADER.pack(_MAGIC, decoded.width, decoded.height))
+            fh.write(np.ascontiguousarray(decoded.pixels).tobytes())
+        os.replace(tmp, cached)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def upload_texture(decoded: DecodedImage) -> int:
+    """Create a repeating, mipmapped GL texture from ``decoded`` (needs a current context)."""
+    from OpenGL.GL import (GL_LINEAR, GL_LINEAR_MIPMAP_LINEAR, GL_REPEAT, GL_RGBA, GL_TEXTURE_2D,
+                           GL_TEXTURE_MAG_FILTER, GL_TEXTURE_MIN_FILTER, GL_TEXTURE_WRAP_S, GL_TEXTURE_WRAP_T,
+                           GL_UNSIGNED_BYTE, glBindTexture, glGenerateMipmap, glGenTextures, glTexImage2D,
+                           glTexParameteri)
+
+    tex = glGenTextures(1)
+    glBindTexture(GL_TEXTURE_2D, tex)
+    glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_S, GL_REPEAT)
+    glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_T, GL_REPEAT)
+    glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_LINEAR)
+    glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_LINEAR_MIPMAP_LINEAR)
+    glTexImage2D(GL_TEXTURE_2D, 0, GL_RGBA, decoded.width, decoded.height, 0, GL_RGBA, GL_UNSIGNED_BYTE,
+                 np.ascontiguousarray(decoded.pixels))
+    try:
+        glGenerateMipmap(GL_TEXTURE_2D)
+    except Exception:
+        pass
+    return tex
+
+
+def texture_bytes(width: int, height: int) -> int:
+    """Estimated video memory of an RGBA8 texture with a full mipmap chain (+1/3)."""
+    return width * height * 4 * 4 // 3
+
+
+class TextureStats(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    resident_bytes: int
+    budget_bytes: int
+    textures: int  # residentes
+    referenced: int  # residentes com referências
+
+
+class _Entry:
+    __slots__ = ('texture', 'nbytes', 'refs')
+
+    def __init__(self, texture: int, nbytes: int) -> None:
+        self.texture = texture
+        self.nbytes = nbytes
+        self.refs = 0
+
+
+class TextureCache:
+    """GL textures by path, reference counted and kept under a video-memory budget.
+
+    :meth:`acquire` hands out a texture and takes a reference;
+    :meth:`release` gives it back. A texture nobody references stays
+    resident for reuse until the estimated total goes over
+    ``budget_bytes``, then the least recently used ones are deleted.
+    Referenced textures are never evicted, so the budget can be exceeded
+    while everything resident is in use. All methods except :meth:`stats`
+    need the GL context current.
+    """
+
+    def __init__(self, budget_bytes: int = TEXTURE_BUDGET_BYTES, cache_dir: Optional[str] = None) -> None:
+        self.budget_bytes = budget_bytes
+        self.cache_dir = default_cache_dir() if cache_dir is None else cache_dir
+        self.entries: OrderedDict = OrderedDict()  # caminho -> _Entry, do menos para o mais recente
+        self.resident_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __contains__(self, path: str) -> bool:
+        return path in self.entries
+
+    def acquire(self, path: str, decoded: Optional[DecodedImage] = None) -> int:
+        """Texture for ``path`` with one more reference; uploads ``decoded`` (or decodes now) on a miss."""
+        entry = self.entries.get(path)
+        if entry is not None:
+            self.hits += 1
+            self.entries.move_to_end(path)
+        else:
+            self.misses += 1
+            if decoded is None:
+                decoded = decode_image(path, self.cache_dir or None)
+            entry = _Entry(upload_texture(decoded), texture_bytes(decoded.width, decoded.height))
+            self.entries[path] = entry
+            self.resident_bytes += entry.nbytes
+        entry.refs += 1
+        self._evict()
+        return entry.texture
+
+    def release(self, path: str) -> None:
+        """Drop one reference; the texture becomes evictable when none are left."""
+        entry = self.entries.get(path)
+        if entry is None or entry.refs == 0:
+            return
+        entry.refs -= 1
+        if entry.refs == 0:
+            self._evict()
+
+    def set_budget(self, budget_bytes: int) -> None:
+        self.budget_bytes = budget_bytes
+        self._evict()
+
+    def stats(self) -> TextureStats:
+        referenced = sum(1 for entry in self.entries.values() if entry.refs)
+        return TextureStats(self.hits, self.misses, self.evictions, self.resident_bytes, self.budget_bytes,
+                            len(self.entries), referenced)
+
+    def clear(self) -> None:
+        """Delete every texture, referenced or not (e.g. before the context goes away)."""
+        _delete_textures([entry.texture for entry in self.entries.values()])
+        self.entries.clear()
+        self.resident_bytes = 0
+
+    def _evict(self) -> None:
+        if self.resident_bytes <= self.budget_bytes:
+            return
+        victims = []
+        for path, entry in self.entries.items():
+            if self.resident_bytes <= self.budget_bytes:
+                break
+            if entry.refs == 0:
+                victims.append(path)
+                self.resident_bytes -= entry.nbytes
+        _delete_textures([self.entries.pop(path).texture for path in victims])
+        self.evictions += len(victims)
+
+
+def _delete_textures(textures: List[int]) -> None:
+    if not textures:
+        return
+    from OpenGL.GL import glDeleteTextures
+
+    try:
+        glDeleteTextures(textures)
+    except Exception:
+        pass
+
+
+# Cache único do processo: o TextureLoader e o assets.load_texture dividem o mesmo orçamento
+shared_cache = TextureCache()
+
+
+class TextureLoader:
+    """Decodes images on a thread pool and uploads them on the thread that owns the GL context.
+
+    :meth:`request` returns at once; call :meth:`upload_ready` once per
+    frame from the render thread to turn finished decodes into textures
+    and hand each id to its callback. A decode that fails (missing or
+    unreadable file) is dropped and its callback is never called.
+    Textures go through ``cache`` (the shared one by default): each
+    delivered id holds a reference, to be given back with
+    ``cache.release(path)``, and a path already resident is handed over
+    at once without decoding it again.
+    """
+
+    def __init__(self, cache: Optional[TextureCache] = None, workers: int = TEXTURE_WORKERS) -> None:
+        self.cache = shared_cache if cache is None else cache
+        self.workers = workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self.pending: List[Tuple[str, Future, Callable[[int], None]]] = []
+
+    @property
+    def cache_dir(self) -> str:
+        return self.cache.cache_dir
+
+    def request(self, path: str, on_ready: Callable[[int], None]) -> Optional[Future]:
+        """Start loading ``path``; returns the decode future, or None when it was already resident."""
+        if path in self.cache:
+            on_ready(self.cache.acquire(path))
+            return None
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(self.workers, thread_name_prefix='texture-decode')
+        future = self._executor.submit(decode_image, path, self.cache_dir or None)
+        self.pending.append((path, future, on_ready))
+        return future
+
+    def upload_ready(self) -> int:
+        """Upload every decode that has finished; returns how many textures were created."""
+        if not self.pending:
+            return 0
+        uploaded = 0
+        waiting = []
+        for path, future, on_ready in self.pending:
+            if not future.done():
+                waiting.append((path, future, on_ready))
+                continue
+            if future.exception() is None:
+                on_ready(self.cache.acquire(path, future.result()))
+                uploaded += 1
+        self.pending = waiting
+        return uploaded
+
+    def finish(self) -> int:
+        """Wait for every pending decode, then upload them all."""
+        for _, future, _ in self.pending:
+            future.exception()
+        return self.upload_ready()
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+        self.pending.clear()